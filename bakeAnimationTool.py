@@ -8,16 +8,33 @@
 # 2. Sampling Rate: Set how often keyframes are created.
 # 3. Shape Nodes: Option to bake shape node attributes.
 # 4. Channel Box Support: Bake selected attributes or all by default.
+# 5. Chunked Baking: Bake long ranges a chunk of frames at a time, with progress and cancel,
+#    when simulation is off.
+# 6. Parallel Baking: Bake independent rigs at the same time in batch mayapy processes.
+# 7. Key Reduction: Remove baked keys that are within a tolerance of the kept ones.
+# 8. Bake Cache: Apply stored keys to rigs that did not change since their last bake.
+#
+# The baking itself is done by bakeEngine/bakeEngine.py, which also works without this UI.
+# Importing this module has no side effects, call run() or mayaUtils.bakeAnimationTool()
+# to open the window. For batch and farm bakes use the command line runner
+# bakeEngine/bakeCli.py.
+# Place the 'bakeEngine' folder in your Maya scripts directory next to this script.
 #
 # Author: Sandesh Chakradhar
 # GitHub: https://github.com/svndes
 # Contact: svndes@gmail.com
 
+import os
+
 import maya.cmds as cmds
 from PySide2.QtWidgets import *
 from PySide2.QtCore import Qt
-from maya import OpenMayaUI as omui
-from shiboken2 import wrapInstance
+
+from bakeEngine import bakeCache
+from bakeEngine import bakeEngine
+from bakeEngine import bakeProfile
+from bakeEngine import bakeParallel
+from bakeEngine import keyReduction
 
 
 class BakeAnimationToolUI(QWidget):
@@ -25,7 +42,7 @@ class BakeAnimationToolUI(QWidget):
         super(BakeAnimationToolUI, self).__init__(parent=parent)
         self.setWindowFlags(Qt.Window)
         self.setWindowTitle("Bake Animation Tool")
-        self.setFixedSize(440, 260)
+        self.setFixedSize(440, 375)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -58,6 +75,30 @@ class BakeAnimationToolUI(QWidget):
         self.sampleLineEdit.setFixedWidth(80)
         sampleLayout.addWidget(self.sampleLineEdit)
 
+        chunkLayout = QHBoxLayout()
+        layout.addLayout(chunkLayout)
+        chunkLabel = QLabel("Chunk Size (0 = whole range, no simulation)")
+        chunkLayout.addWidget(chunkLabel)
+        self.chunkLineEdit = QLineEdit("0")
+        self.chunkLineEdit.setFixedWidth(80)
+        chunkLayout.addWidget(self.chunkLineEdit)
+
+        reduceLayout = QHBoxLayout()
+        layout.addLayout(reduceLayout)
+        reduceLabel = QLabel("Reduce Keys Tolerance (0 = off)")
+        reduceLayout.addWidget(reduceLabel)
+        self.reduceLineEdit = QLineEdit("0")
+        self.reduceLineEdit.setFixedWidth(80)
+        reduceLayout.addWidget(self.reduceLineEdit)
+
+        simulationLayout = QHBoxLayout()
+        layout.addLayout(simulationLayout)
+        simulationLabel = QLabel("Simulation (bakes the whole range at once)")
+        simulationLayout.addWidget(simulationLabel)
+        self.simulationCheckbox = QCheckBox()
+        self.simulationCheckbox.setChecked(True)
+        simulationLayout.addWidget(self.simulationCheckbox)
+
         includeShapesLayout = QHBoxLayout()
         layout.addLayout(includeShapesLayout)
         includeShapesLabel = QLabel("Include Shape Nodes")
@@ -65,6 +106,20 @@ class BakeAnimationToolUI(QWidget):
         self.includeShapesCheckbox = QCheckBox()
         includeShapesLayout.addWidget(self.includeShapesCheckbox)
 
+        parallelLayout = QHBoxLayout()
+        layout.addLayout(parallelLayout)
+        parallelLabel = QLabel("Parallel Bake (independent rigs)")
+        parallelLayout.addWidget(parallelLabel)
+        self.parallelCheckbox = QCheckBox()
+        parallelLayout.addWidget(self.parallelCheckbox)
+
+        cacheLayout = QHBoxLayout()
+        layout.addLayout(cacheLayout)
+        cacheLabel = QLabel("Use Bake Cache (skip unchanged rigs)")
+        cacheLayout.addWidget(cacheLabel)
+        self.cacheCheckbox = QCheckBox()
+        cacheLayout.addWidget(self.cacheCheckbox)
+
         bakeButtonLayout = QHBoxLayout()
         layout.addLayout(bakeButtonLayout)
         self.bakeButton = QPushButton("Bake Animation")
@@ -109,6 +164,7 @@ class BakeAnimationToolUI(QWidget):
         endValue = float(self.endLineEdit.text())
         sampleValue = float(self.sampleLineEdit.text())
         includeShapes = self.includeShapesCheckbox.isChecked()
+        reduceValue = float(self.reduceLineEdit.text() or 0)
 
         selectedObjects = cmds.ls(selection=True)
         if not selectedObjects:
@@ -116,39 +172,74 @@ class BakeAnimationToolUI(QWidget):
             return
 
         channelBox = cmds.channelBox("mainChannelBox", q=True, sma=True)
-        cmds.refresh(suspend=True)
-
-        if channelBox:
-            cmds.bakeResults(
-                selectedObjects,
-                simulation=True,
-                t=(startValue, endValue),
-                sampleBy=sampleValue,
-                preserveOutsideKeys=True,
-                sparseAnimCurveBake=False,
-                removeBakedAttributeFromLayer=False,
-                bakeOnOverrideLayer=False,
-                minimizeRotation=True,
-                controlPoints=False,
-                shape=includeShapes,
-                at=channelBox
-            )
-        else:
-            cmds.bakeResults(
+        simulation = self.simulationCheckbox.isChecked()
+        if self.parallelCheckbox.isChecked():
+            bakeParallel.bakeParallel(
                 selectedObjects,
-                simulation=True,
-                t=(startValue, endValue),
+                startValue,
+                endValue,
                 sampleBy=sampleValue,
-                preserveOutsideKeys=True,
-                sparseAnimCurveBake=False,
-                removeBakedAttributeFromLayer=False,
-                bakeOnOverrideLayer=False,
-                minimizeRotation=True,
-                controlPoints=False,
-                shape=includeShapes
+                attributes=channelBox,
+                includeShapes=includeShapes,
+                simulation=simulation
             )
+            self.reduceKeys(selectedObjects, startValue, endValue, reduceValue, channelBox, includeShapes)
+            return
+
+        chunkValue = float(self.chunkLineEdit.text() or 0)
+        chunkCount = len(bakeEngine.chunkRanges(startValue, endValue, sampleValue, 0 if simulation else chunkValue))
 
-        cmds.refresh(suspend=False)
+        progressDialog = QProgressDialog("Baking animation...", "Cancel", 0, chunkCount, self)
+        progressDialog.setWindowModality(Qt.WindowModal)
+        progressDialog.setMinimumDuration(0)
+
+        def onProgress(index, count, chunkStart, chunkEnd, seconds):
+            progressDialog.setValue(index)
+            progressDialog.setLabelText("Baked frames {} - {} in {:.2f}s".format(chunkStart, chunkEnd, seconds))
+            QApplication.processEvents()
+
+        profile = bakeProfile.BakeProfile(scene=cmds.file(q=True, sceneName=True))
+        bakeArgs = dict(
+            sampleBy=sampleValue,
+            attributes=channelBox,
+            includeShapes=includeShapes,
+            simulation=simulation,
+            chunkSize=chunkValue,
+            progress=onProgress,
+            cancelled=progressDialog.wasCanceled,
+            profile=profile
+        )
+        try:
+            if self.cacheCheckbox.isChecked():
+                cache = bakeCache.BakeCache(os.path.join(cmds.internalVar(userAppDir=True), "bakeCache"))
+                report = bakeCache.bakeCached(cache, selectedObjects, startValue, endValue, **bakeArgs)
+                print("{} objects from the bake cache, {} baked in {:.2f}s".format(
+                    report["cached"], report["baked"], report["seconds"]))
+            else:
+                bakeEngine.bake(selectedObjects, startValue, endValue, **bakeArgs)
+        except bakeEngine.BakeCancelled as e:
+            cmds.warning(str(e))
+            return
+        finally:
+            progressDialog.close()
+        print(profile.summary())
+        self.reduceKeys(selectedObjects, startValue, endValue, reduceValue, channelBox, includeShapes)
+
+    def reduceKeys(self, selectedObjects, startValue, endValue, tolerance, channelBox, includeShapes):
+        """Reduce the baked keys if a tolerance is set, and report the result."""
+        if tolerance <= 0:
+            return
+        report = keyReduction.reduceBakedCurves(
+            selectedObjects,
+            startValue,
+            endValue,
+            tolerance,
+            attributes=channelBox,
+            includeShapes=includeShapes
+        )
+        removed = report["keysBefore"] - report["keysAfter"]
+        print("Reduced baked keys from {} to {} ({:.0%} removed) in {:.2f}s".format(
+            report["keysBefore"], report["keysAfter"], removed / max(report["keysBefore"], 1), report["seconds"]))
 
     def showAboutDialog(self):
         """Show the 'About' dialog."""
@@ -170,6 +261,20 @@ class BakeAnimationToolUI(QWidget):
             "     - Set the range for baking make sure to select Custom Frame Range.\n\n"
             "  Sample By:\n"
             "     - Decide how often to set keyframes during baking.\n\n"
+            "  Chunk Size:\n"
+            "     - Bake this many frames at a time, with progress and a Cancel button. 0 bakes the whole range at once.\n"
+            "       Chunks are only used with Simulation off.\n\n"
+            "  Simulation:\n"
+            "     - Evaluate the frames in order, for dynamics and expressions that depend on the previous frame.\n"
+            "       Such rigs can't start a bake in the middle of the range, so the whole range is baked at once.\n\n"
+            "  Parallel Bake:\n"
+            "     - Bake rigs that don't depend on each other at the same time, each in its own mayapy process.\n\n"
+            "  Reduce Keys Tolerance:\n"
+            "     - After baking, remove keys that are within this tolerance of a straight line between the kept keys.\n\n"
+            "  Use Bake Cache:\n"
+            "     - Objects whose animation and rig did not change since their last bake with the same range,\n"
+            "       sample rate and attributes get their stored keys instead of being baked again. Keys, tangents,\n"
+            "       infinity, keyable values, constraint offsets and the parents of constraint targets are checked.\n\n"
             "  Include Shape Nodes:\n"
             "     - Choose whether to bake attributes of shape nodes when you're baking everything.\n\n"
             "  Bake Animation:\n"
@@ -191,6 +296,9 @@ class BakeAnimationToolUI(QWidget):
 
 
 def run():
+    from maya import OpenMayaUI as omui
+    from shiboken2 import wrapInstance
+
     if QApplication.instance():
         for win in QApplication.allWindows():
             if "BakeAnimationToolWindow" in win.objectName():
@@ -203,4 +311,5 @@ def run():
     BakeAnimationToolUI.window.show()
 
 
-run()
+if __name__ == "__main__":
+    run()
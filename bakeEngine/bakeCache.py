@@ -0,0 +1,259 @@
+# Cache of baked keys, so re-baking unchanged rigs is a bulk key write instead of
+# a full simulation bake. Every node gets a signature: a hash of the frame range,
+# sampleBy, the attribute list, and of everything upstream of the node
+# (bakeEngine.getUpstreamNodes: its history, the DAG parents in it and their
+# history). Each upstream node adds its name and type, anim curves their keys,
+# tangent types and angles and pre/post infinity, other nodes the values of their
+# unconnected keyable attributes (constraint offsets included), so static edits
+# like a moved pivot group or a changed offset are seen. Nodes whose signature is
+# in the cache get their stored keys and tangent types through
+# bakeEngine.applyKeys, which writes them into the range of the existing curves
+# like a bake does. Only the others are baked, and their keys are stored for
+# next time.
+# Edits the signature can't see, e.g. to non-keyable attributes or to plug-in
+# node data, need invalidate() on the nodes, or clear() on the cache.
+#
+# Entries are one small binary file per node in the cache folder, so nodes are
+# invalidated on their own and parallel batch bakes can share a folder. Nodes are
+# found by UUID. Every copy of a referenced file has the same UUIDs, so
+# referenced nodes are found by UUID and full path.
+#     header   magic b'BKCH', version (uint16), signature (40 ascii hex chars), plug count (uint32)
+#     index    per plug: name length (uint16), utf-8 name, curve type length (uint8),
+#              curve type, key count (uint32), tangent run count (uint32), and per
+#              run of keys with the same tangent types: key count (uint32), in and
+#              out tangent type, each as length (uint8) and ascii name
+#     data     zlib compressed float64 times then values of every plug, back to back
+#
+# Usage:
+#     from bakeEngine import bakeCache
+#     cache = bakeCache.BakeCache('C:/path/to/bakeCache')
+#     bakeCache.bakeCached(cache, cmds.ls(selection=True), 1001, 1250, sampleBy=1.0)
+#     cache.invalidate(cmds.ls(selection=True))
+
+import hashlib
+import itertools
+import os
+import struct
+import time
+import zlib
+from array import array
+
+import maya.cmds as cmds
+
+from . import bakeEngine
+
+MAGIC = b'BKCH'
+VERSION = 3
+_headerStruct = struct.Struct('<4sH40sI')
+_nameStruct = struct.Struct('<H')
+_typeStruct = struct.Struct('<B')
+_countStruct = struct.Struct('<I')
+_countsStruct = struct.Struct('<II')
+
+
+_tangentFlags = ('inTangentType', 'outTangentType', 'inAngle', 'outAngle')
+
+
+def _nodeState(node, nodeType):
+    """Return what one upstream node adds to a signature."""
+    if nodeType.startswith('animCurve'):
+        state = [cmds.keyframe(node, q=True, timeChange=True), cmds.keyframe(node, q=True, valueChange=True)]
+        state += [cmds.keyTangent(node, q=True, **{flag: True}) for flag in _tangentFlags]
+        state += [cmds.getAttr(f"{node}.{attr}") for attr in ('preInfinity', 'postInfinity')]
+        return repr(state)
+    attributes = cmds.listAttr(node, keyable=True, scalar=True, multi=True) or []
+    if nodeType.endswith('Constraint'):
+        # Parent constraint offsets are not keyable
+        attributes += cmds.listAttr(node, string='*Offset*', scalar=True, multi=True) or []
+    pairs = cmds.listConnections(node, source=True, destination=False, connections=True, plugs=True) or []
+    # Connected values change with time, their inputs are part of the signature instead
+    connected = {plug.split('.', 1)[1] for plug in pairs[::2]}
+    return repr([(attr, cmds.getAttr(f"{node}.{attr}")) for attr in attributes if attr not in connected])
+
+
+def _tangentRuns(inTypes, outTypes):
+    """Return [(key count, inTangentType, outTangentType)] for the runs of keys with the same types."""
+    return [(len(list(keys)), inType, outType)
+            for (inType, outType), keys in itertools.groupby(zip(inTypes, outTypes))]
+
+
+def getSignature(node, start, end, sampleBy=1.0, attributes=None, includeShapes=False, simulation=True,
+                 states=None):
+    """Return a hash of everything the bake of node depends on that can be read cheaply.
+
+    states keeps the part of every upstream node between calls, pass the same
+    dict for all the nodes of one bake, so shared rig nodes are read once.
+    """
+    states = {} if states is None else states
+    nodes = [node]
+    if includeShapes:
+        nodes += cmds.listRelatives(node, shapes=True, fullPath=True) or []
+    digest = hashlib.sha1(repr((VERSION, float(start), float(end), float(sampleBy), sorted(attributes or []),
+                                includeShapes, simulation)).encode('utf-8'))
+    upstream = cmds.ls(bakeEngine.getUpstreamNodes(nodes), showType=True, long=True) or []
+    for name, nodeType in zip(upstream[::2], upstream[1::2]):
+        if name not in states:
+            states[name] = _nodeState(name, nodeType)
+        digest.update(f"{name} {nodeType} {states[name]}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def getCacheKeys(nodes):
+    """Return the cache key of every node, its UUID, followed by its full path for referenced nodes."""
+    keys = []
+    for node in nodes:
+        key = cmds.ls(node, uuid=True)[0]
+        if cmds.referenceQuery(node, isNodeReferenced=True):
+            key += cmds.ls(node, long=True)[0]
+        keys.append(key)
+    return keys
+
+
+class BakeCache(object):
+    """Baked keys per node key (see getCacheKeys) and signature, one file per node in folderPath."""
+
+    def __init__(self, folderPath):
+        self.folderPath = folderPath
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.folderPath, hashlib.sha1(key.encode('utf-8')).hexdigest()[:24] + ".bkc")
+
+    def get(self, key, signature):
+        """Return {plug: (curveType, times, values, inTangentTypes, outTangentTypes)}, None when missing or stale."""
+        filePath = self._path(key)
+        try:
+            with open(filePath, 'rb') as cacheFile:
+                data = cacheFile.read()
+            magic, version, storedSignature, plugCount = _headerStruct.unpack_from(data)
+            if magic != MAGIC or version != VERSION or storedSignature.decode('ascii') != signature:
+                self.misses += 1
+                return None
+            offset = _headerStruct.size
+            plugs = []
+            for _ in range(plugCount):
+                nameLength, = _nameStruct.unpack_from(data, offset)
+                offset += _nameStruct.size
+                name = data[offset:offset + nameLength].decode('utf-8')
+                offset += nameLength
+                typeLength, = _typeStruct.unpack_from(data, offset)
+                offset += _typeStruct.size
+                curveType = data[offset:offset + typeLength].decode('utf-8')
+                offset += typeLength
+                keyCount, runCount = _countsStruct.unpack_from(data, offset)
+                offset += _countsStruct.size
+                inTypes, outTypes = [], []
+                for _ in range(runCount):
+                    runLength, = _countStruct.unpack_from(data, offset)
+                    offset += _countStruct.size
+                    for types in (inTypes, outTypes):
+                        typeLength, = _typeStruct.unpack_from(data, offset)
+                        offset += _typeStruct.size
+                        types += [data[offset:offset + typeLength].decode('ascii')] * runLength
+                        offset += typeLength
+                plugs.append((name, curveType, keyCount, inTypes, outTypes))
+            values = array('d')
+            values.frombytes(zlib.decompress(data[offset:]))
+        except (OSError, struct.error, zlib.error, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        bakedKeys = {}
+        position = 0
+        for name, curveType, keyCount, inTypes, outTypes in plugs:
+            bakedKeys[name] = (curveType, values[position:position + keyCount],
+                               values[position + keyCount:position + keyCount * 2], inTypes, outTypes)
+            position += keyCount * 2
+        self.hits += 1
+        return bakedKeys
+
+    def put(self, key, signature, bakedKeys):
+        """Store {plug: (curveType, times, values, inTangentTypes, outTangentTypes)} for a node, replacing it."""
+        if not os.path.exists(self.folderPath):
+            os.makedirs(self.folderPath)
+        parts = [_headerStruct.pack(MAGIC, VERSION, signature.encode('ascii'), len(bakedKeys))]
+        values = array('d')
+        for name, (curveType, times, keyValues, inTypes, outTypes) in bakedKeys.items():
+            encodedName, encodedType = name.encode('utf-8'), curveType.encode('utf-8')
+            runs = _tangentRuns(inTypes, outTypes)
+            parts += [_nameStruct.pack(len(encodedName)), encodedName, _typeStruct.pack(len(encodedType)),
+                      encodedType, _countsStruct.pack(len(times), len(runs))]
+            for runLength, inType, outType in runs:
+                parts.append(_countStruct.pack(runLength))
+                for tangentType in (inType.encode('ascii'), outType.encode('ascii')):
+                    parts += [_typeStruct.pack(len(tangentType)), tangentType]
+            values.extend(times)
+            values.extend(keyValues)
+        parts.append(zlib.compress(values.tobytes(), 6))
+        # Written next to the entry and swapped in, so a reader never sees half a file
+        filePath = self._path(key)
+        tempPath = f"{filePath}.{os.getpid()}.tmp"
+        with open(tempPath, 'wb') as cacheFile:
+            cacheFile.write(b''.join(parts))
+        os.replace(tempPath, filePath)
+
+    def invalidate(self, nodes):
+        """Drop the entries of these nodes, their next bake is a full one."""
+        for key in getCacheKeys(nodes):
+            if os.path.exists(self._path(key)):
+                os.remove(self._path(key))
+
+    def clear(self):
+        if os.path.exists(self.folderPath):
+            for fileName in os.listdir(self.folderPath):
+                if fileName.endswith(".bkc"):
+                    os.remove(os.path.join(self.folderPath, fileName))
+
+
+def bakeCached(cache, nodes, start, end, sampleBy=1.0, attributes=None, includeShapes=False, simulation=True,
+               **bakeArgs):
+    """Bake nodes like bakeEngine.bake, applying cached keys to the nodes that did not change.
+
+    Extra arguments, e.g. chunkSize, progress or profile, go to bakeEngine.bake for
+    the nodes that are baked. Returns a report with the node counts and seconds.
+    """
+    if not nodes:
+        raise ValueError("Nothing to bake.")
+    startTime = time.perf_counter()
+    keys = getCacheKeys(nodes)
+    # Every signature is read before anything is baked or keyed
+    states = {}
+    signatures = [getSignature(node, start, end, sampleBy, attributes, includeShapes, simulation, states)
+                  for node in nodes]
+    cached = []
+    missing = []
+    for node, key, signature in zip(nodes, keys, signatures):
+        bakedKeys = cache.get(key, signature)
+        if bakedKeys is None:
+            missing.append((node, key, signature))
+        else:
+            cached.append((node, bakedKeys))
+
+    if cached:
+        cmds.undoInfo(openChunk=True, chunkName="bakeCache")
+        suspended = cmds.refresh(query=True, suspend=True)
+        cmds.refresh(suspend=True)
+        try:
+            for node, bakedKeys in cached:
+                for plug, (curveType, times, values, inTypes, outTypes) in bakedKeys.items():
+                    bakeEngine.applyKeys(plug, curveType, list(times), list(values), inTypes, outTypes)
+        finally:
+            cmds.refresh(suspend=suspended)
+            cmds.undoInfo(closeChunk=True)
+
+    if missing:
+        bakeNodes = [node for node, _, _ in missing]
+        bakeEngine.bake(bakeNodes, start, end, sampleBy, attributes, includeShapes, simulation=simulation,
+                        **bakeArgs)
+        for node, key, signature in missing:
+            bakedKeys = bakeEngine.getBakedKeys([node], start, end, attributes, includeShapes)
+            cache.put(key, signature, {plug: (plugKeys["curveType"], plugKeys["times"], plugKeys["values"],
+                                              plugKeys["inTangentTypes"], plugKeys["outTangentTypes"])
+                                       for plug, plugKeys in bakedKeys.items()})
+
+    return {
+        "nodes": len(nodes),
+        "cached": len(cached),
+        "baked": len(missing),
+        "seconds": time.perf_counter() - startTime
+    }
@@ -0,0 +1,115 @@
+# Command line bake runner for batch and farm jobs, run with mayapy.
+# Every worker process starts maya.standalone once and then bakes scene after
+# scene from the queue, so the Maya startup cost is paid once per worker
+# instead of once per shot.
+#
+#     mayapy bakeEngine/bakeCli.py shot010.ma shot020.ma --nodes "*:*_ctrl" --start 1001 --end 1250
+#         --sample 1 --shapes --workers 4 --suffix _baked --profiles //farm/profiles
+#
+# Without --start/--end each scene's playback range is used. Baked scenes are
+# saved next to the source with --suffix, or over it with --overwrite.
+# With --cache, nodes whose rig and animation did not change since a bake with the
+# same settings get their keys from that folder (see bakeCache.py) instead of a bake.
+
+import argparse
+import os
+import sys
+import time
+import traceback
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def initializeWorker():
+    """Start Maya once in every worker process."""
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+
+
+def bakeScene(job):
+    """Open, bake and save one scene. Returns a result dict, errors included."""
+    import maya.cmds as cmds
+    from bakeEngine import bakeCache
+    from bakeEngine import bakeEngine
+    from bakeEngine import bakeProfile
+    from bakeEngine import keyReduction
+
+    scenePath = job["scene"]
+    sceneTime = time.perf_counter()
+    try:
+        profile = bakeProfile.BakeProfile(scene=scenePath)
+        with profile.phase("sceneLoad"):
+            cmds.file(scenePath, open=True, force=True)
+        nodes = cmds.ls(job["nodes"], type='transform') if job["nodes"] else []
+        if not nodes:
+            raise ValueError(f"No nodes match {job['nodes']}.")
+        start = job["start"] if job["start"] is not None else cmds.playbackOptions(q=True, minTime=True)
+        end = job["end"] if job["end"] is not None else cmds.playbackOptions(q=True, maxTime=True)
+
+        if job["cache"]:
+            bakeCache.bakeCached(bakeCache.BakeCache(job["cache"]), nodes, start, end, job["sampleBy"],
+                                 includeShapes=job["shapes"], simulation=job["simulation"], chunkSize=job["chunk"],
+                                 profile=profile)
+        else:
+            bakeEngine.bake(nodes, start, end, job["sampleBy"], includeShapes=job["shapes"],
+                            simulation=job["simulation"], chunkSize=job["chunk"], profile=profile)
+        if job["reduce"]:
+            with profile.phase("keyReduction"):
+                keyReduction.reduceBakedCurves(nodes, start, end, job["reduce"], includeShapes=job["shapes"])
+
+        with profile.phase("sceneSave"):
+            outputPath = scenePath
+            if not job["overwrite"]:
+                root, extension = os.path.splitext(scenePath)
+                outputPath = root + job["suffix"] + extension
+                cmds.file(rename=outputPath)
+            cmds.file(save=True, force=True)
+        if job["profiles"]:
+            name = os.path.splitext(os.path.basename(scenePath))[0]
+            profile.write(os.path.join(job["profiles"], name + ".json"))
+        return {"scene": scenePath, "output": outputPath, "seconds": time.perf_counter() - sceneTime,
+                "summary": profile.summary(), "error": None}
+    except Exception:
+        return {"scene": scenePath, "output": None, "seconds": time.perf_counter() - sceneTime,
+                "summary": None, "error": traceback.format_exc()}
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(description="Bake animation in Maya scenes with a pool of mayapy workers.")
+    parser.add_argument('scenes', nargs='+', help="Scene files to bake")
+    parser.add_argument('--nodes', nargs='+', required=True, help="cmds.ls patterns of the nodes to bake")
+    parser.add_argument('--start', type=float, help="Start frame, the playback start by default")
+    parser.add_argument('--end', type=float, help="End frame, the playback end by default")
+    parser.add_argument('--sample', dest='sampleBy', type=float, default=1.0, help="Sample by")
+    parser.add_argument('--shapes', action='store_true', help="Include shape nodes")
+    parser.add_argument('--chunk', type=float, default=0,
+                        help="Chunk size in frames, 0 bakes the whole range. Only used with --no-simulation")
+    parser.add_argument('--no-simulation', dest='simulation', action='store_false',
+                        help="Evaluate every frame on its own, for rigs without frame to frame state")
+    parser.add_argument('--reduce', type=float, default=0, help="Key reduction tolerance, 0 keeps every key")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Number of mayapy processes")
+    parser.add_argument('--suffix', default='_baked', help="Suffix of the saved scenes")
+    parser.add_argument('--overwrite', action='store_true', help="Save over the source scenes")
+    parser.add_argument('--profiles', help="Folder for the JSON bake profiles")
+    parser.add_argument('--cache', help="Bake cache folder, unchanged nodes get their cached keys")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    jobs = [dict(vars(args), scene=os.path.abspath(scene)) for scene in args.scenes]
+    failed = 0
+    with Pool(min(args.workers, len(jobs)), initializer=initializeWorker) as pool:
+        for result in pool.imap_unordered(bakeScene, jobs):
+            if result["error"]:
+                failed += 1
+                print(f"FAILED {result['scene']} after {result['seconds']:.1f}s\n{result['error']}")
+            else:
+                print(f"Baked {result['scene']} -> {result['output']} in {result['seconds']:.1f}s\n  {result['summary']}")
+    print(f"{len(jobs) - failed} of {len(jobs)} scenes baked.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+# Headless bake engine, used by bakeAnimationTool.py and usable without any UI.
+# bake() runs cmds.bakeResults over the frame range in chunks of whole samples,
+# reports the timing of every chunk and can be cancelled between chunks.
+#
+# bakeResults replaces the chain driving a channel (constraint, expression,
+# driven key...) with an anim curve, and writes keys straight into a channel's
+# existing anim curve, changing its tangents. Either way a later chunk would
+# sample something other than the original animation. So every chunk is baked
+# against the original drivers (keyed channels get a copy of their original
+# curve), and the chunks are spliced into one curve per channel at the end,
+# which gives the same keys as a single bake over the whole range. Only the
+# channels being baked are reconnected and spliced, others keep their keys.
+# A simulation bake carries state from frame to frame (dynamics, stateful
+# expressions), which a chunk starting mid-range would not have, so
+# simulation=True always bakes the whole range in one chunk.
+#
+# Pass a bakeProfile.BakeProfile to get per-phase timings and counts.
+#
+# Usage:
+#     from bakeEngine import bakeEngine
+#     bakeEngine.bake(cmds.ls(selection=True), 1001, 1250, chunkSize=50)
+
+import time
+
+import maya.cmds as cmds
+
+from . import bakeProfile
+
+# bakeResults flags used for every bake, as the Bake Animation Tool always did
+bakeOptions = dict(
+    simulation=True,
+    preserveOutsideKeys=True,
+    sparseAnimCurveBake=False,
+    removeBakedAttributeFromLayer=False,
+    bakeOnOverrideLayer=False,
+    minimizeRotation=True,
+    controlPoints=False
+)
+
+rotateAttrs = ('rotateX', 'rotateY', 'rotateZ')
+
+
+class BakeCancelled(Exception):
+    """Raised when a chunked bake is cancelled between two chunks."""
+
+
+def chunkRanges(start, end, sampleBy=1.0, chunkSize=0):
+    """Split start-end into (chunkStart, chunkEnd) ranges on the sampleBy grid.
+
+    chunkSize is in frames and is rounded to whole samples; 0 means one chunk.
+    """
+    if sampleBy <= 0:
+        raise ValueError("Sample by must be greater than 0.")
+    if end < start:
+        raise ValueError("End frame must not be before start frame.")
+    if not chunkSize:
+        return [(start, end)]
+
+    samples = int((end - start) / sampleBy + 1e-6) + 1
+    step = max(1, int(round(chunkSize / sampleBy)))
+    ranges = []
+    for first in range(0, samples, step):
+        last = min(first + step, samples) - 1
+        # The last chunk ends on 'end' itself, exactly like the full range bake
+        chunkEnd = end if last == samples - 1 else start + last * sampleBy
+        ranges.append((start + first * sampleBy, chunkEnd))
+    return ranges
+
+
+def getLongNames(node, attributes):
+    """Return the long names of the attributes that exist on node."""
+    return {cmds.attributeQuery(attr, node=node, longName=True)
+            for attr in attributes if cmds.attributeQuery(attr, node=node, exists=True)}
+
+
+def getDrivers(nodes, attributes=None):
+    """Return {plug: sourcePlug} for every incoming connection of the nodes, limited to attributes if given."""
+    drivers = {}
+    for node in nodes:
+        pairs = cmds.listConnections(node, source=True, destination=False, connections=True, plugs=True) or []
+        pairs = zip(pairs[::2], pairs[1::2])
+        if attributes:
+            # Connections use long names, the channel box gives short ones
+            longNames = getLongNames(node, attributes)
+            pairs = [(plug, source) for plug, source in pairs if plug.split('.', 1)[1] in longNames]
+        drivers.update(pairs)
+    return drivers
+
+
+def getUpstreamNodes(nodes):
+    """Return the long names of nodes and everything their evaluation depends on.
+
+    That is their upstream history, the DAG parents of every node in it and the
+    history of those parents, e.g. the animated group above a constraint target.
+    """
+    found = []
+    seen = set()
+    pending = list(nodes)
+    while pending:
+        history = cmds.ls(cmds.listHistory(pending) or [], long=True) or []
+        pending = []
+        for node in history:
+            if node in seen:
+                continue
+            seen.add(node)
+            found.append(node)
+            parts = node.split('|')
+            pending += ['|'.join(parts[:depth]) for depth in range(2, len(parts))
+                        if '|'.join(parts[:depth]) not in seen]
+    return found
+
+
+def _isAnimCurve(plug):
+    return 'animCurve' in cmds.nodeType(plug.split('.')[0], inherited=True)
+
+
+def _connectOriginals(drivers, keyedCurves, lastChunk):
+    """Connect the original driver of every plug for the next chunk.
+
+    Keyed plugs get a copy of their original curve, except for the last chunk,
+    which bakes into the original curve itself.
+    """
+    for plug, source in drivers.items():
+        if plug in keyedCurves and not lastChunk:
+            source = cmds.duplicate(keyedCurves[plug])[0] + '.output'
+        cmds.connectAttr(source, plug, force=True)
+
+
+def _holdChunkCurves(driven, drivers, heldCurves, chunk):
+    """Keep the curve each plug was baked to in the last chunk."""
+    current = getDrivers(driven)
+    for plug, source in drivers.items():
+        newSource = current.get(plug)
+        if newSource and newSource != source and _isAnimCurve(newSource):
+            heldCurves.setdefault(plug, []).append((newSource.split('.')[0],) + chunk)
+
+
+def _spliceChunkCurves(driven, drivers, keyedCurves, heldCurves, bakedRanges, minimizeRotation=True):
+    """Copy the keys of every held chunk into the curve that ends up driving the plug."""
+    # Keys between two chunks, e.g. on subframes, are removed by a single bake too
+    gaps = []
+    for (_, chunkEnd), (nextStart, _) in zip(bakedRanges, bakedRanges[1:]):
+        margin = (nextStart - chunkEnd) * 1e-3
+        gaps.append((chunkEnd + margin, nextStart - margin))
+
+    current = getDrivers(driven)
+    unused = set()
+    rotateCurves = {}
+    for plug in set(heldCurves) | set(keyedCurves):
+        chunks = heldCurves.get(plug, [])
+        source = current.get(plug)
+        if plug in keyedCurves:
+            target = keyedCurves[plug]
+            if source.split('.')[0] != target:
+                # Stopped before the last chunk, put the original curve back
+                unused.add(source.split('.')[0])
+                cmds.connectAttr(target + '.output', plug, force=True)
+        elif source != drivers[plug] and _isAnimCurve(source):
+            target = source.split('.')[0]
+        else:
+            # Stopped before the last chunk, finish on the last baked one
+            target = chunks.pop()[0]
+            cmds.connectAttr(target + '.output', plug, force=True)
+
+        for curve, chunkStart, chunkEnd in chunks:
+            cmds.copyKey(curve, time=(chunkStart, chunkEnd))
+            cmds.pasteKey(plug, option='replace')
+            unused.add(curve)
+        if plug in keyedCurves:
+            for gap in gaps:
+                cmds.cutKey(plug, time=gap, option='keys', clear=True)
+        node, attr = plug.rsplit('.', 1)
+        if chunks and minimizeRotation and attr in rotateAttrs:
+            rotateCurves.setdefault(node, []).append(target)
+
+    if unused:
+        cmds.delete(list(unused))
+    # Each chunk only filtered its own rotations, filter across the chunk boundaries too,
+    # but leave the keys outside the bake as preserveOutsideKeys kept them
+    for curves in rotateCurves.values():
+        cmds.filterCurve(curves, filter='euler', startTime=bakedRanges[0][0], endTime=bakedRanges[-1][1])
+
+
+def bake(nodes, start, end, sampleBy=1.0, attributes=None, includeShapes=False,
+         chunkSize=0, progress=None, cancelled=None, simulation=True, profile=None):
+    """Bake the animation of nodes from start to end, chunkSize frames at a time.
+
+    attributes limits the bake to those attribute names, like the channel box
+    selection. progress(index, count, chunkStart, chunkEnd, seconds) is called
+    after each chunk, and the bake stops with BakeCancelled when cancelled()
+    returns True before a chunk. chunkSize is ignored when simulation is True,
+    see the header. A bakeProfile.BakeProfile passed as profile
+    gets the phase timings and the object, attribute and key counts.
+    The whole bake, every chunk and the splicing, is a single undo step.
+    Returns a list of per-chunk timing dicts.
+    """
+    if not nodes:
+        raise ValueError("Nothing to bake.")
+    countResults = profile is not None
+    profile = profile or bakeProfile.BakeProfile()
+    timings = []
+    cmds.undoInfo(openChunk=True, chunkName="bake")
+    # A caller may have suspended the refresh already, it is put back as it was
+    suspended = cmds.refresh(query=True, suspend=True)
+    cmds.refresh(suspend=True)
+    try:
+        with profile.phase("setup"):
+            ranges = chunkRanges(start, end, sampleBy, 0 if simulation else chunkSize)
+            flags = dict(bakeOptions, sampleBy=sampleBy, shape=includeShapes, simulation=simulation)
+            if attributes:
+                flags['at'] = attributes
+            driven = list(nodes)
+            if includeShapes:
+                driven += cmds.listRelatives(nodes, shapes=True) or []
+            drivers = getDrivers(driven, attributes) if len(ranges) > 1 else {}
+            keyedCurves = {plug: source.split('.')[0] for plug, source in drivers.items() if _isAnimCurve(source)}
+            heldCurves = {}
+            if drivers:
+                _connectOriginals(drivers, keyedCurves, False)
+
+        try:
+            for index, (chunkStart, chunkEnd) in enumerate(ranges):
+                if cancelled and cancelled():
+                    raise BakeCancelled(f"Bake cancelled before frame {chunkStart}.")
+                chunkTime = time.perf_counter()
+                with profile.phase("evaluation"):
+                    cmds.bakeResults(nodes, t=(chunkStart, chunkEnd), **flags)
+                if drivers and index < len(ranges) - 1:
+                    with profile.phase("keyWrite"):
+                        _holdChunkCurves(driven, drivers, heldCurves, (chunkStart, chunkEnd))
+                        _connectOriginals(drivers, keyedCurves, index == len(ranges) - 2)
+                seconds = time.perf_counter() - chunkTime
+                timings.append({"start": chunkStart, "end": chunkEnd, "seconds": seconds})
+                if progress:
+                    progress(index + 1, len(ranges), chunkStart, chunkEnd, seconds)
+        finally:
+            if drivers:
+                with profile.phase("keyWrite"):
+                    _spliceChunkCurves(driven, drivers, keyedCurves, heldCurves, ranges[:len(timings)],
+                                       bakeOptions['minimizeRotation'])
+    finally:
+        with profile.phase("cleanup"):
+            cmds.refresh(suspend=suspended)
+            profile.chunks.extend(timings)
+            if countResults and timings:
+                bakedCurves = getBakedCurves(nodes, attributes, includeShapes)
+                profile.counts["objects"] = len(nodes)
+                profile.counts["attributes"] = len(bakedCurves)
+                profile.counts["keys"] = sum(cmds.keyframe(curve, q=True, t=(start, end), keyframeCount=True)
+                                             for curve in bakedCurves.values())
+            cmds.undoInfo(closeChunk=True)
+    return timings
+
+
+def getBakedCurves(nodes, attributes=None, includeShapes=False):
+    """Return {plug: animCurve} for the anim curves driving nodes, limited to attributes if given."""
+    if includeShapes:
+        nodes = list(nodes) + (cmds.listRelatives(nodes, shapes=True) or [])
+    bakedCurves = {}
+    for node in nodes:
+        pairs = cmds.listConnections(node, source=True, destination=False, connections=True,
+                                     plugs=True, type='animCurve') or []
+        if attributes:
+            longNames = getLongNames(node, attributes)
+        for plug, source in zip(pairs[::2], pairs[1::2]):
+            if not attributes or plug.split('.', 1)[1] in longNames:
+                bakedCurves[plug] = source.split('.')[0]
+    return bakedCurves
+
+
+def getBakedKeys(nodes, start, end, attributes=None, includeShapes=False):
+    """Return the keys of nodes between start and end.
+
+    They come as {plug: {"curveType", "times", "values", "inTangentTypes", "outTangentTypes"}}.
+    """
+    bakedKeys = {}
+    for plug, curve in getBakedCurves(nodes, attributes, includeShapes).items():
+        bakedKeys[plug] = {
+            "curveType": cmds.nodeType(curve),
+            "times": cmds.keyframe(curve, q=True, t=(start, end), timeChange=True) or [],
+            "values": cmds.keyframe(curve, q=True, t=(start, end), valueChange=True) or [],
+            "inTangentTypes": cmds.keyTangent(curve, q=True, t=(start, end), inTangentType=True) or [],
+            "outTangentTypes": cmds.keyTangent(curve, q=True, t=(start, end), outTangentType=True) or []
+        }
+    return bakedKeys
+
+
+def _setTangentTypes(curve, inTangentTypes, outTangentTypes):
+    """Set the tangent types of the keys of curve, one keyTangent call per run of equal types."""
+    for flag, types in (('inTangentType', inTangentTypes), ('outTangentType', outTangentTypes)):
+        types = list(types or ())
+        runStart = 0
+        for index in range(1, len(types) + 1):
+            if index == len(types) or types[index] != types[runStart]:
+                cmds.keyTangent(curve, edit=True, index=(runStart, index - 1), **{flag: types[runStart]})
+                runStart = index
+
+
+def applyKeys(plug, curveType, times, values, inTangentTypes=None, outTangentTypes=None):
+    """Key plug from times[0] to times[-1] with one setAttr, like a bake of that range.
+
+    The keys, with their tangent types if given, are written to a new anim curve.
+    When an anim curve already drives plug, they are pasted over that range of it
+    instead, so the curve keeps its keys outside the range, their tangents, its
+    infinity and its connections. Returns the anim curve driving plug.
+    """
+    if not times:
+        return None
+    curve = cmds.createNode(curveType, name=plug.rsplit('|', 1)[-1].replace('.', '_'), skipSelect=True)
+    cmds.setAttr(f"{curve}.ktv[0:{len(times) - 1}]", *[value for key in zip(times, values) for value in key])
+    _setTangentTypes(curve, inTangentTypes, outTangentTypes)
+    oldCurves = cmds.listConnections(plug, source=True, destination=False, type='animCurve')
+    if not oldCurves:
+        cmds.connectAttr(curve + '.output', plug, force=True)
+        return curve
+    cmds.copyKey(curve, time=(times[0], times[-1]))
+    cmds.pasteKey(plug, option='replace')
+    cmds.delete(curve)
+    return oldCurves[0]
@@ -0,0 +1,202 @@
+# Parallel bake of independent hierarchies in batch mayapy processes.
+# Selected nodes are grouped by shared upstream history and shared top DAG
+# parent, so every group (a separate rig or character) can be evaluated on its
+# own. Each group is exported to a sub-scene with everything it depends on
+# (bakeEngine.getUpstreamNodes: history, DAG parents, constraint targets and
+# their parents), and baked by a mayapy worker (bakeWorker.py) with this scene's
+# units and playback range. The baked keys come back as JSON, keyed by the long
+# names of this scene's nodes, and are applied in this session with one setAttr
+# per channel, as a single undo step.
+#
+# With timeSlices=True the range of every group is also split between workers.
+# That only gives the same result for non-simulation bakes, where every frame
+# can be evaluated on its own, so it implies simulation=False. The joined
+# rotations are euler filtered across the slice boundaries, like the chunks of
+# bakeEngine.bake.
+#
+# Usage:
+#     from bakeEngine import bakeParallel
+#     bakeParallel.bakeParallel(cmds.ls(selection=True), 1001, 1250, workers=8)
+
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import maya.cmds as cmds
+
+from . import bakeEngine
+
+workerScript = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bakeWorker.py')
+
+# Nodes that every rig reads from, they don't make two rigs dependent
+_sharedNodes = {'time1'}
+
+
+def getMayapy():
+    """Return the mayapy executable of this Maya install.
+
+    It is found from MAYA_LOCATION: <location>/bin on Windows and Linux, and on
+    macOS, where MAYA_LOCATION is Maya.app/Contents, in Contents/bin too. Without
+    it, mayapy is looked for next to the running executable (Maya or mayapy
+    itself) and in Maya.app/Contents/bin from Maya.app/Contents/MacOS.
+    """
+    name = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+    candidates = []
+    location = os.environ.get('MAYA_LOCATION')
+    if location:
+        candidates += [os.path.join(location, 'bin', name), os.path.join(location, 'Contents', 'bin', name)]
+    executableFolder = os.path.dirname(sys.executable)
+    candidates += [os.path.join(executableFolder, name), os.path.join(executableFolder, os.pardir, 'bin', name)]
+    for path in candidates:
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+    raise RuntimeError("Can't find mayapy, set MAYA_LOCATION or pass mayapy to bakeParallel().")
+
+
+def findIndependentGroups(nodes):
+    """Split nodes into groups that share no upstream history and no top DAG parent."""
+    groups = []  # list of (nodes, dependency set)
+    for node in nodes:
+        upstream = bakeEngine.getUpstreamNodes([node])
+        dependencies = set(upstream) - _sharedNodes
+        # A rig's top parent, and the top parents of its constraint targets
+        dependencies.update(name.split('|')[1] for name in upstream if name.startswith('|'))
+        members = [node]
+        # Merge every group this node depends on, or that depends on it
+        for group in [g for g in groups if g[1] & dependencies]:
+            groups.remove(group)
+            members = group[0] + members
+            dependencies |= group[1]
+        groups.append((members, dependencies))
+    return [members for members, _ in groups]
+
+
+def getSceneSettings():
+    """Return the units and playback range of the scene, which an exported sub-scene does not keep."""
+    return {
+        "timeUnit": cmds.currentUnit(q=True, time=True),
+        "linearUnit": cmds.currentUnit(q=True, linear=True),
+        "angularUnit": cmds.currentUnit(q=True, angle=True),
+        "playback": [cmds.playbackOptions(q=True, **{flag: True})
+                     for flag in ('minTime', 'maxTime', 'animationStartTime', 'animationEndTime')]
+    }
+
+
+def applySceneSettings(settings):
+    """Set the units and playback range from getSceneSettings(), without moving any key."""
+    cmds.currentUnit(time=settings["timeUnit"], linear=settings["linearUnit"], angle=settings["angularUnit"],
+                     updateAnimation=False)
+    minTime, maxTime, animationStart, animationEnd = settings["playback"]
+    cmds.playbackOptions(minTime=minTime, maxTime=maxTime, animationStartTime=animationStart,
+                         animationEndTime=animationEnd)
+
+
+def exportSubScene(nodes, filePath):
+    """Export nodes with everything their evaluation depends on to a scene file, keeping the selection.
+
+    That is their history, and the DAG parents of every node in it with their
+    own history, so constraint targets keep their world space.
+    """
+    selection = cmds.ls(selection=True)
+    try:
+        cmds.select(bakeEngine.getUpstreamNodes(nodes), replace=True, noExpand=True)
+        cmds.file(filePath, force=True, exportSelected=True, type='mayaBinary', preserveReferences=True,
+                  constructionHistory=True, channels=True, constraints=True, expressions=True, shader=False)
+    finally:
+        cmds.select(selection, replace=True, noExpand=True)
+
+
+def _runWorker(mayapy, jobPath):
+    jobTime = time.perf_counter()
+    result = subprocess.run([mayapy, workerScript, jobPath], capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(f"Bake worker failed for {jobPath}:\n{result.stderr[-2000:]}")
+    return time.perf_counter() - jobTime
+
+
+def bakeParallel(nodes, start, end, sampleBy=1.0, attributes=None, includeShapes=False,
+                 workers=None, timeSlices=False, simulation=True, mayapy=None):
+    """Bake independent groups of nodes in parallel mayapy workers and apply the keys here.
+
+    Returns a list of per-job dicts with the nodes, frame range and seconds.
+    """
+    if not nodes:
+        raise ValueError("Nothing to bake.")
+    workers = workers or os.cpu_count() or 1
+    mayapy = mayapy or getMayapy()
+    if timeSlices:
+        simulation = False
+
+    # Workers name their results after these, short names may not be unique here
+    groups = findIndependentGroups(cmds.ls(nodes, long=True))
+    ranges = [(start, end)]
+    if timeSlices:
+        samples = int((end - start) / sampleBy + 1e-6) + 1
+        slices = max(1, workers // len(groups))
+        ranges = bakeEngine.chunkRanges(start, end, sampleBy, math.ceil(samples / slices) * sampleBy)
+
+    settings = getSceneSettings()
+    tempFolder = tempfile.mkdtemp(prefix='bakeParallel_')
+    try:
+        jobs = []
+        for index, group in enumerate(groups):
+            scenePath = os.path.join(tempFolder, f"group{index}.mb")
+            exportSubScene(group, scenePath)
+            for sliceIndex, (sliceStart, sliceEnd) in enumerate(ranges):
+                job = {
+                    "scene": scenePath,
+                    "nodes": group,
+                    "start": sliceStart,
+                    "end": sliceEnd,
+                    "sampleBy": sampleBy,
+                    "attributes": attributes,
+                    "includeShapes": includeShapes,
+                    "simulation": simulation,
+                    "settings": settings,
+                    "output": os.path.join(tempFolder, f"group{index}_{sliceIndex}_keys.json")
+                }
+                jobPath = os.path.join(tempFolder, f"group{index}_{sliceIndex}_job.json")
+                with open(jobPath, 'w') as jsonFile:
+                    json.dump(job, jsonFile)
+                jobs.append((job, jobPath))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            seconds = list(executor.map(lambda job: _runWorker(mayapy, job[1]), jobs))
+
+        # Slices of the same plug are joined before they are applied
+        bakedKeys = {}
+        for job, _ in jobs:
+            with open(job["output"], 'r') as jsonFile:
+                for plug, keys in json.load(jsonFile).items():
+                    merged = bakedKeys.setdefault(plug, {"curveType": keys["curveType"], "keys": []})
+                    merged["keys"].extend(zip(keys["times"], keys["values"], keys["inTangentTypes"],
+                                              keys["outTangentTypes"]))
+    finally:
+        shutil.rmtree(tempFolder, ignore_errors=True)
+
+    cmds.undoInfo(openChunk=True, chunkName="bakeParallel")
+    suspended = cmds.refresh(query=True, suspend=True)
+    cmds.refresh(suspend=True)
+    try:
+        rotateCurves = []
+        for plug, merged in bakedKeys.items():
+            if not merged["keys"]:
+                continue
+            times, values, inTypes, outTypes = (list(column) for column in zip(*sorted(merged["keys"])))
+            curve = bakeEngine.applyKeys(plug, merged["curveType"], times, values, inTypes, outTypes)
+            if plug.rsplit('.', 1)[1] in bakeEngine.rotateAttrs:
+                rotateCurves.append(curve)
+        if len(ranges) > 1 and rotateCurves and bakeEngine.bakeOptions['minimizeRotation']:
+            cmds.filterCurve(rotateCurves, filter='euler', startTime=start, endTime=end)
+    finally:
+        cmds.refresh(suspend=suspended)
+        cmds.undoInfo(closeChunk=True)
+
+    return [{"nodes": job["nodes"], "start": job["start"], "end": job["end"], "seconds": jobSeconds}
+            for (job, _), jobSeconds in zip(jobs, seconds)]
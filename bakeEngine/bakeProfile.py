@@ -0,0 +1,95 @@
+# Timing and counts of a bake, written as JSON so profiles from many batch bakes
+# can be collected in one folder and compared to find the slow rigs.
+# bakeEngine.bake(profile=...) fills in the phases:
+#     setup       reading the drivers and preparing the chunks
+#     evaluation  cmds.bakeResults, which evaluates the rig and keys every sample
+#     keyWrite    reconnecting drivers between chunks and splicing chunk curves
+#     cleanup     restoring the viewport refresh and counting the results
+#
+# Usage:
+#     from bakeEngine import bakeEngine, bakeProfile
+#     profile = bakeProfile.BakeProfile(scene=cmds.file(q=True, sceneName=True))
+#     bakeEngine.bake(cmds.ls(selection=True), 1001, 1250, profile=profile)
+#     profile.write('//farm/profiles/shot010.json')
+#     for data in bakeProfile.slowestProfiles('//farm/profiles'):
+#         print(data["scene"], data["total"])
+
+import json
+import os
+import socket
+import time
+from contextlib import contextmanager
+
+
+class BakeProfile(object):
+    """Wall time per bake phase plus object, attribute and key counts."""
+
+    def __init__(self, **info):
+        self.info = info
+        self.phases = {}
+        self.counts = {}
+        self.chunks = []
+        self.created = time.time()
+
+    @contextmanager
+    def phase(self, name):
+        """Add the wall time of the with block to the named phase."""
+        phaseTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - phaseTime
+
+    def total(self):
+        return sum(self.phases.values())
+
+    def toDict(self):
+        data = dict(self.info)
+        data.update({
+            "host": socket.gethostname(),
+            "created": self.created,
+            "total": self.total(),
+            "phases": self.phases,
+            "counts": self.counts,
+            "chunks": self.chunks
+        })
+        return data
+
+    def write(self, filePath):
+        """Save the profile as a JSON file, creating its folder if needed."""
+        folderPath = os.path.dirname(filePath)
+        if folderPath and not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        with open(filePath, 'w') as jsonFile:
+            json.dump(self.toDict(), jsonFile, indent=4)
+
+    def summary(self):
+        """One line report of the phases and counts."""
+        phases = ", ".join("{} {:.2f}s".format(name, seconds) for name, seconds in self.phases.items())
+        counts = ", ".join("{} {}".format(count, name) for name, count in self.counts.items())
+        return "Bake took {:.2f}s ({}), {}".format(self.total(), phases, counts)
+
+
+def loadProfiles(folderPath):
+    """Load every JSON profile in a folder."""
+    profiles = []
+    for fileName in sorted(os.listdir(folderPath)):
+        if fileName.endswith('.json'):
+            with open(os.path.join(folderPath, fileName), 'r') as jsonFile:
+                profiles.append(json.load(jsonFile))
+    return profiles
+
+
+def slowestProfiles(folderPath, key="total", top=20):
+    """Return the 'top' profiles of a folder with the highest value for key.
+
+    key is "total", a phase name, or "secondsPerKey" to compare rigs of different sizes.
+    """
+    def value(data):
+        if key == "total":
+            return data["total"]
+        if key == "secondsPerKey":
+            return data["total"] / max(data["counts"].get("keys", 0), 1)
+        return data["phases"].get(key, 0.0)
+
+    return sorted(loadProfiles(folderPath), key=value, reverse=True)[:top]
@@ -0,0 +1,45 @@
+# Batch bake worker, started by bakeParallel.py as: mayapy bakeWorker.py job.json
+# Opens the job's scene, sets the units and playback range of the scene it came
+# from, bakes the job's nodes and writes the baked keys to the job's output file
+# as JSON. Plugs are named from the job's node paths, which are long names in the
+# scene the job came from, so they can be applied there as they are.
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(jobPath):
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    import maya.cmds as cmds
+    from bakeEngine import bakeEngine
+    from bakeEngine import bakeParallel
+
+    with open(jobPath, 'r') as jsonFile:
+        job = json.load(jsonFile)
+
+    cmds.file(job["scene"], open=True, force=True)
+    bakeParallel.applySceneSettings(job["settings"])
+    bakeEngine.bake(job["nodes"], job["start"], job["end"], job["sampleBy"], job["attributes"],
+                    job["includeShapes"], simulation=job["simulation"])
+    bakedKeys = {}
+    for node in job["nodes"]:
+        nodeKeys = bakeEngine.getBakedKeys([node], job["start"], job["end"], job["attributes"],
+                                           job["includeShapes"])
+        for plug, keys in nodeKeys.items():
+            name, attr = plug.split('.', 1)
+            shortName = name.rsplit('|', 1)[-1]
+            # Plugs of the node's shapes are named after the node path too
+            path = node if shortName == node.rsplit('|', 1)[-1] else f"{node}|{shortName}"
+            bakedKeys[f"{path}.{attr}"] = keys
+    with open(job["output"], 'w') as jsonFile:
+        json.dump(bakedKeys, jsonFile)
+
+    maya.standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,76 @@
+# Key reduction for baked animation.
+# A bake puts a key on every sample. reduceKeys() drops the keys that linear
+# interpolation between the kept keys reproduces within a tolerance, in one
+# pass over the samples (swing door compression: the allowed slopes from the
+# last kept key narrow with every sample, and a key is kept when the next
+# sample falls outside them). The remaining keys get linear tangents, so the
+# reduced curve stays within the tolerance of every baked sample.
+#
+# Usage:
+#     from bakeEngine import keyReduction
+#     keyReduction.reduceBakedCurves(cmds.ls(selection=True), 1001, 1250, tolerance=0.01,
+#                                    tolerances={'rotateX': 0.05})
+
+import time
+
+import maya.cmds as cmds
+
+from . import bakeEngine
+
+
+def reduceKeys(times, values, tolerance):
+    """Return the indices of the keys to keep so that no value is off by more than tolerance."""
+    count = len(times)
+    if count < 3:
+        return list(range(count))
+
+    kept = [0]
+    anchor = 0
+    low, high = float('-inf'), float('inf')
+    index = 1
+    while index < count:
+        deltaTime = times[index] - times[anchor]
+        deltaValue = values[index] - values[anchor]
+        slope = deltaValue / deltaTime
+        if low <= slope <= high:
+            # A line from the anchor to this key passes every key in between
+            low = max(low, (deltaValue - tolerance) / deltaTime)
+            high = min(high, (deltaValue + tolerance) / deltaTime)
+            index += 1
+        else:
+            # The previous key was the last one reachable, keep it and start again from it
+            anchor = index - 1
+            kept.append(anchor)
+            low, high = float('-inf'), float('inf')
+    if kept[-1] != count - 1:
+        kept.append(count - 1)
+    return kept
+
+
+def reduceBakedCurves(nodes, start, end, tolerance=0.01, tolerances=None, attributes=None, includeShapes=False):
+    """Remove redundant keys between start and end from the anim curves of nodes.
+
+    tolerances maps attribute long names to their own tolerance, for example
+    larger ones for rotations in degrees. The whole reduction is one undo step.
+    Returns a dict with the key counts before and after, and the seconds spent.
+    """
+    tolerances = tolerances or {}
+    reduceTime = time.perf_counter()
+    keysBefore = keysAfter = 0
+    cmds.undoInfo(openChunk=True, chunkName="keyReduction")
+    try:
+        for plug, curve in bakeEngine.getBakedCurves(nodes, attributes, includeShapes).items():
+            times = cmds.keyframe(curve, q=True, t=(start, end), timeChange=True) or []
+            values = cmds.keyframe(curve, q=True, t=(start, end), valueChange=True) or []
+            kept = reduceKeys(times, values, tolerances.get(plug.split('.', 1)[1], tolerance))
+            keysBefore += len(times)
+            keysAfter += len(kept)
+            if len(kept) == len(times):
+                continue
+            keptTimes = set(times[i] for i in kept)
+            cmds.cutKey(curve, time=[(t, t) for t in times if t not in keptTimes], option='keys', clear=True)
+            cmds.keyTangent(curve, t=(start, end), inTangentType='linear', outTangentType='linear')
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    return {"keysBefore": keysBefore, "keysAfter": keysAfter, "seconds": time.perf_counter() - reduceTime}
@@ -0,0 +1,144 @@
+# Benchmark: full bakes vs bakeCache.bakeCached on an unchanged and a partly edited rig.
+# The scene is rebuilt before every run, like reopening the shot. Checks that keys
+# applied from the cache, with their tangent types and the keys outside the range,
+# are identical to a real bake, and that only the edited
+# controls are baked again, for edits to keys, tangents, infinity, a constraint
+# offset and the animated group above a constraint target. Also compares the
+# cache size with the same keys as JSON.
+#
+#     python benchmarks/bakeCacheBenchmark.py --controls 100 --frames 250
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install()
+
+from bakeEngine import bakeCache
+from bakeEngine import bakeEngine
+
+channels = ('translateX', 'rotateX')
+
+
+def editKeys(n, control):
+    cmds.animCurves[f"{control}_rotateX"][0.0] += 10.0
+
+
+def editTangents(n, control):
+    cmds.keyTangent(f"{control}_rotateX", edit=True, outTangentType='step')
+
+
+def editInfinity(n, control):
+    cmds.setAttr(f"{control}_rotateX.postInfinity", 1)
+
+
+def editOffset(n, control):
+    cmds.setAttr(f"constraint{n}.offset", 1.0)
+
+
+def editTargetParent(n, control):
+    cmds.animCurves[f"targetGroup{n}_translateY"][24.0] += 1.0
+
+
+edits = {"tangents": editTangents, "infinity": editInfinity, "constraint offset": editOffset,
+         "target parent": editTargetParent}
+
+
+def buildScene(controlCount, frames, edited=0, edit=editKeys):
+    """The rig, with edit(n, control) run on the first 'edited' controls.
+
+    The constraint of every control has a target under an animated group, and
+    its rotateX curve has linear tangents.
+    """
+    cmds.__init__(cmds.latency)
+    controls = cmds.buildControls(controlCount, 4, keys=frames // 5)
+    for n, control in enumerate(controls):
+        cmds.keyTangent(f"{control}_rotateX", edit=True, inTangentType='linear', outTangentType='linear')
+        group = cmds.addNode(f"targetGroup{n}")
+        target = cmds.addNode(f"target{n}")
+        cmds.parents[target] = group
+        cmds.drive(f"constraint{n}.target", target + '.worldMatrix')
+        cmds.drive(f"{group}.translateY", cmds.addAnimCurve(f"{group}_translateY", {0.0: 0.0, 24.0: 1.0}) + '.output')
+    for n, control in enumerate(controls[:edited]):
+        edit(n, control)
+    return controls
+
+
+def bakedKeys(controls):
+    """Time, value, in and out tangent type of every key of the baked channels."""
+    keys = {}
+    for control in controls:
+        for attr in channels:
+            plug = f"{control}.{attr}"
+            keys[plug] = list(zip(cmds.keyframe(plug, q=True, timeChange=True),
+                                  cmds.keyframe(plug, q=True, valueChange=True),
+                                  cmds.keyTangent(plug, q=True, inTangentType=True),
+                                  cmds.keyTangent(plug, q=True, outTangentType=True)))
+    return keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake cache benchmark")
+    parser.add_argument('--controls', type=int, default=100)
+    parser.add_argument('--frames', type=int, default=250)
+    parser.add_argument('--edited', type=int, default=5)
+    parser.add_argument('--evaluation', type=float, default=200e-6,
+                        help="Simulated seconds to evaluate the rig per control and frame")
+    parser.add_argument('--latency', type=float, default=20e-6, help="Simulated seconds per cmds call")
+    args = parser.parse_args()
+    cmds.latency = args.latency
+
+    # The stand-in evaluates curves in microseconds, a production rig does not
+    evaluate = cmds.evaluate
+
+    def slowEvaluate(plug, t):
+        end = time.perf_counter() + args.evaluation / len(channels)
+        while time.perf_counter() < end:
+            pass
+        return evaluate(plug, t)
+    cmds.evaluate = slowEvaluate
+
+    print(f"{args.controls} controls, frames 1-{args.frames}, {args.evaluation * 1e6:.0f}us per control and frame")
+    controls = buildScene(args.controls, args.frames)
+    start = time.perf_counter()
+    bakeEngine.bake(controls, 1, args.frames)
+    print(f"  full bake          {time.perf_counter() - start:8.3f}s")
+    expected = bakedKeys(controls)
+    controls = buildScene(args.controls, args.frames, args.edited)
+    bakeEngine.bake(controls, 1, args.frames)
+    expectedEdited = bakedKeys(controls)
+
+    with tempfile.TemporaryDirectory(prefix='bakeCache_') as folderPath:
+        cache = bakeCache.BakeCache(folderPath)
+        for label, edited, keys in (("cold cache", 0, expected), ("warm cache", 0, expected),
+                                    (f"{args.edited} edited", args.edited, expectedEdited)):
+            controls = buildScene(args.controls, args.frames, edited)
+            cmds.resetCalls()
+            report = bakeCache.bakeCached(cache, controls, 1, args.frames)
+            calls = sum(cmds.calls.values())
+            assert bakedKeys(controls) == keys, f"Keys after the {label} bake do not match a full bake"
+            print(f"  {label:<18} {report['seconds']:8.3f}s  {report['cached']:5d} from cache  "
+                  f"{report['baked']:5d} baked  {calls:6d} calls")
+
+        assert report["baked"] == args.edited, "Unchanged controls were baked again"
+        for label, edit in edits.items():
+            controls = buildScene(args.controls, args.frames, args.edited, edit)
+            report = bakeCache.bakeCached(cache, controls, 1, args.frames)
+            assert report["baked"] == args.edited, f"Edits to the {label} were not detected"
+        print(f"  {args.edited} edited controls baked again after edits to the " + ", ".join(edits))
+        cacheBytes = sum(os.path.getsize(os.path.join(folderPath, name)) for name in os.listdir(folderPath))
+        jsonBytes = len(json.dumps({plug: dict(zip(("times", "values", "inTangentTypes", "outTangentTypes"),
+                                                   map(list, zip(*keys))))
+                                    for plug, keys in expected.items()}))
+        print(f"  cache on disk      {cacheBytes / 1024:8.1f} KB, {jsonBytes / 1024:.1f} KB as JSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# Benchmark: single full range bake vs chunked bakeEngine.bake.
+# Checks that every chunk size gives exactly the keys of the single bake, on a
+# stand-in scene mixing constraint-like drivers and keyed channels. Chunks
+# are only used without simulation, so every bake here runs with simulation=False.
+# Also checks that a chunked bake limited to some attributes leaves the keys of
+# the other channels alone.
+#
+#     python benchmarks/bakeEngineBenchmark.py --nodes 20 --frames 500 --chunk 50
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install()
+
+from bakeEngine import bakeEngine
+
+channels = ('translateX', 'translateY', 'rotateX', 'rotateY')
+
+
+def buildScene(nodeCount):
+    cmds.__init__(cmds.latency)
+    nodes = []
+    for n in range(nodeCount):
+        node = f"ctrl{n}"
+        nodes.append(node)
+        cmds.drive(f"{node}.translateX", cmds.addDriver(f"constraint{n}", lambda t, n=n: math.sin(t * 0.1 + n) * 10) + '.o')
+        cmds.drive(f"{node}.translateY", cmds.addDriver(f"expression{n}", lambda t, n=n: (t % 24) * 0.5 + n) + '.o')
+        keys = {float(k * 12 + n % 5): math.cos(k + n) * 45 for k in range(60)}
+        keys[100.5] = 3.0  # a subframe key inside the baked range
+        cmds.drive(f"{node}.rotateX", cmds.addAnimCurve(f"{node}_rotateX", keys) + '.output')
+        cmds.drive(f"{node}.rotateY", cmds.addDriver(f"aim{n}", lambda t, n=n: t * 0.3 - n) + '.o')
+    return nodes
+
+
+def bakedKeys(nodes):
+    return {f"{node}.{attr}": cmds.animCurveOf(f"{node}.{attr}") for node in nodes for attr in channels}
+
+
+def checkAttributes(frames=60, sampleBy=2.0, chunkSize=10):
+    """Bake translateX only, in chunks, next to a rotateX keyed every 5 frames."""
+    cmds.__init__(cmds.latency)
+    node = 'ctrl'
+    cmds.drive(f"{node}.translateX", cmds.addDriver('constraint', lambda t: math.sin(t * 0.1) * 10) + '.o')
+    rotateKeys = {float(t): t * 2.0 for t in range(0, frames + 1, 5)}
+    cmds.drive(f"{node}.rotateX", cmds.addAnimCurve(f"{node}_rotateX", rotateKeys) + '.output')
+    bakeEngine.bake([node], 1, frames, sampleBy, attributes=['tx'], simulation=False)
+    expected = dict(cmds.animCurveOf(f"{node}.translateX"))
+
+    cmds.__init__(cmds.latency)
+    cmds.drive(f"{node}.translateX", cmds.addDriver('constraint', lambda t: math.sin(t * 0.1) * 10) + '.o')
+    cmds.drive(f"{node}.rotateX", cmds.addAnimCurve(f"{node}_rotateX", rotateKeys) + '.output')
+    timings = bakeEngine.bake([node], 1, frames, sampleBy, attributes=['tx'], chunkSize=chunkSize, simulation=False)
+    assert cmds.animCurveOf(f"{node}.rotateX") == rotateKeys, "A chunked bake changed keys outside its attributes"
+    assert cmds.animCurveOf(f"{node}.translateX") == expected, "A chunked attribute bake does not match the single bake"
+    print(f"  attributes   translateX only in {len(timings)} chunks, rotateX keys untouched")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake engine benchmark")
+    parser.add_argument('--nodes', type=int, default=20)
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--sample', type=float, default=1.0)
+    parser.add_argument('--chunk', type=float, nargs='+', default=[10, 50, 200])
+    parser.add_argument('--latency', type=float, default=20e-6, help="Simulated seconds per cmds call")
+    args = parser.parse_args()
+    cmds.latency = args.latency
+
+    nodes = buildScene(args.nodes)
+    start = time.perf_counter()
+    bakeEngine.bake(nodes, 1, args.frames, args.sample, simulation=False)
+    print(f"{args.nodes} nodes x {len(channels)} channels, frames 1-{args.frames} by {args.sample}")
+    print(f"  single bake  {time.perf_counter() - start:8.3f}s  {sum(cmds.calls.values()):6d} calls")
+    expected = bakedKeys(nodes)
+
+    for chunkSize in args.chunk:
+        nodes = buildScene(args.nodes)
+        timings = bakeEngine.bake(nodes, 1, args.frames, args.sample, chunkSize=chunkSize, simulation=False)
+        slowest = max(t["seconds"] for t in timings)
+        assert bakedKeys(nodes) == expected, f"Chunk size {chunkSize} does not match the single bake"
+        print(f"  chunk {chunkSize:<6g} {sum(t['seconds'] for t in timings):8.3f}s  "
+              f"{sum(cmds.calls.values()):6d} calls  {len(timings)} chunks, slowest {slowest:.3f}s  identical keys")
+    checkAttributes()
+
+    # A bake inside a caller's suspended refresh must leave it suspended
+    nodes = buildScene(args.nodes)
+    cmds.refresh(suspend=True)
+    bakeEngine.bake(nodes, 1, args.frames, args.sample)
+    assert cmds.refreshSuspended, "bake turned the viewport refresh back on"
+    cmds.refresh(suspend=False)
+    bakeEngine.bake(nodes, 1, args.frames, args.sample)
+    assert not cmds.refreshSuspended, "bake left the viewport refresh suspended"
+    print("  refresh      suspended state restored after the bake")
+
+    # A chunked bake, with its splicing, is undone in one step
+    undoChunks = cmds.undoChunks
+    bakeEngine.bake(nodes, 1, args.frames, args.sample, chunkSize=50, simulation=False)
+    assert cmds.undoChunks == undoChunks + 1 and not cmds.openUndoChunks, "bake is not a single undo step"
+    print("  undo         chunked bake is one undo chunk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# Benchmark suite for every tool's hot path on synthetic stand-in scenes.
+# Each case builds a scene at a few sizes along one dimension (curves, CVs per
+# curve, controls, attributes per control, meshes, frames...) and runs the tool
+# on it, recording the Maya command calls and the wall time.
+# The regression threshold is on the calls: their growth along the scaled
+# dimension must stay within the case's expected order, e.g. 0 when reading
+# more CVs per curve must not add calls, 1 when every control costs the same.
+# An O(n^2) command pattern therefore fails however fast the machine is.
+# --legacy adds the tools' original loops, which are expected to fail, to show
+# what a regression looks like. --baseline compares wall times with a saved run.
+# Exits with 1 when a case fails, so this can run in CI without Maya.
+#
+#     python benchmarks/benchmarkSuite.py
+#     python benchmarks/benchmarkSuite.py --scale 2 --baseline benchmarkBaseline.json --tolerance 1.5
+#     python benchmarks/benchmarkSuite.py --case curveCV --legacy
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install()
+
+import curveCVBenchmark
+import reorderAttributeBenchmark
+from bakeEngine import bakeEngine
+from boundingBox import bboxProxy
+from curveCV import curveCV
+from reorderAttribute import reorderEngine
+
+import overrideColor
+
+# Slack on the measured order, for fixed per-run calls like undo chunks
+orderSlack = 0.15
+
+
+def curveExport(curves):
+    return [curveCV.getCurvePoints(curveCV.getCurveShape(curve)) for curve in curves]
+
+
+def curveImport(curves):
+    points = {curveCV.getCurveShape(curve): array for curve, array in zip(curves, curveExport(curves))}
+    cmds.resetCalls()
+    curveCV.applyCurves(curves, points.get)
+
+
+def curveTransfer(curves):
+    """Mirror one 64 CV library shape onto curves of their own CV counts."""
+    source = curveCV.getCurvePoints(curveCV.getCurveShape(curves[0]))[:192]
+    cmds.resetCalls()
+    curveCV.transferCurves(curves, {'libraryShape': source}.get, patterns=[('*', 'libraryShape')], mirror='x')
+
+
+def legacyCurveExport(curves):
+    return [curveCVBenchmark.legacyGetCurvePoints(curveCV.getCurveShape(curve)) for curve in curves]
+
+
+def reorderToTop(controls):
+    for control in controls:
+        order = reorderEngine.getAttrOrder(control)
+        reorderEngine.applyOrder(control, reorderEngine.moveToTop(order, order[-1:]), order)
+
+
+def legacyReorderToTop(controls):
+    for control in controls:
+        reorderAttributeBenchmark.legacyMoveToTop(control, cmds.userAttrs[control][-1])
+
+
+def reorderTemplate(controls):
+    reorderEngine.applyTemplate(controls, sorted(cmds.userAttrs[controls[0]]))
+
+
+def bakeFrames(frames):
+    controls = cmds.buildControls(10, 4, keys=max(2, frames // 5))
+    cmds.resetCalls()
+    bakeEngine.bake(controls, 1, frames)
+
+
+# name: (description, dimension, sizes, build(size), run(scene), expected order)
+cases = {
+    'curveCV.export.cvs': ("read 20 curves", "CVs per curve", (500, 1000, 2000),
+                           lambda size: cmds.buildCurves(20, size), curveExport, 0),
+    'curveCV.export.curves': ("read curves of 200 CVs", "curves", (50, 100, 200),
+                              lambda size: cmds.buildCurves(size, 200), curveExport, 1),
+    'curveCV.import.cvs': ("write 20 curves", "CVs per curve", (500, 1000, 2000),
+                           lambda size: cmds.buildCurves(20, size), curveImport, 0),
+    'curveCV.import.periodic': ("write 20 periodic curves", "CVs per curve", (500, 1000, 2000),
+                                lambda size: cmds.buildCurves(20, size, periodic=True), curveImport, 0),
+    'curveCV.transfer.curves': ("mirror and resample a library shape", "curves", (50, 100, 200),
+                                lambda size: cmds.buildCurves(size, 200), curveTransfer, 1),
+    'reorderAttribute.top': ("last attribute to the top of 20 controls", "attributes", (20, 40, 80),
+                             lambda size: cmds.buildControls(20, size), reorderToTop, 1),
+    'reorderAttribute.template': ("sorted template, 40 attributes", "controls", (50, 100, 200),
+                                  lambda size: cmds.buildControls(size, 40), reorderTemplate, 1),
+    'overrideColor.index': ("index color on shapes", "controls", (500, 1000, 2000),
+                            lambda size: cmds.buildControls(size, 0, layouts=1),
+                            lambda controls: overrideColor.setOverrideColor(controls, 6, shapes=True), 1),
+    'overrideColor.rgb': ("RGB color on transforms", "controls", (500, 1000, 2000),
+                          lambda size: cmds.buildControls(size, 0, layouts=1),
+                          lambda controls: overrideColor.setOverrideColor(controls, (1.0, 0.5, 0.0)), 1),
+    'boundingBox.proxies': ("proxy per mesh of 1000 vertices", "meshes", (50, 100, 200),
+                            lambda size: cmds.buildMeshes(size, 1000), bboxProxy.createProxies, 1),
+    'boundingBox.vertices': ("proxy for 20 meshes", "vertices per mesh", (1000, 2000, 4000),
+                             lambda size: cmds.buildMeshes(20, size), bboxProxy.createProxies, 0),
+    'bakeEngine.frames': ("bake 10 controls", "frames", (100, 200, 400), lambda size: size, bakeFrames, 0),
+}
+
+legacyCases = {
+    'legacy.curveCV.export.cvs': ("original per-CV pointPosition loop", "CVs per curve", (250, 500, 1000),
+                                  lambda size: cmds.buildCurves(5, size), legacyCurveExport, 0),
+    'legacy.reorderAttribute.top': ("original delete/undo loop", "attributes", (20, 40, 80),
+                                    lambda size: cmds.buildControls(5, size), legacyReorderToTop, 1),
+}
+
+
+def measure(build, run, size):
+    """Build a fresh scene of size and run the case on it. Returns (calls, seconds)."""
+    cmds.__init__(cmds.latency)
+    scene = build(size)
+    cmds.resetCalls()
+    start = time.perf_counter()
+    run(scene)
+    return sum(cmds.calls.values()), time.perf_counter() - start
+
+
+def runCase(name, case, scale):
+    """Run a case at every size, return its result and whether it failed."""
+    description, dimension, sizes, build, run, order = case
+    sizes = [max(1, int(size * scale)) for size in sizes]
+    samples = [measure(build, run, size) for size in sizes]
+    calls = [max(1, c) for c, _ in samples]
+    # Order of growth of the calls between the smallest and the largest scene
+    measured = math.log(calls[-1] / calls[0]) / math.log(sizes[-1] / sizes[0])
+    return {"name": name, "description": description, "dimension": dimension, "sizes": sizes,
+            "calls": [c for c, _ in samples], "seconds": [s for _, s in samples], "order": round(measured, 3),
+            "expectedOrder": order, "failed": measured > order + orderSlack}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for the tools on stand-in scenes")
+    parser.add_argument('--case', nargs='+', default=[], help="Only run cases starting with these names")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiply every scene size")
+    parser.add_argument('--latency', type=float, default=20e-6, help="Simulated seconds per cmds call")
+    parser.add_argument('--legacy', action='store_true', help="Also run the original loops, expected to fail")
+    parser.add_argument('--baseline', help="JSON results to compare with, written when it does not exist")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Allowed slowdown against the baseline")
+    parser.add_argument('--output', help="Write the results as JSON")
+    args = parser.parse_args()
+    cmds.latency = args.latency
+
+    selected = dict(cases, **legacyCases) if args.legacy else cases
+    selected = {name: case for name, case in selected.items()
+                if not args.case or any(name.startswith(prefix) or name.startswith('legacy.' + prefix)
+                                        for prefix in args.case)}
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as jsonFile:
+            baseline = {result["name"]: result for result in json.load(jsonFile)}
+
+    results = []
+    failed = []
+    print(f"{'case':<30} {'scaled by':<18} {'calls':>22} {'seconds':>8}  order")
+    for name, case in selected.items():
+        result = runCase(name, case, args.scale)
+        results.append(result)
+        problems = []
+        if result["failed"]:
+            problems.append(f"calls grow with order {result['order']:.2f}, expected {result['expectedOrder']}")
+        previous = baseline.get(name)
+        if previous and previous["sizes"] == result["sizes"] and \
+                result["seconds"][-1] > previous["seconds"][-1] * args.tolerance:
+            problems.append(f"{result['seconds'][-1] / previous['seconds'][-1]:.1f}x slower than the baseline")
+        legacy = name in legacyCases
+        if problems and not legacy:
+            failed.append(name)
+        calls = " > ".join(str(c) for c in result["calls"])
+        status = ("FAILED  " + "; ".join(problems)) if problems else "ok"
+        if legacy:
+            status = "expected failure, " + status if problems else "passed, expected to fail"
+        print(f"{name:<30} {result['dimension']:<18} {calls:>22} {result['seconds'][-1]:8.3f}  "
+              f"{result['order']:5.2f}  {status}")
+
+    if args.baseline and not baseline:
+        with open(args.baseline, 'w') as jsonFile:
+            json.dump(results, jsonFile, indent=4)
+        print(f"Baseline written to {args.baseline}")
+    if args.output:
+        with open(args.output, 'w') as jsonFile:
+            json.dump(results, jsonFile, indent=4)
+    print(f"{len(failed)} case(s) failed" if failed else "All cases within thresholds")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+# Benchmark: duplicate + geomToBBox per mesh vs bboxProxy boxes built from bounds.
+# Runs against the in-memory maya.cmds stand-in, so no Maya licence is needed.
+# Peak memory is measured with tracemalloc, the stand-in keeps vertices as Python
+# tuples so the duplicate path pays for a full copy of every mesh like in Maya.
+#
+#     python benchmarks/boundingBoxBenchmark.py --meshes 50 --vertices 100000
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install()
+
+from boundingBox import bboxCache
+from boundingBox import bboxMath
+from boundingBox import bboxProxy
+
+
+def legacyCommand(selectedGeo):
+    """The original createBoundingBox.command: duplicate every mesh, then geomToBBox the copy."""
+    boxes = []
+    for geo in selectedGeo:
+        dup = cmds.duplicate(geo, n=bboxProxy.getProxyName(geo))[0]
+        boxes.append(cmds.geomToBBox(dup, n=dup, single=True)[0])
+    return boxes
+
+
+def buildLayout(groupCount, propCount):
+    """A layout scene of small props spread over a few sets, each set under its own group."""
+    cmds.__init__(cmds.latency)
+    random.seed(4)
+    props = []
+    for p in range(propCount):
+        group = f"set{p % groupCount}_grp"
+        cmds.parents[group] = "layout_grp"
+        x, z = (p % groupCount) * 100.0 + random.uniform(0, 80), random.uniform(0, 80)
+        matrix = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, x, 0, z, 1]
+        props.append(cmds.addMesh(f"prop{p}_geo", [(0, 0, 0), (1, 2, 1)], matrix, parent=group))
+    return props
+
+
+def buildScene(meshCount, vertexCount):
+    cmds.__init__(cmds.latency)
+    random.seed(3)
+    meshes = []
+    for m in range(meshCount):
+        points = [(random.uniform(-1, 2), random.uniform(0, 3), random.uniform(-2, 1)) for _ in range(vertexCount)]
+        angle = m * 0.3
+        c, s = math.cos(angle), math.sin(angle)
+        matrix = [c, 0, -s, 0, 0, 1, 0, 0, s, 0, c, 0, m * 5.0, 0, 1.0, 1]
+        meshes.append(cmds.addMesh(f"prop{m}_geo", points, matrix))
+    return meshes
+
+
+def worldCorners(box):
+    mesh = cmds.meshes[box]
+    return sorted(bboxMath.transformPoint(p, mesh["matrix"]) for p in mesh["points"])
+
+
+def run(label, func, meshes):
+    cmds.resetCalls()
+    tracemalloc.start()
+    start = time.perf_counter()
+    boxes = func(meshes)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:<20} {seconds:8.3f}s  {sum(cmds.calls.values()):6d} calls  {peak / 2 ** 20:8.1f} MB peak")
+    return seconds, [worldCorners(box) for box in boxes]
+
+
+def checkReferenceClouds():
+    """Oriented boxes of rotated box shaped point clouds must contain every point and match the true volume."""
+    random.seed(5)
+    for size, angles in (((10, 2, 0.4), (0.6, 0.0, 0.0)), ((3, 1, 1), (0.3, 1.1, -0.4)), ((1, 1, 1), (0, 0, 0)),
+                         ((8, 0.01, 4), (0.2, 0.9, 0.5))):
+        rotation = bboxMath.identity
+        for axis, angle in enumerate(angles):
+            c, s = math.cos(angle), math.sin(angle)
+            turn = [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+            i, j = [(1, 2), (0, 2), (0, 1)][axis]
+            turn[i * 4 + i], turn[i * 4 + j], turn[j * 4 + i], turn[j * 4 + j] = c, s, -s, c
+            rotation = bboxMath.multiplyMatrix(rotation, turn)
+        placement = rotation[:12] + (1.0, -2.0, 3.0, 1.0)
+        points = []
+        for _ in range(20000):
+            local = [random.uniform(-0.5, 0.5) * extent for extent in size]
+            points.extend(bboxMath.transformPoint(local, placement))
+        # The corners make sure the true box is reached
+        for corner in bboxMath.boxCorners([-e * 0.5 for e in size], [e * 0.5 for e in size]):
+            points.extend(bboxMath.transformPoint(corner, placement))
+        bbMin, bbMax, matrix = bboxMath.orientedBounds(points, maxSamples=5000)
+        trueVolume = size[0] * size[1] * size[2]
+        assert bboxMath.boxVolume(bbMin, bbMax) <= trueVolume * 1.05, f"Oriented box of {size} is too big"
+        axes = (matrix[0:3], matrix[4:7], matrix[8:11])
+        low, high = bboxMath.projectedBounds(points, axes)
+        assert all(a >= b - 1e-9 for a, b in zip(low, bbMin)) and all(a <= b + 1e-9 for a, b in zip(high, bbMax)), \
+            "Oriented box does not contain every point"
+    print("  reference point clouds ok")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bounding box proxy benchmark")
+    parser.add_argument('--meshes', type=int, default=50)
+    parser.add_argument('--vertices', type=int, default=100000)
+    parser.add_argument('--props', type=int, default=20000, help="Props in the grouped proxy layout scene")
+    parser.add_argument('--groups', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=20e-6, help="Simulated seconds per cmds call")
+    args = parser.parse_args()
+    cmds.latency = args.latency
+    print(f"{args.meshes} meshes x {args.vertices} vertices, {args.latency * 1e6:.0f}us per cmds call")
+
+    legacySeconds, legacyBoxes = run("duplicate+geomToBBox", legacyCommand, buildScene(args.meshes, args.vertices))
+    proxySeconds, proxyBoxes = run("bboxProxy", bboxProxy.createProxies, buildScene(args.meshes, args.vertices))
+    for legacyCorners, proxyCorners in zip(legacyBoxes, proxyBoxes):
+        assert all(abs(a - b) < 1e-6 for p, q in zip(legacyCorners, proxyCorners) for a, b in zip(p, q)), \
+            "bboxProxy boxes do not match geomToBBox"
+    print(f"  speedup              {legacySeconds / proxySeconds:8.1f}x")
+
+    print("oriented boxes")
+    checkReferenceClouds()
+    meshes = buildScene(min(args.meshes, 3), args.vertices)
+    worldVolume = sum(bboxMath.boxVolume(*bboxMath.worldBounds(*bounds)) for bounds in bboxProxy.getBounds(meshes))
+    for label, maxSamples in (("every vertex", args.vertices), ("5000 samples", 5000)):
+        start = time.perf_counter()
+        boxes = bboxProxy.createOrientedProxies(meshes, maxSamples)
+        seconds = time.perf_counter() - start
+        volume = sum(bboxMath.boxVolume(cmds.meshes[box]["bounds"][:3], cmds.meshes[box]["bounds"][3:]) for box in boxes)
+        print(f"  {label:<20} {seconds:8.3f}s  {volume / worldVolume:6.1%} of the world aligned volume")
+
+    print("oriented boxes with a bounds cache")
+    # Cold cache, unchanged scene, then a scene with one mesh edited
+    with tempfile.TemporaryDirectory(prefix='bboxCache_') as folderPath:
+        cache = bboxCache.BoundsCache(os.path.join(folderPath, 'bboxCache.json'))
+        meshes = buildScene(min(args.meshes, 10), args.vertices // 10)
+        for label in ("cold cache", "warm cache", "one mesh edited"):
+            if label == "one mesh edited":
+                mesh = cmds.meshes[meshes[0]]
+                mesh["points"][0] = (5.0, 5.0, 5.0)
+                mesh["bounds"] = mayaStandIn._bounds(mesh["points"])
+            cache.hits = cache.misses = 0
+            start = time.perf_counter()
+            bboxProxy.createOrientedProxies(meshes, cache=cache)
+            seconds = time.perf_counter() - start
+            print(f"  {label:<20} {seconds:8.3f}s  {cache.misses:4d} recomputed  {cache.hits:4d} from cache")
+            # Reload from disk, like the next session would
+            cache.save()
+            cache = bboxCache.BoundsCache(cache.filePath)
+
+    print(f"layout of {args.props} props in {args.groups} groups")
+    for label, options in (("per object", None), ("per parent", {"groupBy": 'parent'}),
+                           ("per level 1", {"groupBy": 'level', "level": 1}),
+                           ("per 200 unit cell", {"groupBy": 'cluster', "cellSize": 200.0})):
+        props = buildLayout(args.groups, args.props)
+        cmds.resetCalls()
+        start = time.perf_counter()
+        if options is None:
+            boxes = bboxProxy.createProxies(props)
+        else:
+            boxes = bboxProxy.createGroupedProxies(props, **options)
+        print(f"  {label:<20} {time.perf_counter() - start:8.3f}s  {sum(cmds.calls.values()):6d} calls  "
+              f"{len(boxes):6d} proxies")
+        if options and options["groupBy"] == 'level':
+            corners = [bboxMath.transformPoint(p, cmds.meshes[prop]["matrix"]) for prop in props
+                       for p in cmds.meshes[prop]["points"]]
+            expected = [min(p[i] for p in corners) for i in range(3)] + [max(p[i] for p in corners) for i in range(3)]
+            boxCorners = worldCorners(boxes[0])
+            assert all(abs(a - b) < 1e-6 for a, b in zip(boxCorners[0] + boxCorners[-1], expected)), \
+                "Grouped proxy does not cover the layout"
+
+
+if __name__ == "__main__":
+    main()
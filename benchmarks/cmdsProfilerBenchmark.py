@@ -0,0 +1,88 @@
+# Benchmark: overhead of cmdsProfiler per command call, and a sample report.
+# The counts of the profiler are checked against the stand-in's own counters, on
+# reorderEngine through maya.cmds and on the same moves through pymel.core.
+#
+#     python benchmarks/cmdsProfilerBenchmark.py --calls 200000
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install(pymel=True)
+
+import maya.cmds
+import pymel.core as pm
+
+from cmdsProfiler import cmdsProfiler
+from reorderAttribute import reorderEngine
+
+
+def callLoop(count):
+    start = time.perf_counter()
+    for _ in range(count):
+        maya.cmds.getAttr('ctrl0.overrideColor')
+    return (time.perf_counter() - start) / count
+
+
+def reorderWithPymel(controls):
+    """reorderEngine's moves, called through pymel.core like the original reorderAttribute."""
+    for control in controls:
+        order = pm.listAttr(control, userDefined=True)
+        locked = pm.listAttr(control, userDefined=True, locked=True) or []
+        for attr in locked:
+            pm.setAttr(f"{control}.{attr}", lock=False)
+        for attr in reorderEngine.planMoves(order, order[-1:] + order[:-1]):
+            pm.deleteAttr(control, at=attr)
+            pm.undo()
+        for attr in locked:
+            pm.setAttr(f"{control}.{attr}", lock=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Command profiler benchmark")
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--controls', type=int, default=10)
+    parser.add_argument('--attrs', type=int, default=40)
+    args = parser.parse_args()
+    cmds.latency = 0.0
+
+    cmds.buildControls(1, 0)
+    plain = callLoop(args.calls)
+    with cmdsProfiler.CommandProfiler(printReport=False):
+        profiled = callLoop(args.calls)
+    with cmdsProfiler.CommandProfiler(printReport=False, flameGraph=os.devnull):
+        stacked = callLoop(args.calls)
+    print(f"{args.calls} getAttr calls, no simulated latency")
+    print(f"  plain             {plain * 1e6:6.2f}us per call")
+    print(f"  profiled          {profiled * 1e6:6.2f}us per call  +{(profiled - plain) * 1e6:.2f}us")
+    print(f"  with flame graph  {stacked * 1e6:6.2f}us per call  +{(stacked - plain) * 1e6:.2f}us")
+    assert maya.cmds.getAttr == cmds.getAttr, "Commands were not restored"
+
+    cmds.latency = 20e-6
+    with tempfile.TemporaryDirectory(prefix='cmdsProfiler_') as folderPath:
+        for label, func in (("reorderEngine", lambda controls: [reorderEngine.applyOrder(
+                                control, cmds.userAttrs[control][-1:] + cmds.userAttrs[control][:-1])
+                                for control in controls]),
+                            ("through pymel", reorderWithPymel)):
+            cmds.__init__(cmds.latency)
+            controls = cmds.buildControls(args.controls, args.attrs)
+            cmds.resetCalls()
+            flameGraph = os.path.join(folderPath, 'reorder.folded')
+            with cmdsProfiler.CommandProfiler(label, top=4, flameGraph=flameGraph) as profiler:
+                func(controls)
+            # pymel.core forwards to the stand-in directly, so each command is seen once either way
+            counts = {name.split('.', 1)[1]: stats.count for name, stats in profiler.stats.items()}
+            assert counts == dict(cmds.calls), "Profiled counts do not match the stand-in"
+            with open(flameGraph, 'r') as foldedFile:
+                lines = foldedFile.read().splitlines()
+            print(f"  {len(lines)} collapsed stacks, e.g. {lines[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# Benchmark: per-CV pointPosition/move loops vs bulk curveCV.getCurvePoints/setCurvePoints.
+# Runs against the in-memory maya.cmds stand-in, so no Maya licence is needed.
+#
+#     python benchmarks/curveCVBenchmark.py --curves 20 --cvs 2000
+
+import argparse
+import os
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install()
+
+from curveCV import curveCV
+from curveCV import curveRetarget
+
+
+def legacyGetCurvePoints(curveName):
+    """The original export loop: one pointPosition call per CV."""
+    cvs = cmds.ls(f"{curveName}.cv[*]", fl=True)
+    pointList = []
+    for cv in cvs:
+        pointList.append(cmds.pointPosition(cv))
+    return pointList
+
+
+def legacySetCurvePoints(curveName, pointList):
+    """The original import loop: re-flatten cv[*], then one move call per CV."""
+    cvs = cmds.ls(f"{curveName}.cv[*]", fl=True)
+    for i, cv in enumerate(cvs):
+        cmds.move(pointList[i][0], pointList[i][1], pointList[i][2], cv)
+
+
+def timeCurves(func, shapes, *args):
+    cmds.resetCalls()
+    start = time.perf_counter()
+    results = [func(shape, *[arg[n] for arg in args]) for n, shape in enumerate(shapes)]
+    return time.perf_counter() - start, sum(cmds.calls.values()), results
+
+
+def samePoints(a, b, tolerance=1e-9):
+    return len(a) == len(b) and all(abs(u - v) <= tolerance for p, q in zip(a, b) for u, v in zip(p, q))
+
+
+def report(label, totalCVs, legacy, bulk):
+    print(label)
+    for name, (seconds, calls, _) in (("per-CV loop", legacy), ("bulk", bulk)):
+        print(f"  {name:<12} {seconds:8.3f}s  {calls:7d} calls  {totalCVs / seconds:12.0f} CVs/s")
+    print(f"  speedup      {legacy[0] / bulk[0]:8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Curve CV export benchmark")
+    parser.add_argument('--curves', type=int, default=20)
+    parser.add_argument('--cvs', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=20e-6, help="Simulated seconds per cmds call")
+    args = parser.parse_args()
+
+    cmds.latency = args.latency
+    shapes = []
+    for c in range(args.curves):
+        points = [(c, i * 0.1, -i * 0.2) for i in range(args.cvs)]
+        # Translated transforms, so the world to object space conversion is exercised
+        matrix = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, c, 1.5, -2.0, 1]
+        shapes.append(cmds.shapes[cmds.addCurve(f"curve{c}", points, matrix)])
+    totalCVs = args.curves * args.cvs
+    print(f"{args.curves} curves x {args.cvs} CVs, {args.latency * 1e6:.0f}us per cmds call")
+
+    legacy = timeCurves(legacyGetCurvePoints, shapes)
+    bulk = timeCurves(curveCV.getCurvePoints, shapes)
+    for legacyPoints, bulkPoints in zip(legacy[2], bulk[2]):
+        assert samePoints(curveCV.pointsToList(bulkPoints), legacyPoints), "Bulk export does not match the per-CV loop"
+    report("export", totalCVs, legacy, bulk)
+
+    targets = [[[x + 1.0, y, z] for x, y, z in cmds.worldPoints(shape)] for shape in shapes]
+    legacy = timeCurves(legacySetCurvePoints, shapes, targets)
+    legacyResults = [cmds.worldPoints(shape) for shape in shapes]
+    bulk = timeCurves(curveCV.setCurvePoints, shapes, [curveCV.listToPoints(t) for t in targets])
+    for shape, legacyPoints in zip(shapes, legacyResults):
+        assert samePoints(cmds.worldPoints(shape), legacyPoints), "Bulk import does not match the per-CV loop"
+    report("import", totalCVs, legacy, bulk)
+
+    # One library shape and its mirror onto controls of every CV count
+    source = curveCV.getCurvePoints(shapes[0])
+    controls = [cmds.addCurve(f"R_ctrl{n}", [(0.0, 0.0, 0.0)] * (4 + n % 20)) for n in range(args.curves * 10)]
+    cmds.resetCalls()
+    start = time.perf_counter()
+    curveCV.transferCurves(controls, {shapes[0]: source}.get, patterns=[('*', shapes[0])], mirror='x')
+    seconds = time.perf_counter() - start
+    mirrored = curveRetarget.mirrorPoints(source, 'x')
+    for control in controls:
+        pointList = cmds.worldPoints(cmds.shapes[control])
+        ends = curveCV.pointsToList(mirrored[:3] + mirrored[-3:])
+        assert samePoints([pointList[0], pointList[-1]], ends, 1e-6), "Transferred shape does not keep its end points"
+        # The source CVs lie on a line, so resampled CVs must be evenly spaced on it
+        lengths = curveRetarget.arcLengths(curveCV.listToPoints(pointList))
+        steps = [b - a for a, b in zip(lengths, lengths[1:])]
+        assert max(steps) - min(steps) < 1e-6 * lengths[-1], "Transferred CVs are not evenly spaced"
+    print("transfer")
+    print(f"  {len(controls)} curves   {seconds:8.3f}s  {sum(cmds.calls.values()):6d} calls  "
+          f"{cmds.calls['setAttr']} setAttr")
+
+    # Periodic curves only list their unique CVs, the import must not reject them and must keep them closed
+    periodic = cmds.buildCurves(args.curves, 8, periodic=True)
+    moved = {cmds.shapes[curve]: array('d', (value + 1.0 for value in curveCV.getCurvePoints(cmds.shapes[curve])))
+             for curve in periodic}
+    curveCV.applyCurves(periodic, moved.get)
+    for shape, points in moved.items():
+        assert samePoints(cmds.worldPoints(shape), curveCV.pointsToList(points), 1e-6), \
+            "Periodic curves are not imported"
+        assert cmds.overlapClosed(shape), "The overlapping CVs of a periodic curve were not set"
+    print(f"periodic\n  {len(periodic)} curves of 8 CVs imported")
+
+    # A square loop onto periodic curves, every count splits each side into whole steps
+    square = [(1.0, 0.0, 1.0), (-1.0, 0.0, 1.0), (-1.0, 0.0, -1.0), (1.0, 0.0, -1.0)]
+    loops = [cmds.addCurve(f"C_ctrl{n}", [(0.0, 0.0, 0.0)] * (4 * (n % 4 + 1)), periodic=True) for n in range(args.curves)]
+    curveCV.transferCurves(loops, {'squareShape': curveCV.listToPoints(square)}.get, patterns=[('*', 'squareShape')])
+    for loop in loops:
+        pointList = cmds.worldPoints(cmds.shapes[loop])
+        assert samePoints(pointList[:1], square[:1]), "Transferred loop does not start on the source's first CV"
+        assert all(abs(max(abs(x), abs(z)) - 1.0) < 1e-9 for x, _, z in pointList), "Transferred loop is off the shape"
+        lengths = curveRetarget.arcLengths(curveCV.listToPoints(pointList + pointList[:1]))
+        steps = [b - a for a, b in zip(lengths, lengths[1:])]
+        assert abs(lengths[-1] - 8.0) < 1e-9, "Transferred loop does not go around the whole square"
+        assert max(steps) - min(steps) < 1e-9, "Transferred loop CVs are not evenly spaced around the loop"
+        assert cmds.overlapClosed(cmds.shapes[loop]), "Transferred loop is not closed"
+    print(f"  {len(loops)} square loops transferred onto periodic curves")
+
+    # Mirroring leaves curves without a source alone and carries on with the rest
+    line = [(1.0, 0.0, 0.0), (2.0, 1.0, 0.0), (3.0, 0.0, 0.0)]
+    sides = [cmds.addCurve(name, line) for name in ("L_arm", "R_arm", "C_spine", "R_leg")]
+    curveCV.mirrorCurves(sides)
+    assert samePoints(cmds.worldPoints("R_armShape"), [(-x, y, z) for x, y, z in line]), "R_arm is not mirrored"
+    for name in ("L_arm", "C_spine", "R_leg"):
+        assert samePoints(cmds.worldPoints(cmds.shapes[name]), line), f"{name} has no source but was changed"
+    print("mirror\n  unmatched and sourceless curves skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Import time budget for the collection, like python -X importtime.
+# Every module is imported in a fresh interpreter with the maya.cmds stand-in
+# installed. The benchmark reports the cumulative import time from -X importtime,
+# the Maya commands run during the import and the heavy UI modules it pulled in.
+# A module fails when it runs Maya commands, loads PySide, PyMEL or OpenMayaUI, or
+# goes over the budget. The exit code is 1 when any module fails, so this can
+# gate a shelf or farm deployment.
+# Modules that need PySide to import at all are skipped when it is not installed.
+#
+#     python benchmarks/importTimeBenchmark.py --budget 50
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+modules = [
+    'mayaUtils',
+    'bakeEngine.bakeEngine',
+    'bakeEngine.bakeCli',
+    'bakeEngine.bakeParallel',
+    'bakeEngine.keyReduction',
+    'bakeEngine.bakeProfile',
+    'bakeEngine.bakeCache',
+    'boundingBox.bboxProxy',
+    'cmdsProfiler.cmdsProfiler',
+    'createBoundingBox',
+    'curveCV.curveCV',
+    'overrideColor',
+    'quoteGen.quoteGen',
+    'reorderAttribute.reorderAttribute',
+    'bakeAnimationTool',
+    'simpleSliderUI_PySide',
+]
+
+# UI modules that may only be loaded when a window is opened
+heavyModules = ('PySide2', 'PySide6', 'shiboken2', 'shiboken6', 'pymel', 'maya.OpenMayaUI')
+
+# Modules that define their Qt widgets at import, they need PySide to be importable
+qtModules = ('bakeAnimationTool', 'simpleSliderUI_PySide')
+
+_importScript = """
+import json, sys
+sys.path[:0] = [{root!r}, {benchmarks!r}]
+import mayaStandIn
+cmds = mayaStandIn.install()
+import {name}
+print(json.dumps({{"calls": sum(cmds.calls.values()),
+                  "heavy": [name for name in sys.modules if name.split('.')[0] in {heavy!r} or name in {heavy!r}]}}))
+"""
+
+
+def importModule(name):
+    """Import name in a fresh interpreter. Returns (milliseconds, Maya calls, heavy modules), or an error string."""
+    script = _importScript.format(root=root, benchmarks=os.path.join(root, 'benchmarks'), name=name,
+                                  heavy=heavyModules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output=True, text=True)
+    if result.returncode:
+        return result.stderr.strip().splitlines()[-1]
+    milliseconds = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split('|')
+        if line.startswith('import time:') and len(fields) == 3 and fields[2].strip() == name:
+            milliseconds = int(fields[1]) / 1000.0
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return milliseconds, data["calls"], data["heavy"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time budget benchmark")
+    parser.add_argument('--budget', type=float, default=50.0, help="Milliseconds allowed per module import")
+    args = parser.parse_args()
+
+    hasQt = any(importlib.util.find_spec(name) for name in ('PySide2', 'PySide6'))
+    failed = []
+    print(f"budget {args.budget:.0f}ms per module")
+    for name in modules:
+        if name in qtModules and not hasQt:
+            print(f"  {name:<36} skipped, PySide is not installed")
+            continue
+        result = importModule(name)
+        if isinstance(result, str):
+            failed.append(name)
+            print(f"  {name:<36} FAILED  {result}")
+            continue
+        milliseconds, calls, heavy = result
+        problems = []
+        if milliseconds > args.budget:
+            problems.append("over budget")
+        if calls:
+            problems.append(f"{calls} Maya calls")
+        if heavy and name not in qtModules:
+            problems.append("loads " + ", ".join(sorted(heavy)))
+        if problems:
+            failed.append(name)
+        print(f"  {name:<36} {milliseconds:7.1f}ms  " + ("FAILED  " + "; ".join(problems) if problems else "ok"))
+
+    print(f"{len(failed)} module(s) failed" if failed else "All modules within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,713 @@
+# In-memory stand-in for maya.cmds, used to benchmark the tools outside Maya.
+# install() registers fake 'maya' and 'maya.cmds' modules. Every command call is
+# counted and costs a simulated per-call latency, which is what makes
+# per-component command loops slow inside a real Maya session.
+# The scene holds NURBS curves, and plugs driven by anim curves or by driver
+# functions of time, which stand in for constraints and expressions.
+# Meshes are transforms with a world matrix and a vertex list. Their bounds are
+# cached like Maya caches a shape's bounding box, duplicating copies every vertex.
+# Nodes with user-defined attributes model Maya's attribute order: deleteAttr
+# followed by undo re-creates the attribute at the end of the list.
+# Any other plug of a known node, e.g. 'ctrl.overrideColor', is a plain stored value.
+# buildCurves, buildControls and buildMeshes make scalable synthetic scenes, and
+# install(pymel=True) also registers a pymel.core that forwards to the same scene
+# with PyMEL's extra per-call overhead.
+
+import fnmatch
+import math
+import random
+import re
+import sys
+import time
+import types
+from collections import Counter
+
+_plugRe = re.compile(r"^(?P<node>[^.]+)\.(?P<attr>\w+)(\[(?P<index>\*|\d+(:\d+)?)\])?$")
+
+# Values of plugs that were never set
+_defaultValues = {'overrideEnabled': False, 'overrideRGBColors': False, 'overrideColor': 0,
+                  'overrideColorRGB': [(0.0, 0.0, 0.0)], 'visibility': True}
+
+# Keyable attributes of every transform
+_channels = ('translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ',
+             'visibility')
+
+# Long names of the short attribute names the channel box gives
+_longNames = {'tx': 'translateX', 'ty': 'translateY', 'tz': 'translateZ', 'rx': 'rotateX', 'ry': 'rotateY',
+              'rz': 'rotateZ', 'sx': 'scaleX', 'sy': 'scaleY', 'sz': 'scaleZ', 'v': 'visibility'}
+
+_identity = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+
+def _toWorld(point, m):
+    x, y, z = point
+    return [x * m[0] + y * m[4] + z * m[8] + m[12],
+            x * m[1] + y * m[5] + z * m[9] + m[13],
+            x * m[2] + y * m[6] + z * m[10] + m[14]]
+
+
+def _bounds(points):
+    return [min(p[i] for p in points) for i in range(3)] + [max(p[i] for p in points) for i in range(3)]
+
+
+class StandInCmds(object):
+    def __init__(self, latency=20e-6):
+        self.latency = latency
+        self.calls = Counter()
+        self.curves = {}  # shape name -> list of local [x, y, z]
+        self.matrices = {}  # shape name -> world matrix as 16 floats
+        self.shapes = {}  # transform name -> shape name
+        self.selection = []
+        self.undoChunks = 0
+        self.openUndoChunks = 0
+        self.refreshSuspended = False
+        self.connections = {}  # destination plug -> source plug
+        self.animCurves = {}  # anim curve name -> {time: value}
+        self.drivers = {}  # driver node -> function of time, stands in for constraints and expressions
+        self.clipboard = None
+        self.meshes = {}  # mesh transform -> {"points": local vertices, "matrix": world matrix, "bounds": min + max}
+        self.parents = {}  # DAG node -> parent node
+        self.userAttrs = {}  # node -> user-defined attribute names in creation order
+        self.lockedAttrs = set()  # 'node.attr' plugs that are locked
+        self.undoQueue = []
+        self.values = {}  # 'node.attr' -> value of plain plugs
+        self.tangents = {}  # (anim curve, keyTangent flag) -> {time: value} of the keys that are set
+        self._nameCount = 0
+
+    def _call(self, name):
+        """Count a command call and spend the simulated latency."""
+        self.calls[name] += 1
+        if self.latency:
+            end = time.perf_counter() + self.latency
+            while time.perf_counter() < end:
+                pass
+
+    def _exists(self, node):
+        return (node in self.curves or node in self.shapes or node in self.meshes or node in self.userAttrs
+                or node in self.parents or node in self.animCurves or node in self.drivers)
+
+    def _plug(self, item):
+        """Split 'node.attr[index]' into node, attribute and a list of indices, node as a short name."""
+        match = _plugRe.match(item.rsplit('|', 1)[-1])
+        if not match or not self._exists(match.group('node')):
+            raise ValueError(f"No object matches name: {item}")
+        node, index = match.group('node'), match.group('index')
+        attr = 'cv' if match.group('attr') == 'controlPoints' else match.group('attr')
+        if node not in self.curves:
+            return node, attr, None
+        if index is None:
+            return node, attr, None
+        if index == '*':
+            # controlPoints holds every CV, cv[*] leaves out the overlap of a periodic curve
+            count = len(self.curves[node]) if match.group('attr') == 'controlPoints' else self._cvCount(node)
+            return node, attr, list(range(count))
+        start, _, end = index.partition(':')
+        return node, attr, list(range(int(start), int(end or start) + 1))
+
+    # Scene building helpers, not part of maya.cmds
+
+    def addCurve(self, name, points, matrix=None, periodic=False):
+        """Create a curve transform 'name' with shape 'nameShape' and local CV positions.
+
+        A periodic curve (form 2) of degree 3 gets the given points as its unique
+        CVs, followed by the first 3 again, like Maya's controlPoints.
+        """
+        shape = name + "Shape"
+        self.shapes[name] = shape
+        self.curves[shape] = [list(p) for p in points]
+        self.matrices[shape] = list(matrix or _identity)
+        if periodic:
+            self.values[f"{shape}.form"] = 2
+            self.curves[shape] += [list(p) for p in points[:3]]
+        return name
+
+    def _cvCount(self, shape):
+        """The CVs cv[*] lists, without the overlap of a periodic curve."""
+        return len(self.curves[shape]) - (3 if self.values.get(f"{shape}.form") == 2 else 0)
+
+    def worldPoints(self, shape):
+        """World positions of the CVs cv[*] lists."""
+        return [_toWorld(p, self.matrices[shape]) for p in self.curves[shape][:self._cvCount(shape)]]
+
+    def overlapClosed(self, shape):
+        """True when the overlapping CVs of a periodic curve match the first ones."""
+        points = self.curves[shape]
+        return points[self._cvCount(shape):] == points[:len(points) - self._cvCount(shape)]
+
+    def addDriver(self, name, func):
+        """Create a driver node whose output plugs evaluate func(time), like a constraint."""
+        self.drivers[name] = func
+        return name
+
+    def addAnimCurve(self, name, keys):
+        """Create an anim curve from a {time: value} dict."""
+        self.animCurves[name] = dict(keys)
+        return name
+
+    def drive(self, plug, source):
+        self.connections[plug] = source
+
+    def animCurveOf(self, plug):
+        """Return the keys of the anim curve connected to plug."""
+        return self.animCurves[self.connections[plug].split('.')[0]]
+
+    def evaluate(self, plug, t):
+        """Value of plug at time t. Curves use a simple spline that depends on the neighbouring keys."""
+        source = self.connections.get(plug)
+        if source is None:
+            return 0.0
+        node = source.split('.')[0]
+        if node in self.drivers:
+            return self.drivers[node](t)
+        keys = self.animCurves[node]
+        times = sorted(keys)
+        if t <= times[0]:
+            return keys[times[0]]
+        if t >= times[-1]:
+            return keys[times[-1]]
+        for i, (a, b) in enumerate(zip(times, times[1:])):
+            if a <= t <= b:
+                u = (t - a) / (b - a)
+                before = keys[times[i - 1]] if i else keys[a]
+                after = keys[times[i + 2]] if i + 2 < len(times) else keys[b]
+                return keys[a] + (keys[b] - keys[a]) * u + 0.1 * (after - before) * u * (1 - u)
+
+    def addMesh(self, name, points, matrix=None, parent=None):
+        """Create a mesh transform with local vertex positions and a world matrix, under parent."""
+        if parent:
+            self.parents[name] = parent
+        points = [tuple(p) for p in points]
+        self.meshes[name] = {"points": points, "matrix": list(matrix or _identity), "bounds": _bounds(points)}
+        return name
+
+    def addNode(self, name, attributes=(), locked=()):
+        """Create a node with user-defined attributes, some of them locked."""
+        self.userAttrs[name] = list(attributes)
+        self.lockedAttrs.update(f"{name}.{attr}" for attr in locked)
+        return name
+
+    def _newName(self, prefix):
+        self._nameCount += 1
+        return f"{prefix}{self._nameCount}"
+
+    def resetCalls(self):
+        self.calls.clear()
+
+    def buildCurves(self, count, cvCount, seed=1, periodic=False):
+        """count curves of cvCount CVs each, every one with its own rotated and moved world matrix."""
+        random.seed(seed)
+        curves = []
+        for n in range(count):
+            c, s = math.cos(n * 0.7), math.sin(n * 0.7)
+            matrix = [c, 0.0, -s, 0.0, 0.0, 1.0, 0.0, 0.0, s, 0.0, c, 0.0, n * 2.0, 1.0, -n, 1.0]
+            points = [(random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5)) for _ in range(cvCount)]
+            curves.append(self.addCurve(f"curve{n}", points, matrix, periodic))
+        return curves
+
+    def buildControls(self, count, attrCount, layouts=4, keys=24, seed=2):
+        """count curve controls with attrCount shuffled user attributes, every 7th one locked.
+
+        Controls share 'layouts' attribute orders, like the controls of a rig. translateX
+        is driven like a constraint and rotateX by an anim curve of 'keys' keys.
+        """
+        random.seed(seed)
+        orders = []
+        for _ in range(layouts):
+            attributes = [f"attr{a:03d}" for a in range(attrCount)]
+            random.shuffle(attributes)
+            orders.append(attributes)
+        controls = []
+        for n in range(count):
+            control = self.addCurve(f"ctrl{n}", [(x, 0.0, z) for x, z in ((1, 0), (0, 1), (-1, 0), (0, -1))])
+            self.addNode(control, orders[n % layouts], locked=orders[n % layouts][::7])
+            self.drive(f"{control}.translateX", self.addDriver(f"constraint{n}", lambda t, n=n: math.sin(t * 0.1 + n)) + '.o')
+            curveKeys = {float(k * 5): math.cos(k + n) * 45 for k in range(keys)}
+            self.drive(f"{control}.rotateX", self.addAnimCurve(f"{control}_rotateX", curveKeys) + '.output')
+            controls.append(control)
+        return controls
+
+    def buildMeshes(self, count, vertexCount, seed=3):
+        """count meshes of vertexCount random vertices, each turned and moved along x."""
+        random.seed(seed)
+        meshes = []
+        for m in range(count):
+            points = [(random.uniform(-1, 2), random.uniform(0, 3), random.uniform(-2, 1)) for _ in range(vertexCount)]
+            c, s = math.cos(m * 0.3), math.sin(m * 0.3)
+            matrix = [c, 0, -s, 0, 0, 1, 0, 0, s, 0, c, 0, m * 5.0, 0, 1.0, 1]
+            meshes.append(self.addMesh(f"prop{m}_geo", points, matrix))
+        return meshes
+
+    # Commands
+
+    def ls(self, *args, selection=False, sl=False, fl=False, type=None, showType=False, **kwargs):
+        self._call('ls')
+        if selection or sl:
+            return list(self.selection)
+        if type or showType:
+            # Node lists only, e.g. from listHistory
+            items = [i for arg in args for i in ([arg] if isinstance(arg, str) else arg)]
+            if type:
+                items = [item for item in items if self._nodeType(item).startswith(type)]
+            return [value for item in items for value in (item, self._nodeType(item))] if showType else items
+        result = []
+        for item in [i for arg in args for i in ([arg] if isinstance(arg, str) else arg)]:
+            item = item.rsplit('|', 1)[-1]
+            if self._exists(item):
+                if kwargs.get('uuid'):
+                    # Every copy of a referenced file has the same UUIDs
+                    result.append(f"uuid-{item.rsplit(':', 1)[-1]}")
+                    continue
+                path = [item]
+                while path[0] in self.parents:
+                    path.insert(0, self.parents[path[0]])
+                # Anim curves and drivers are not DAG nodes, they have no path
+                dag = item not in self.animCurves and item not in self.drivers
+                result.append('|' + '|'.join(path) if kwargs.get('long') and dag else item)
+                continue
+            node, attr, indices = self._plug(item)
+            if fl:
+                result.extend(f"{node}.{attr}[{i}]" for i in indices)
+            else:
+                result.append(f"{node}.{attr}[{indices[0]}:{indices[-1]}]")
+        return result
+
+    def objExists(self, name):
+        self._call('objExists')
+        return self._exists(name.rsplit('|', 1)[-1])
+
+    def listRelatives(self, nodes, s=False, shapes=False, type=None, **kwargs):
+        self._call('listRelatives')
+        nodes = [nodes] if isinstance(nodes, str) else nodes
+        if type == 'mesh':
+            # A mesh transform stands in for its own shape
+            return [node for node in nodes if node in self.meshes] or None
+        result = [(node + '|' if kwargs.get('fullPath') else '') + self.shapes[node.rsplit('|', 1)[-1]]
+                  for node in nodes if (s or shapes) and node.rsplit('|', 1)[-1] in self.shapes]
+        return result or None
+
+    def pointPosition(self, item, **kwargs):
+        self._call('pointPosition')
+        node, attr, indices = self._plug(item)
+        return _toWorld(self.curves[node][indices[0]], self.matrices[node])
+
+    def xform(self, item, q=False, query=False, ws=False, t=False, boundingBox=False, matrix=None, **kwargs):
+        self._call('xform')
+        if isinstance(item, list):
+            # Single vertices, 'mesh.vtx[i]'
+            result = []
+            for vertex in item:
+                node, index = vertex[:-1].split('.vtx[')
+                result.extend(_toWorld(self.meshes[node]["points"][int(index)], self.meshes[node]["matrix"]))
+            return result
+        if item.endswith('.vtx[*]') and item[:-7] in self.meshes:
+            mesh = self.meshes[item[:-7]]
+            return [value for point in mesh["points"] for value in _toWorld(point, mesh["matrix"])]
+        if item in self.meshes:
+            mesh = self.meshes[item]
+            if boundingBox:
+                if not (ws or kwargs.get('worldSpace')):
+                    return list(mesh["bounds"])
+                low, high = mesh["bounds"][:3], mesh["bounds"][3:]
+                corners = [_toWorld((x, y, z), mesh["matrix"]) for x in (low[0], high[0]) for y in (low[1], high[1])
+                           for z in (low[2], high[2])]
+                return _bounds(corners)
+            if q or query:
+                return list(mesh["matrix"])
+            mesh["matrix"] = list(matrix)
+            return None
+        node, attr, indices = self._plug(item)
+        result = []
+        for i in indices:
+            point = self.curves[node][i]
+            result.extend(_toWorld(point, self.matrices[node]) if ws else point)
+        return result
+
+    def move(self, x, y, z, item, **kwargs):
+        self._call('move')
+        node, attr, indices = self._plug(item)
+        m = self.matrices[node]
+        # Only translation is undone here, which is enough for the benchmark scenes
+        for i in indices:
+            self.curves[node][i] = [x - m[12], y - m[13], z - m[14]]
+
+    def getAttr(self, item, **kwargs):
+        self._call('getAttr')
+        node, attr, indices = self._plug(item)
+        if node not in self.curves or attr not in ('worldMatrix', 'spans', 'degree', 'cv'):
+            return self.values.get(f"{node}.{attr}", _defaultValues.get(attr, 0.0))
+        if attr == 'worldMatrix':
+            return list(self.matrices[node])
+        if attr == 'spans':
+            # spans + degree control points, for a periodic curve the last 'degree' overlap the first ones
+            return len(self.curves[node]) - 3
+        if attr == 'degree':
+            return 3
+        return [tuple(self.curves[node][i]) for i in indices]
+
+    def setAttr(self, item, *values, lock=None, **kwargs):
+        self._call('setAttr')
+        if lock is not None:
+            if lock:
+                self.lockedAttrs.add(item)
+            else:
+                self.lockedAttrs.discard(item)
+            return
+        node, attr, indices = self._plug(item)
+        if attr == 'ktv' and node in self.animCurves:
+            self.animCurves[node] = dict(zip(values[0::2], values[1::2]))
+            return
+        if attr != 'cv':
+            if f"{node}.{attr}" in self.lockedAttrs:
+                raise RuntimeError(f"The attribute '{node}.{attr}' is locked or connected and cannot be modified.")
+            self.values[f"{node}.{attr}"] = values[0] if len(values) == 1 else [tuple(values)]
+            return
+        if len(values) != len(indices) * 3:
+            raise RuntimeError(f"Wrong number of values for {item}")
+        for n, i in enumerate(indices):
+            self.curves[node][i] = list(values[n * 3:n * 3 + 3])
+
+    def undoInfo(self, openChunk=False, closeChunk=False, query=False, state=False, **kwargs):
+        self._call('undoInfo')
+        if query and state:
+            return True
+        if openChunk:
+            self.undoChunks += 1
+            self.openUndoChunks += 1
+        if closeChunk:
+            self.openUndoChunks -= 1
+
+    def listAttr(self, node, userDefined=False, locked=False, keyable=False, string=None, **kwargs):
+        self._call('listAttr')
+        node = node.rsplit('|', 1)[-1]
+        attributes = self.userAttrs.get(node, [])
+        if keyable:
+            # Drivers stand in for constraints, their offset is keyable
+            if node in self.drivers or node in self.animCurves:
+                attributes = ['offset'] if node in self.drivers else []
+            else:
+                attributes = list(_channels) + attributes
+        if string:
+            attributes = [attr for attr in attributes if fnmatch.fnmatchcase(attr, string)]
+        if locked:
+            attributes = [attr for attr in attributes if f"{node}.{attr}" in self.lockedAttrs]
+        return list(attributes) or None
+
+    def deleteAttr(self, node, attribute=None, at=None, **kwargs):
+        self._call('deleteAttr')
+        attr = attribute or at
+        if f"{node}.{attr}" in self.lockedAttrs:
+            raise RuntimeError(f"Cannot delete locked attribute '{node}.{attr}'.")
+        self.userAttrs[node].remove(attr)
+        self.undoQueue.append((node, attr))
+
+    def undo(self, **kwargs):
+        self._call('undo')
+        node, attr = self.undoQueue.pop()
+        self.userAttrs[node].append(attr)
+
+    def refresh(self, suspend=None, query=False, q=False, **kwargs):
+        self._call('refresh')
+        if query or q:
+            return self.refreshSuspended
+        if suspend is not None:
+            self.refreshSuspended = suspend
+
+    def attributeQuery(self, attr, node=None, exists=False, longName=False, **kwargs):
+        self._call('attributeQuery')
+        if exists:
+            return self._exists(node) or any(plug.split('.')[0] == node for plug in self.connections)
+        return _longNames.get(attr, attr)
+
+    def listConnections(self, item, source=True, destination=True, connections=False, plugs=False,
+                        type=None, **kwargs):
+        self._call('listConnections')
+        item = item.rsplit('|', 1)[-1]
+        if '.' in item:
+            pairs = [(item, self.connections[item])] if item in self.connections else []
+        else:
+            pairs = [(d, s) for d, s in self.connections.items() if d.split('.')[0] == item]
+        if type == 'animCurve':
+            pairs = [(d, s) for d, s in pairs if s.split('.')[0] in self.animCurves]
+        result = []
+        for destinationPlug, sourcePlug in pairs:
+            if connections:
+                result.append(destinationPlug)
+            result.append(sourcePlug if plugs else sourcePlug.split('.')[0])
+        return result or None
+
+    def _nodeType(self, node):
+        node = node.rsplit('|', 1)[-1]
+        if node in self.animCurves:
+            return 'animCurveTU'
+        if node in self.drivers:
+            return 'parentConstraint'
+        return 'mesh' if node in self.meshes else 'transform'
+
+    def listHistory(self, nodes, **kwargs):
+        """The nodes and everything upstream of them through connections."""
+        self._call('listHistory')
+        result = []
+        pending = [nodes] if isinstance(nodes, str) else list(nodes)
+        while pending:
+            node = pending.pop(0).rsplit('|', 1)[-1]
+            if node in result:
+                continue
+            result.append(node)
+            pending.extend(source.split('.')[0] for plug, source in self.connections.items()
+                           if plug.split('.')[0] == node)
+        return result
+
+    def createNode(self, nodeType, name=None, **kwargs):
+        self._call('createNode')
+        name = name if name and not self._exists(name) else self._newName(name or nodeType)
+        if nodeType.startswith('animCurve'):
+            self.animCurves[name] = {}
+        return name
+
+    def rename(self, node, newName, **kwargs):
+        self._call('rename')
+        if node in self.animCurves:
+            self.animCurves[newName] = self.animCurves.pop(node)
+            for plug, source in self.connections.items():
+                if source.split('.')[0] == node:
+                    self.connections[plug] = newName + '.' + source.split('.', 1)[1]
+        return newName
+
+    def nodeType(self, node, inherited=False, **kwargs):
+        self._call('nodeType')
+        if node in self.animCurves:
+            return ['animCurve', 'animCurveTU'] if inherited else 'animCurveTU'
+        return ['constraint', 'parentConstraint'] if inherited else 'parentConstraint'
+
+    def connectAttr(self, source, destination, force=False, **kwargs):
+        self._call('connectAttr')
+        self.connections[destination] = source
+
+    def duplicate(self, node, n=None, name=None, **kwargs):
+        self._call('duplicate')
+        if node in self.meshes:
+            copy = n or name or self._newName(node)
+            mesh = self.meshes[node]
+            self.meshes[copy] = {"points": [(x, y, z) for x, y, z in mesh["points"]], "matrix": list(mesh["matrix"]),
+                                 "bounds": list(mesh["bounds"])}
+            return [copy]
+        name = self._newName('animCurveCopy')
+        self.animCurves[name] = dict(self.animCurves[node])
+        for (curve, flag), values in list(self.tangents.items()):
+            if curve == node:
+                self.tangents[(name, flag)] = dict(values)
+        return [name]
+
+    def polyEvaluate(self, node, vertex=False, face=False, **kwargs):
+        self._call('polyEvaluate')
+        count = len(self.meshes[node]["points"])
+        return count if vertex else max(1, count // 4)
+
+    def geomToBBox(self, node, n=None, name=None, single=False, **kwargs):
+        """Replace the mesh's vertices with the corners of its bounding box."""
+        self._call('geomToBBox')
+        mesh = self.meshes[node]
+        mesh["bounds"] = _bounds(mesh["points"])
+        low, high = mesh["bounds"][:3], mesh["bounds"][3:]
+        mesh["points"] = [(x, y, z) for x in (low[0], high[0]) for y in (low[1], high[1]) for z in (low[2], high[2])]
+        return [node]
+
+    def polyCube(self, name=None, width=1.0, height=1.0, depth=1.0, **kwargs):
+        self._call('polyCube')
+        name = name or self._newName('pCube')
+        self.addMesh(name, [(x * width, y * height, z * depth) for x in (-0.5, 0.5) for y in (-0.5, 0.5)
+                            for z in (-0.5, 0.5)])
+        return [name]
+
+    def delete(self, nodes, **kwargs):
+        self._call('delete')
+        for node in [nodes] if isinstance(nodes, str) else nodes:
+            self.animCurves.pop(node, None)
+            for key in [key for key in self.tangents if key[0] == node]:
+                del self.tangents[key]
+
+    def _curve(self, item):
+        """The anim curve itself, or the one connected to a plug."""
+        return item if item in self.animCurves else self.connections[item].split('.')[0]
+
+    def _removeKeys(self, curve, start, end):
+        self.animCurves[curve] = {t: v for t, v in self.animCurves[curve].items() if not start <= t <= end}
+        for (node, flag), values in self.tangents.items():
+            if node == curve:
+                self.tangents[(node, flag)] = {t: v for t, v in values.items() if not start <= t <= end}
+
+    def copyKey(self, curve, time, **kwargs):
+        self._call('copyKey')
+        start, end = time
+        keys = {t: v for t, v in self.animCurves[curve].items() if start <= t <= end}
+        tangents = {flag: {t: v for t, v in values.items() if start <= t <= end}
+                    for (node, flag), values in self.tangents.items() if node == curve}
+        self.clipboard = (time, keys, tangents)
+
+    def pasteKey(self, plug, option='insert', **kwargs):
+        self._call('pasteKey')
+        (start, end), keys, tangents = self.clipboard
+        curve = self._curve(plug)
+        if option == 'replace':
+            self._removeKeys(curve, start, end)
+        self.animCurves[curve].update(keys)
+        for flag, values in tangents.items():
+            self.tangents.setdefault((curve, flag), {}).update(values)
+
+    def cutKey(self, plug, time, **kwargs):
+        self._call('cutKey')
+        curve = self._curve(plug)
+        for start, end in time if isinstance(time, list) else [time]:
+            self._removeKeys(curve, start, end)
+
+    def keyframe(self, curve, q=False, query=False, t=None, time=None, timeChange=False, valueChange=False,
+                 keyframeCount=False, **kwargs):
+        self._call('keyframe')
+        if '.' in curve:
+            curve = self.connections[curve].split('.')[0]
+        start, end = t or time or (float('-inf'), float('inf'))
+        keys = sorted((k, v) for k, v in self.animCurves[curve].items() if start <= k <= end)
+        if keyframeCount:
+            return len(keys)
+        if timeChange:
+            return [k for k, _ in keys]
+        if valueChange:
+            return [v for _, v in keys]
+        return len(keys)
+
+    def keyTangent(self, curve, q=False, query=False, edit=False, e=False, t=None, time=None, index=None,
+                   **kwargs):
+        """Query or edit tangent flags of the keys in a time or index range, e.g. outTangentType='linear'."""
+        self._call('keyTangent')
+        curve = self._curve(curve)
+        times = sorted(self.animCurves[curve])
+        if index is not None:
+            times = times[index[0]:index[1] + 1]
+        start, end = t or time or (float('-inf'), float('inf'))
+        times = [k for k in times if start <= k <= end]
+        for flag, value in kwargs.items():
+            values = self.tangents.setdefault((curve, flag), {})
+            if q or query:
+                default = 'auto' if flag.endswith('Type') else 0.0
+                return [values.get(k, default) for k in times]
+            values.update(dict.fromkeys(times, value))
+
+    def referenceQuery(self, node, isNodeReferenced=False, **kwargs):
+        """Namespaced nodes stand in for referenced ones."""
+        self._call('referenceQuery')
+        return ':' in node
+
+    def filterCurve(self, curves, **kwargs):
+        self._call('filterCurve')
+
+    def bakeResults(self, nodes, t, sampleBy=1.0, at=None, preserveOutsideKeys=False, **kwargs):
+        """Sample every connected plug of the nodes and replace its driver with an anim curve."""
+        self._call('bakeResults')
+        start, end = t
+        frames = []
+        frame = start
+        while frame <= end + 1e-9:
+            frames.append(frame)
+            frame = start + len(frames) * sampleBy
+        if frames[-1] < end:
+            frames.append(end)
+        plugs = [plug for plug in self.connections if plug.split('.')[0] in nodes
+                 and (not at or plug.split('.')[1] in [_longNames.get(attr, attr) for attr in at])]
+        # Evaluate everything first, like a simulation bake, then write the keys
+        values = {plug: [self.evaluate(plug, f) for f in frames] for plug in plugs}
+        for plug in plugs:
+            source = self.connections[plug].split('.')[0]
+            if source in self.animCurves and preserveOutsideKeys:
+                self._removeKeys(source, start, end)
+                keys = self.animCurves[source]
+            else:
+                source = self._newName('animCurve')
+                self.connections[plug] = source + '.output'
+                keys = {}
+            keys.update(zip(frames, values[plug]))
+            self.animCurves[source] = keys
+
+
+class PyNode(object):
+    """The little of pymel.core.PyNode the tools use: a node name with attribute access."""
+
+    def __init__(self, name):
+        self._name = str(name)
+
+    def name(self):
+        return self._name
+
+    def attr(self, name):
+        return PyNode(f"{self._name}.{name}")
+
+    def get(self, **kwargs):
+        return _pymel.getAttr(self._name, **kwargs)
+
+    def set(self, *values, **kwargs):
+        return _pymel.setAttr(self._name, *values, **kwargs)
+
+    def __str__(self):
+        return self._name
+
+    def __repr__(self):
+        return f"PyNode({self._name!r})"
+
+    def __eq__(self, other):
+        return str(other) == self._name
+
+    def __hash__(self):
+        return hash(self._name)
+
+
+_pymel = None
+
+
+def _pymelCommand(cmds, name, overhead):
+    """Forward a pymel.core command to the stand-in, node names in the result become PyNodes."""
+    command = getattr(cmds, name)
+
+    def pymelCommand(*args, **kwargs):
+        if overhead:
+            end = time.perf_counter() + overhead
+            while time.perf_counter() < end:
+                pass
+        result = command(*[str(a) if isinstance(a, PyNode) else a for a in args], **kwargs)
+        if name in ('ls', 'listRelatives') and result:
+            return [PyNode(item) for item in result]
+        return result
+    return pymelCommand
+
+
+def install(latency=20e-6, pymel=False, pymelOverhead=30e-6):
+    """Register the stand-in as maya.cmds and return it.
+
+    An already installed stand-in is reused, so benchmark modules can share one scene.
+    With pymel, pymel.core is registered too, every call paying pymelOverhead on top.
+    """
+    global _pymel
+    cmds = getattr(sys.modules.get('maya.cmds'), 'standIn', None)
+    if cmds is None:
+        cmds = StandInCmds(latency)
+        maya = types.ModuleType('maya')
+        module = types.ModuleType('maya.cmds')
+        for name in dir(cmds):
+            if not name.startswith('_'):
+                setattr(module, name, getattr(cmds, name))
+        module.standIn = cmds
+        maya.cmds = module
+        sys.modules['maya'] = maya
+        sys.modules['maya.cmds'] = module
+    cmds.latency = latency
+    if pymel:
+        package = types.ModuleType('pymel')
+        _pymel = types.ModuleType('pymel.core')
+        for name in dir(cmds):
+            if not name.startswith('_') and callable(getattr(cmds, name)):
+                setattr(_pymel, name, _pymelCommand(cmds, name, pymelOverhead))
+        _pymel.PyNode = PyNode
+        _pymel.selected = lambda: _pymel.ls(selection=True)
+        _pymel.warning = lambda message: print(f"Warning: {message}")
+        package.core = _pymel
+        sys.modules['pymel'] = package
+        sys.modules['pymel.core'] = _pymel
+    return cmds
@@ -0,0 +1,91 @@
+# Benchmark: PyMEL vs maya.cmds for what reorderAttribute.py does, import time
+# and per-call cost. Needs a real Maya, run it with mayapy:
+#
+#     mayapy benchmarks/pymelBenchmark.py --nodes 50 --attrs 120
+#
+# Every import is timed in a fresh mayapy process, after maya.standalone is up,
+# so the numbers are the cost a first use of the tool adds to a session.
+
+import argparse
+import subprocess
+import sys
+import time
+
+_importScript = """
+import time
+import maya.standalone
+maya.standalone.initialize(name='python')
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def importSeconds(statement):
+    """Seconds to run an import statement in a fresh mayapy process, or None if it fails."""
+    result = subprocess.run([sys.executable, '-c', _importScript.format(statement=statement)],
+                            capture_output=True, text=True)
+    if result.returncode:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def timeCalls(func, nodes, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for node in nodes:
+            func(node)
+    return (time.perf_counter() - start) / (repeat * len(nodes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyMEL vs maya.cmds benchmark")
+    parser.add_argument('--nodes', type=int, default=50)
+    parser.add_argument('--attrs', type=int, default=120)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print("import time")
+    for statement in ("import maya.cmds", "import pymel.core"):
+        seconds = importSeconds(statement)
+        print(f"  {statement:<20} " + (f"{seconds:8.3f}s" if seconds is not None else "     n/a"))
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    import maya.cmds as cmds
+    try:
+        import pymel.core as pm
+    except ImportError:
+        print("PyMEL is not installed, skipping the per-call comparison.")
+        return
+
+    cmds.undoInfo(state=True)  # deleteAttr+undo needs the undo queue, batch sessions may start without it
+    nodes = []
+    for n in range(args.nodes):
+        node = cmds.createNode('transform', name=f"ctrl{n}")
+        for a in range(args.attrs):
+            cmds.addAttr(node, longName=f"attr{a:03d}", attributeType='double', keyable=True)
+        nodes.append(node)
+
+    print(f"per call, {args.nodes} nodes x {args.attrs} user attributes")
+    calls = (
+        ("listAttr", lambda node: cmds.listAttr(node, userDefined=True),
+         lambda node: pm.listAttr(node, userDefined=True)),
+        ("listAttr locked", lambda node: cmds.listAttr(node, userDefined=True, locked=True),
+         lambda node: pm.listAttr(node, userDefined=True, locked=True)),
+        ("setAttr lock", lambda node: cmds.setAttr(node + ".attr000", lock=False),
+         lambda node: pm.setAttr(node + ".attr000", lock=False)),
+        ("deleteAttr+undo", lambda node: (cmds.deleteAttr(node, attribute='attr000'), cmds.undo()),
+         lambda node: (pm.deleteAttr(node, attribute='attr000'), pm.undo())),
+    )
+    for label, cmdsCall, pmCall in calls:
+        cmdsSeconds = timeCalls(cmdsCall, nodes, args.repeat)
+        pmSeconds = timeCalls(pmCall, nodes, args.repeat)
+        print(f"  {label:<16} cmds {cmdsSeconds * 1e6:8.1f}us  pymel {pmSeconds * 1e6:8.1f}us  "
+              f"{pmSeconds / cmdsSeconds:5.1f}x")
+
+    maya.standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    main()
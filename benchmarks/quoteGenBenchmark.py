@@ -0,0 +1,91 @@
+# Benchmark: quoteGen's original readlines() list vs the lazy offset index.
+# Builds a large generated quote file, then compares startup, peak memory and
+# random quote lookups. The original loads every line when the generator is
+# created, the index is built once, cached next to the file and reused. A torn
+# index file must be rebuilt.
+#
+#     python benchmarks/quoteGenBenchmark.py --quotes 200000 --lookups 10000
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+mayaStandIn.install()
+
+from quoteGen import quoteGen
+
+
+class LegacyQuoteGenerator:
+    """The original QuoteGenerator, every line read into a list at construction."""
+
+    def __init__(self, file_path):
+        with open(file_path, 'r', encoding='utf-8') as file:
+            self.quotes = [line.strip() for line in file.readlines()]
+
+    def get_random_quote(self):
+        return random.choice(self.quotes)
+
+
+def measure(label, create, lookups):
+    tracemalloc.start()
+    start = time.perf_counter()
+    generator = create()
+    generator.get_random_quote()
+    startup = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(lookups):
+        generator.get_random_quote()
+    lookup = (time.perf_counter() - start) / lookups
+    print(f"  {label:<24} startup {startup * 1e3:8.1f}ms  {peak / 2 ** 20:7.1f} MB peak  "
+          f"{lookup * 1e6:6.1f}us per quote")
+    return generator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quote generator benchmark")
+    parser.add_argument('--quotes', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='quoteGen_') as folder_path:
+        file_path = os.path.join(folder_path, 'quotes.txt')
+        random.seed(6)
+        words = "render frame rig key curve light shader node bake scene deadline artist director".split()
+        with open(file_path, 'w', encoding='utf-8') as file:
+            for n in range(args.quotes):
+                file.write(f'"{n}: ' + " ".join(random.choice(words) for _ in range(random.randint(5, 25))) + '."\n')
+        print(f"{args.quotes} quotes, {os.path.getsize(file_path) / 2 ** 20:.1f} MB")
+
+        legacy = measure("readlines list", lambda: LegacyQuoteGenerator(file_path), args.lookups)
+        measure("index, first run", lambda: quoteGen.QuoteGenerator(file_path), args.lookups)
+        generator = measure("index, cached", lambda: quoteGen.QuoteGenerator(file_path), args.lookups)
+        assert [generator.get_quote(n) for n in range(len(generator))] == legacy.quotes, \
+            "Indexed quotes do not match the original list"
+
+        # A changed file must not be served from the stale index
+        with open(file_path, 'a', encoding='utf-8') as file:
+            file.write('"The last quote."\n')
+        assert generator.get_quote(len(generator) - 1) == '"The last quote."', "Stale index after an edit"
+        generator.close()
+
+        # An index cut short, on an entry boundary or not, is rebuilt instead of used
+        index_path = file_path + '.idx'
+        expected = quoteGen.build_index(file_path)
+        for cut in (8, 3):
+            os.truncate(index_path, os.path.getsize(index_path) - cut)
+            assert quoteGen.load_index(file_path) == expected, f"Index cut by {cut} bytes was not rebuilt"
+        print("torn index rebuilt")
+
+
+if __name__ == "__main__":
+    main()
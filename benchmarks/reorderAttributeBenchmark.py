@@ -0,0 +1,155 @@
+# Benchmark: the original delete/undo reorder loop vs the single-pass reorderEngine.
+# Runs against the in-memory maya.cmds stand-in, so no Maya licence is needed.
+# Counts deleteAttr/undo pairs as well as time, since every pair is a full
+# attribute rebuild inside Maya.
+#
+#     python benchmarks/reorderAttributeBenchmark.py --nodes 50 --attrs 120
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mayaStandIn
+
+cmds = mayaStandIn.install()
+
+from reorderAttribute import reorderEngine
+
+
+def legacyMoveAttr(obj, attrList, mode):
+    """The original moveAttr loop for one object, 1 moves up and 0 moves down."""
+    lockAttrList = cmds.listAttr(obj, userDefined=True, locked=True)
+    if lockAttrList:
+        for lockAttr in lockAttrList:
+            cmds.setAttr(obj + "." + lockAttr, lock=False)
+    if mode == 0:
+        for i in attrList[::-1]:
+            attrLs = cmds.listAttr(obj, userDefined=True)
+            attrPos = attrLs.index(i)
+            cmds.deleteAttr(obj, at=attrLs[attrPos])
+            cmds.undo()
+            for x in range(attrPos + 2, len(attrLs), 1):
+                cmds.deleteAttr(obj, at=attrLs[x])
+                cmds.undo()
+    else:
+        for i in attrList:
+            attrLs = cmds.listAttr(obj, userDefined=True)
+            attrPos = attrLs.index(i)
+            if attrPos > 0:
+                cmds.deleteAttr(obj, at=attrLs[attrPos - 1])
+                cmds.undo()
+                for x in range(attrPos + 1, len(attrLs), 1):
+                    cmds.deleteAttr(obj, at=attrLs[x])
+                    cmds.undo()
+    if lockAttrList:
+        for lockAttr in lockAttrList:
+            cmds.setAttr(obj + "." + lockAttr, lock=True)
+
+
+def legacyMoveToTop(obj, attr):
+    """The original tool can only move one step per click, so moving to the top takes one click per step."""
+    for _ in range(cmds.listAttr(obj, userDefined=True).index(attr)):
+        legacyMoveAttr(obj, [attr], 1)
+
+
+def buildScene(nodes, attrs):
+    random.seed(1)
+    names = []
+    for n in range(nodes):
+        attributes = [f"attr{a:03d}" for a in range(attrs)]
+        random.shuffle(attributes)
+        names.append(cmds.addNode(f"ctrl{n}", attributes, locked=attributes[::7]))
+    return names
+
+
+def buildControls(nodes, attrs, layouts):
+    """Build controls that share a few attribute layouts, like the controls of a rig."""
+    random.seed(2)
+    shapes = []
+    for _ in range(layouts):
+        attributes = [f"attr{a:03d}" for a in range(attrs)]
+        random.shuffle(attributes)
+        shapes.append(attributes)
+    return [cmds.addNode(f"ctrl{n}", shapes[n % layouts], locked=shapes[n % layouts][::7]) for n in range(nodes)]
+
+
+def run(label, nodes, func, batch=False):
+    """Time func on every node, or once on the node list with batch=True."""
+    cmds.resetCalls()
+    start = time.perf_counter()
+    if batch:
+        func(nodes)
+    else:
+        for node in nodes:
+            func(node)
+    seconds = time.perf_counter() - start
+    orders = [list(cmds.userAttrs[node]) for node in nodes]
+    locked = set(cmds.lockedAttrs)
+    return label, seconds, cmds.calls['deleteAttr'], sum(cmds.calls.values()), orders, locked
+
+
+def report(title, *results):
+    print(title)
+    for label, seconds, deletes, calls, _, _ in results:
+        print(f"  {label:<14} {seconds:8.3f}s  {deletes:7d} delete/undo  {calls:7d} calls")
+    if len(results) > 1:
+        print(f"  speedup        {results[0][1] / results[1][1]:8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Attribute reorder benchmark")
+    parser.add_argument('--nodes', type=int, default=50)
+    parser.add_argument('--attrs', type=int, default=120)
+    parser.add_argument('--layouts', type=int, default=4, help="Attribute layouts shared by the template controls")
+    parser.add_argument('--latency', type=float, default=20e-6, help="Simulated seconds per cmds call")
+    args = parser.parse_args()
+
+    cmds.latency = args.latency
+    print(f"{args.nodes} nodes x {args.attrs} user attributes, {args.latency * 1e6:.0f}us per cmds call")
+
+    # Move two neighbouring attributes from the middle one step up
+    nodes = buildScene(args.nodes, args.attrs)
+    selected = {node: cmds.userAttrs[node][args.attrs // 2:args.attrs // 2 + 2] for node in nodes}
+    legacy = run("original", nodes, lambda node: legacyMoveAttr(node, selected[node], 1))
+    nodes = buildScene(args.nodes, args.attrs)
+    engine = run("reorderEngine", nodes, lambda node: reorderEngine.applyOrder(
+        node, reorderEngine.moveUp(reorderEngine.getAttrOrder(node), selected[node])))
+    assert legacy[4:] == engine[4:], "reorderEngine does not match the original move up"
+    report("move up one step", legacy, engine)
+
+    # Move the last attribute to the top
+    nodes = buildScene(args.nodes, args.attrs)
+    last = {node: cmds.userAttrs[node][-1] for node in nodes}
+    legacy = run("original", nodes, lambda node: legacyMoveToTop(node, last[node]))
+    nodes = buildScene(args.nodes, args.attrs)
+    engine = run("reorderEngine", nodes, lambda node: reorderEngine.applyOrder(
+        node, reorderEngine.moveToTop(reorderEngine.getAttrOrder(node), [last[node]])))
+    assert legacy[4:] == engine[4:], "reorderEngine does not match the original move to top"
+    report("move to top", legacy, engine)
+
+    # Sorting has no equivalent in the original tool
+    nodes = buildScene(args.nodes, args.attrs)
+    engine = run("reorderEngine", nodes, lambda node: reorderEngine.applyOrder(
+        node, reorderEngine.sortAlphabetically(reorderEngine.getAttrOrder(node))))
+    assert all(order == sorted(order) for order in engine[4]), "Sorted order is wrong"
+    report("sort alphabetically", engine)
+
+    # One template on many controls, then the previous orders put back
+    template = [f"attr{a:03d}" for a in range(args.attrs)]
+    nodes = buildControls(args.nodes * 4, args.attrs, args.layouts)
+    original = [list(cmds.userAttrs[node]) for node in nodes]
+    previous = {}
+    batch = run("template", nodes, lambda nodes: previous.update(reorderEngine.applyTemplate(nodes, template)),
+                batch=True)
+    assert all(order == template for order in batch[4]), "Template order is wrong"
+    restore = run("restore", nodes, lambda nodes: reorderEngine.applyOrders(previous), batch=True)
+    assert restore[4] == original, "applyOrders does not restore the previous orders"
+    report(f"template on {len(nodes)} controls with {args.layouts} layouts", batch)
+    report("restore the previous orders", restore)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Persistent cache of computed bounds, so proxy runs on a mostly unchanged scene
+# only recompute the dirty assets. Entries are keyed by the node's UUID and hold
+# a geometry signature plus the bounds computed for it, one value per variant
+# (e.g. "obb5000" for oriented bounds fitted to 5000 samples). When the signature
+# of a node no longer matches, its variants are recomputed.
+# The signature is cheap: world bounding box, vertex and face counts of every mesh
+# under the node and a few sampled world vertex positions. An edit that keeps all
+# of those the same goes unnoticed, clear() the cache after such edits.
+# The least recently used entries are dropped beyond maxEntries.
+#
+# Usage:
+#     from boundingBox import bboxCache, bboxProxy
+#     cache = bboxCache.BoundsCache('C:/path/to/bboxCache.json')
+#     bboxProxy.createOrientedProxies(cmds.ls(selection=True), cache=cache)
+#     cache.save()
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import maya.cmds as cmds
+
+VERSION = 1
+
+
+def getSignature(node, samples=32):
+    """Return a hash of the geometry under node that changes with its topology and placement."""
+    digest = hashlib.sha1(repr(cmds.xform(node, query=True, boundingBox=True, worldSpace=True)).encode('ascii'))
+    for shape in cmds.listRelatives(node, allDescendents=True, type='mesh', fullPath=True, noIntermediate=True) or []:
+        vertexCount, faceCount = cmds.polyEvaluate(shape, vertex=True), cmds.polyEvaluate(shape, face=True)
+        digest.update(f"{vertexCount} {faceCount}".encode('ascii'))
+        if vertexCount:
+            step = max(1, vertexCount // samples)
+            vertices = [f"{shape}.vtx[{i}]" for i in range(0, vertexCount, step)]
+            digest.update(repr(cmds.xform(vertices, query=True, worldSpace=True, translation=True)).encode('ascii'))
+    return digest.hexdigest()
+
+
+class BoundsCache(object):
+    """Bounds per node UUID and geometry signature, saved as JSON, least recently used dropped first."""
+
+    def __init__(self, filePath, maxEntries=50000):
+        self.filePath = filePath
+        self.maxEntries = maxEntries
+        self.entries = OrderedDict()  # uuid -> [signature, {variant: bounds}], oldest first
+        self.hits = 0
+        self.misses = 0
+        if os.path.exists(filePath):
+            try:
+                with open(filePath, 'r') as jsonFile:
+                    data = json.load(jsonFile)
+                if data.get("version") == VERSION:
+                    self.entries.update((uuid, [signature, variants]) for uuid, signature, variants in data["entries"])
+            except ValueError:
+                print(f"Ignoring unreadable bounds cache {filePath}.")
+
+    def get(self, uuid, signature, variant):
+        """Return the cached bounds, or None when they are missing or the geometry changed."""
+        entry = self.entries.get(uuid)
+        if entry is None or entry[0] != signature or variant not in entry[1]:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(uuid)
+        self.hits += 1
+        return entry[1][variant]
+
+    def put(self, uuid, signature, variant, bounds):
+        entry = self.entries.get(uuid)
+        if entry is None or entry[0] != signature:
+            entry = self.entries[uuid] = [signature, {}]
+        entry[1][variant] = bounds
+        self.entries.move_to_end(uuid)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def save(self):
+        """Write the cache, creating its folder if needed."""
+        folderPath = os.path.dirname(self.filePath)
+        if folderPath and not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        with open(self.filePath, 'w') as jsonFile:
+            json.dump({"version": VERSION,
+                       "entries": [[uuid, signature, variants] for uuid, (signature, variants) in self.entries.items()]},
+                      jsonFile)
@@ -0,0 +1,194 @@
+# Bounding box math for bboxProxy.py, plain Python with no Maya import.
+# Matrices are Maya style, 16 floats row-major with points as row vectors, so a
+# point p goes to world space as p * matrix.
+
+identity = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+
+def multiplyMatrix(a, b):
+    """Return a * b, apply a first then b."""
+    return tuple(sum(a[row * 4 + k] * b[k * 4 + column] for k in range(4))
+                 for row in range(4) for column in range(4))
+
+
+def transformPoint(point, m):
+    x, y, z = point
+    return (x * m[0] + y * m[4] + z * m[8] + m[12],
+            x * m[1] + y * m[5] + z * m[9] + m[13],
+            x * m[2] + y * m[6] + z * m[10] + m[14])
+
+
+def boxPlacement(bbMin, bbMax, matrix=identity, minSize=1e-4):
+    """Return the size of a cube and the matrix that puts it over the box bbMin-bbMax in matrix's space.
+
+    The cube is centered at the origin of its transform, like polyCube makes it.
+    """
+    size = tuple(max(b - a, minSize) for a, b in zip(bbMin, bbMax))
+    center = [(a + b) * 0.5 for a, b in zip(bbMin, bbMax)]
+    offset = (1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, center[0], center[1], center[2], 1.0)
+    return size, multiplyMatrix(offset, matrix)
+
+
+def boxCorners(bbMin, bbMax):
+    return [(x, y, z) for x in (bbMin[0], bbMax[0]) for y in (bbMin[1], bbMax[1]) for z in (bbMin[2], bbMax[2])]
+
+
+def worldBounds(bbMin, bbMax, matrix):
+    """World axis aligned bounds of an object-space box."""
+    corners = [transformPoint(corner, matrix) for corner in boxCorners(bbMin, bbMax)]
+    return tuple(min(p[i] for p in corners) for i in range(3)), tuple(max(p[i] for p in corners) for i in range(3))
+
+
+def groupBounds(keys, boundsList):
+    """Merge bounds that share a key in one pass. Returns {key: (bbMin, bbMax)} in first seen order."""
+    groups = {}
+    for key, (bbMin, bbMax) in zip(keys, boundsList):
+        if key in groups:
+            low, high = groups[key]
+            groups[key] = (tuple(map(min, low, bbMin)), tuple(map(max, high, bbMax)))
+        else:
+            groups[key] = (bbMin, bbMax)
+    return groups
+
+
+def clusterKey(bbMin, bbMax, cellSize):
+    """Grid cell of a box's center, boxes in the same cell form one spatial cluster."""
+    return tuple(int((a + b) * 0.5 // cellSize) for a, b in zip(bbMin, bbMax))
+
+
+def hierarchyKey(longName, level=None):
+    """Group of a DAG path: its parent, or with level its ancestor that many levels below the world."""
+    parts = longName.split('|')[1:] if longName.startswith('|') else longName.split('|')
+    parts = parts[:-1] if level is None else parts[:level]
+    return '|' + '|'.join(parts) if parts else '|'
+
+
+def cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def covariance(points, stride=1):
+    """3x3 covariance of a flat x, y, z sequence, using every stride-th point."""
+    xs, ys, zs = points[0::3 * stride], points[1::3 * stride], points[2::3 * stride]
+    count = len(xs)
+    mx, my, mz = sum(xs) / count, sum(ys) / count, sum(zs) / count
+    xx = xy = xz = yy = yz = zz = 0.0
+    for x, y, z in zip(xs, ys, zs):
+        x, y, z = x - mx, y - my, z - mz
+        xx += x * x
+        xy += x * y
+        xz += x * z
+        yy += y * y
+        yz += y * z
+        zz += z * z
+    return [[xx / count, xy / count, xz / count], [xy / count, yy / count, yz / count], [xz / count, yz / count, zz / count]]
+
+
+def eigenVectors(matrix, sweeps=50):
+    """Eigenvectors of a symmetric 3x3 matrix by Jacobi rotations, sorted by decreasing eigenvalue."""
+    a = [list(row) for row in matrix]
+    v = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    for _ in range(sweeps):
+        offDiagonal = abs(a[0][1]) + abs(a[0][2]) + abs(a[1][2])
+        if offDiagonal < 1e-15:
+            break
+        for p, q in ((0, 1), (0, 2), (1, 2)):
+            if abs(a[p][q]) < 1e-30:
+                continue
+            theta = (a[q][q] - a[p][p]) / (2.0 * a[p][q])
+            t = (1.0 if theta >= 0 else -1.0) / (abs(theta) + (theta * theta + 1.0) ** 0.5)
+            c = 1.0 / (t * t + 1.0) ** 0.5
+            s = t * c
+            for k in range(3):
+                akp, akq = a[k][p], a[k][q]
+                a[k][p], a[k][q] = c * akp - s * akq, s * akp + c * akq
+            for k in range(3):
+                apk, aqk = a[p][k], a[q][k]
+                a[p][k], a[q][k] = c * apk - s * aqk, s * apk + c * aqk
+            for k in range(3):
+                vkp, vkq = v[k][p], v[k][q]
+                v[k][p], v[k][q] = c * vkp - s * vkq, s * vkp + c * vkq
+    order = sorted(range(3), key=lambda i: -a[i][i])
+    return [tuple(v[k][i] for k in range(3)) for i in order]
+
+
+def projectedBounds(points, axes, chunkSize=30000):
+    """Min and max of a flat x, y, z sequence along each axis, read in chunks of points."""
+    low = [float('inf')] * 3
+    high = [float('-inf')] * 3
+    for start in range(0, len(points), chunkSize * 3):
+        chunk = points[start:start + chunkSize * 3]
+        xs, ys, zs = chunk[0::3], chunk[1::3], chunk[2::3]
+        for i, (ax, ay, az) in enumerate(axes):
+            values = [x * ax + y * ay + z * az for x, y, z in zip(xs, ys, zs)]
+            low[i] = min(low[i], min(values))
+            high[i] = max(high[i], max(values))
+    return tuple(low), tuple(high)
+
+
+def convexHull2D(points):
+    """Convex hull of (x, y) points, monotone chain."""
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+
+    def half(sequence):
+        hull = []
+        for p in sequence:
+            while len(hull) >= 2 and ((hull[-1][0] - hull[-2][0]) * (p[1] - hull[-2][1]) -
+                                      (hull[-1][1] - hull[-2][1]) * (p[0] - hull[-2][0])) <= 0:
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    return half(points) + half(reversed(points))
+
+
+def minAreaDirection(hull):
+    """Unit (x, y) direction of the smallest rectangle around a 2D hull, one edge of the hull lies on it."""
+    best, bestArea = (1.0, 0.0), float('inf')
+    for (x0, y0), (x1, y1) in zip(hull, hull[1:] + hull[:1]):
+        length = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+        if length < 1e-12:
+            continue
+        ux, uy = (x1 - x0) / length, (y1 - y0) / length
+        us = [x * ux + y * uy for x, y in hull]
+        vs = [y * ux - x * uy for x, y in hull]
+        area = (max(us) - min(us)) * (max(vs) - min(vs))
+        if area < bestArea:
+            best, bestArea = (ux, uy), area
+    return best
+
+
+def orientedBounds(points, maxSamples=5000):
+    """Oriented box around a flat x, y, z sequence.
+
+    Works on at most maxSamples evenly spaced points. Each principal axis, and each
+    world axis for upright props, is kept in turn while the other two are turned to
+    the smallest rectangle around the points. That also fixes boxes whose principal
+    axes are ambiguous, like cubes. The smallest of those boxes and the world aligned
+    one wins, and its extents come from all points, so every point is inside.
+    Returns (bbMin, bbMax, matrix) with the box in matrix's space.
+    """
+    stride = max(1, (len(points) // 3 + maxSamples - 1) // maxSamples)
+    sample = points[0::3 * stride], points[1::3 * stride], points[2::3 * stride]
+    flatSample = points if stride == 1 else [v for p in zip(*sample) for v in p]
+    principal = eigenVectors(covariance(points, stride))
+    world = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+    candidates = [world]
+    for frame in (principal, world):
+        for k in range(3):
+            axis, b, c = frame[k], frame[(k + 1) % 3], frame[(k + 2) % 3]
+            planar = [(x * b[0] + y * b[1] + z * b[2], x * c[0] + y * c[1] + z * c[2]) for x, y, z in zip(*sample)]
+            ux, uy = minAreaDirection(convexHull2D(planar))
+            u = tuple(ux * bi + uy * ci for bi, ci in zip(b, c))
+            candidates.append((axis, u, cross(axis, u)))
+
+    axes = min(candidates, key=lambda axes: boxVolume(*projectedBounds(flatSample, axes)))
+    bbMin, bbMax = projectedBounds(points, axes)
+    return bbMin, bbMax, axes[0] + (0.0,) + axes[1] + (0.0,) + axes[2] + (0.0, 0.0, 0.0, 0.0, 1.0)
+
+
+def boxVolume(bbMin, bbMax):
+    return (bbMax[0] - bbMin[0]) * (bbMax[1] - bbMin[1]) * (bbMax[2] - bbMin[2])
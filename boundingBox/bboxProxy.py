@@ -0,0 +1,137 @@
+# Bounding box proxies built from bounds, used by createBoundingBox.py.
+# Duplicating a mesh only to run geomToBBox on the copy moves every vertex of a
+# production asset through memory. Here the object-space bounds and the world
+# matrix of each node are read with two queries, and a cube of that size is
+# placed with one matrix. The box matches geomToBBox on a duplicate: aligned to
+# the object's axes, covering the node and its children.
+#
+# Usage:
+#     from boundingBox import bboxProxy
+#     bboxProxy.createProxies(cmds.ls(selection=True))
+#
+# For layout scenes, createGroupedProxies() builds one world aligned box per
+# group of objects instead of one per object:
+#     bboxProxy.createGroupedProxies(props, groupBy='parent')
+#     bboxProxy.createGroupedProxies(props, groupBy='level', level=2)
+#     bboxProxy.createGroupedProxies(props, groupBy='cluster', cellSize=50.0)
+#
+# createOrientedProxies() fits each box to the principal axes of the world space
+# vertices, so rotated props get tight boxes:
+#     bboxProxy.createOrientedProxies(cmds.ls(selection=True))
+# Pass a bboxCache.BoundsCache to only recompute oriented boxes of changed geometry.
+
+from array import array
+
+import maya.cmds as cmds
+
+from . import bboxCache
+from . import bboxMath
+
+
+def getProxyName(node):
+    """'ns:geo' becomes 'ns_BBox', 'body_geo' becomes 'body_BBox'."""
+    split = node.rsplit(":")
+    if len(split) >= 2:
+        return split[0] + "_BBox"
+    return node.rsplit("_")[0] + "_BBox"
+
+
+def getBounds(nodes):
+    """Return a (bbMin, bbMax, worldMatrix) tuple per node, bounds in object space."""
+    bounds = []
+    for node in nodes:
+        box = cmds.xform(node, query=True, boundingBox=True, objectSpace=True)
+        matrix = cmds.xform(node, query=True, matrix=True, worldSpace=True)
+        bounds.append((tuple(box[:3]), tuple(box[3:]), tuple(matrix)))
+    return bounds
+
+
+def createBox(name, bbMin, bbMax, matrix):
+    """Create a cube over the box bbMin-bbMax given in the space of matrix."""
+    size, boxMatrix = bboxMath.boxPlacement(bbMin, bbMax, matrix)
+    box = cmds.polyCube(name=name, width=size[0], height=size[1], depth=size[2], constructionHistory=False)[0]
+    cmds.xform(box, matrix=boxMatrix, worldSpace=True)
+    return box
+
+
+def createProxies(nodes):
+    """Create one box per node, as a single undo step. Returns the boxes."""
+    if not nodes:
+        return []
+    cmds.undoInfo(openChunk=True, chunkName="createProxies")
+    try:
+        return [createBox(getProxyName(node), *bounds) for node, bounds in zip(nodes, getBounds(nodes))]
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def getGroupKeys(nodes, groupBy='parent', level=1, cellSize=10.0, worldBounds=None):
+    """Return the group of every node, see createGroupedProxies()."""
+    if groupBy == 'cluster':
+        return [bboxMath.clusterKey(bbMin, bbMax, cellSize) for bbMin, bbMax in worldBounds]
+    if groupBy not in ('parent', 'level'):
+        raise ValueError(f"Unknown groupBy '{groupBy}', use 'parent', 'level' or 'cluster'.")
+    return [bboxMath.hierarchyKey(longName, level if groupBy == 'level' else None)
+            for longName in cmds.ls(nodes, long=True)]
+
+
+def getGroupName(key):
+    if isinstance(key, tuple):
+        return "cluster_{}_{}_{}_BBox".format(*key).replace('-', 'n')
+    return (key.rsplit('|', 1)[-1].replace(':', '_') or "world") + "_BBox"
+
+
+def createGroupedProxies(nodes, groupBy='parent', level=1, cellSize=10.0):
+    """Create one world aligned box per group of nodes, as a single undo step.
+
+    groupBy 'parent' groups nodes under the same parent, 'level' under the same
+    ancestor 'level' steps below the world, and 'cluster' by the grid cell of size
+    cellSize their centers fall in. Returns the boxes.
+    """
+    if not nodes:
+        return []
+    worldBounds = [bboxMath.worldBounds(*bounds) for bounds in getBounds(nodes)]
+    groups = bboxMath.groupBounds(getGroupKeys(nodes, groupBy, level, cellSize, worldBounds), worldBounds)
+    cmds.undoInfo(openChunk=True, chunkName="createGroupedProxies")
+    try:
+        return [createBox(getGroupName(key), bbMin, bbMax, bboxMath.identity) for key, (bbMin, bbMax) in groups.items()]
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def getWorldPoints(node):
+    """World positions of every vertex of the meshes under node, as a flat x, y, z array."""
+    points = array('d')
+    for shape in cmds.listRelatives(node, allDescendents=True, type='mesh', fullPath=True, noIntermediate=True) or []:
+        points.extend(cmds.xform(f"{shape}.vtx[*]", query=True, worldSpace=True, translation=True))
+    return points
+
+
+def createOrientedProxies(nodes, maxSamples=5000, cache=None):
+    """Create one oriented box per node, as a single undo step. Returns the boxes.
+
+    The axes are fitted to at most maxSamples vertices of dense meshes, every vertex
+    is still inside the box. Nodes without mesh vertices are skipped. With a
+    bboxCache.BoundsCache, only nodes whose geometry changed are recomputed.
+    """
+    variant = f"obb{maxSamples}"
+    uuids = cmds.ls(nodes, uuid=True) if cache is not None else [None] * len(nodes)
+    boxes = []
+    cmds.undoInfo(openChunk=True, chunkName="createOrientedProxies")
+    try:
+        for node, uuid in zip(nodes, uuids):
+            bounds = signature = None
+            if cache is not None:
+                signature = bboxCache.getSignature(node)
+                bounds = cache.get(uuid, signature, variant)
+            if bounds is None:
+                points = getWorldPoints(node)
+                if not points:
+                    continue
+                bounds = bboxMath.orientedBounds(points, maxSamples)
+                if cache is not None:
+                    cache.put(uuid, signature, variant, bounds)
+            boxes.append(createBox(getProxyName(node), *bounds))
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return boxes
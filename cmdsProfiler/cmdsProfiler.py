@@ -0,0 +1,161 @@
+# Count and time the maya.cmds and pymel.core calls made inside a block.
+# Every tool here is as fast as the number of command round trips it makes, so
+# the profiler wraps each command function of those modules while it is active,
+# and restores them on exit. Per command it keeps the call count, the cumulative
+# time, the self time (without commands called from inside it) and the call
+# sites it was called from. The report is printed when the block ends. Call
+# stacks can also be written as collapsed stacks, the text format read by
+# flamegraph.pl and speedscope.
+# Only calls made through the module attributes are seen, e.g. cmds.xform(),
+# which is how every tool here calls Maya. Calls from other threads are counted
+# too, but Maya commands belong on the main thread anyway.
+#
+# Usage, in Maya's script editor python tab:
+#     from cmdsProfiler import cmdsProfiler
+#     with cmdsProfiler.CommandProfiler():
+#         overrideColor.setOverrideColor(cmds.ls('*_ctrl'), 6)
+#
+#     with cmdsProfiler.CommandProfiler(flameGraph='C:/path/to/reorder.folded', printReport=False) as profiler:
+#         reorderAttribute.moveAttr(1)
+#     rows = profiler.getRows()
+#
+#     @cmdsProfiler.CommandProfiler(top=10)
+#     def exportRig():
+#         ...
+
+import contextlib
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+# Module name and the prefix it gets in the report
+modulePrefixes = (('maya.cmds', 'cmds'), ('pymel.core', 'pm'))
+
+
+class CommandStats(object):
+    """Count, cumulative and self seconds and call sites of one command."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.selfSeconds = 0.0
+        self.callSites = Counter()  # (file, line, function) -> calls
+
+
+class CommandProfiler(contextlib.ContextDecorator):
+    """Profile command calls inside a with block or a decorated function.
+
+    top limits the printed report, callSites records where each command is
+    called from and flameGraph is a file path for the collapsed stacks.
+    """
+
+    def __init__(self, label=None, top=20, callSites=True, flameGraph=None, printReport=True):
+        self.label = label
+        self.top = top
+        self.callSites = callSites
+        self.flameGraph = flameGraph
+        self.printReport = printReport
+        self.stats = defaultdict(CommandStats)
+        self.stacks = Counter()  # collapsed stack -> self seconds
+        self.seconds = 0.0
+        self._originals = []
+        self._rootCode = None
+        self._nested = []  # seconds spent in profiled commands called by each active command
+        self._start = 0.0
+
+    def _wrap(self, name, function):
+        profiler = self
+
+        def profiled(*args, **kwargs):
+            profiler._nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                selfSeconds = seconds - profiler._nested.pop()
+                if profiler._nested:
+                    profiler._nested[-1] += seconds
+                profiler._record(name, seconds, selfSeconds, sys._getframe(1))
+
+        profiled.__name__ = getattr(function, '__name__', name)
+        profiled.__doc__ = getattr(function, '__doc__', None)
+        return profiled
+
+    def _record(self, name, seconds, selfSeconds, frame):
+        stats = self.stats[name]
+        stats.count += 1
+        stats.seconds += seconds
+        stats.selfSeconds += selfSeconds
+        if self.callSites:
+            stats.callSites[(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)] += 1
+        if self.flameGraph:
+            # Python frames up to the profiled block, outermost first
+            stack = [name]
+            while frame is not None and frame.f_code is not self._rootCode:
+                stack.append(f"{os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]}."
+                             f"{frame.f_code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += selfSeconds
+
+    def start(self, rootFrame=None):
+        """Wrap the command functions of maya.cmds and, if it is loaded, pymel.core."""
+        frame = rootFrame or sys._getframe(1)
+        self._rootCode = frame.f_code
+        for moduleName, prefix in modulePrefixes:
+            module = sys.modules.get(moduleName)
+            if module is None:
+                continue
+            for name, value in list(vars(module).items()):
+                if name.startswith('_') or not callable(value) or isinstance(value, type):
+                    continue
+                self._originals.append((module, name, value))
+                setattr(module, name, self._wrap(f"{prefix}.{name}", value))
+        self._start = time.perf_counter()
+
+    def stop(self):
+        """Put the original command functions back."""
+        self.seconds += time.perf_counter() - self._start
+        for module, name, value in reversed(self._originals):
+            setattr(module, name, value)
+        self._originals = []
+
+    def __enter__(self):
+        self.start(sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        if self.printReport:
+            self.report()
+        if self.flameGraph:
+            self.writeFlameGraph(self.flameGraph)
+        return False
+
+    def getRows(self):
+        """Return (command, count, seconds, self seconds, top call sites) rows, slowest first."""
+        rows = [(name, stats.count, stats.seconds, stats.selfSeconds, stats.callSites.most_common(3))
+                for name, stats in self.stats.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def report(self, top=None):
+        """Print the commands that took the most self time and where they were called from."""
+        rows = self.getRows()
+        calls = sum(row[1] for row in rows)
+        commandSeconds = sum(row[3] for row in rows)
+        print(f"{self.label or 'Command profile'}: {calls} calls, {commandSeconds:.3f}s in commands "
+              f"of {self.seconds:.3f}s")
+        print(f"  {'command':<28} {'calls':>8} {'total ms':>10} {'self ms':>10} {'us/call':>9}")
+        for name, count, seconds, selfSeconds, callSites in rows[:top or self.top]:
+            print(f"  {name:<28} {count:8d} {seconds * 1e3:10.2f} {selfSeconds * 1e3:10.2f} "
+                  f"{seconds / count * 1e6:9.1f}")
+            for (filePath, line, function), siteCalls in callSites:
+                print(f"      {siteCalls:8d}  {os.path.basename(filePath)}:{line} {function}")
+        return rows
+
+    def writeFlameGraph(self, filePath):
+        """Write collapsed stacks, one 'frame;frame;command microseconds' line per stack."""
+        with open(filePath, 'w') as foldedFile:
+            for stack, seconds in sorted(self.stacks.items()):
+                foldedFile.write(f"{stack} {max(1, int(round(seconds * 1e6)))}\n")
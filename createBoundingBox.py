@@ -1,22 +1,34 @@
 # Create bounding boxes around selected objects.
 # You can select multiple objects and click 'Create Bounding Box' to generate bounding boxes.
 # Bounding boxes are named based on the original object name with '_BBox' suffix.
+# Oriented boxes follow the principal axes of each object's vertices.
+# Layout scenes can get one box per parent group, hierarchy level or spatial cluster instead.
+# The boxes are built from each object's bounds, see boundingBox/bboxProxy.py.
+# Place the 'boundingBox' folder in your Maya scripts directory next to this script.
+import os
+
 import maya.cmds as cmds
 
+from boundingBox import bboxCache
+from boundingBox import bboxProxy
+
 def command(*args):
     selectedGeo = cmds.ls(sl=True)
 
     if selectedGeo:
-        for geo in selectedGeo:
-            name = geo + "_BBox"
-            split = geo.rsplit(":")
-            if len(split) >= 2:
-                name = split[0] + "_BBox"
-            else:
-                print(geo)
-                name = geo.rsplit("_")[0] + "_BBox"
-            dup = cmds.duplicate(geo, n=name)[0]
-            box = cmds.geomToBBox(dup, n=dup, single=True)[0]
+        mode = cmds.optionMenu("bBoxModeMenu", query=True, select=True) if cmds.optionMenu("bBoxModeMenu", exists=True) else 1
+        if mode == 1:
+            bboxProxy.createProxies(selectedGeo)
+        elif mode == 2:
+            # Oriented boxes of unchanged geometry come from a cache in the user's Maya folder
+            cache = bboxCache.BoundsCache(os.path.join(cmds.internalVar(userAppDir=True), 'bboxCache.json'))
+            bboxProxy.createOrientedProxies(selectedGeo, cache=cache)
+            cache.save()
+        else:
+            groupBy = ['parent', 'level', 'cluster'][mode - 3]
+            level = cmds.intField("bBoxLevelField", query=True, value=True)
+            cellSize = cmds.floatField("bBoxCellField", query=True, value=True)
+            bboxProxy.createGroupedProxies(selectedGeo, groupBy, level, cellSize)
 
 def UI():
     if cmds.window("bBoxWin", exists=True):
@@ -24,6 +36,15 @@ def UI():
     cmds.window("bBoxWin", t="Bounding Box Window")
     cmds.columnLayout(adjustableColumn=True)
     cmds.text(l="You can select multiple objects")
+    cmds.optionMenu("bBoxModeMenu", label="Proxies")
+    for label in ("Per Object", "Per Object, Oriented", "Per Parent Group", "Per Hierarchy Level", "Per Spatial Cluster"):
+        cmds.menuItem(label=label)
+    cmds.rowLayout(numberOfColumns=4)
+    cmds.text(l="Level")
+    cmds.intField("bBoxLevelField", value=1, minValue=1)
+    cmds.text(l="Cluster Size")
+    cmds.floatField("bBoxCellField", value=10.0, minValue=0.001)
+    cmds.setParent("..")
     cmds.button(l="Create Bounding Box", c=command, h=60, w=300, bgc=[0.1, 0.1, 0.1])
     cmds.showWindow("bBoxWin")
 
@@ -0,0 +1,355 @@
+# Export and import CV positions of NURBS curves.
+# CV positions are read with one bulk query per curve shape and held as a flat
+# array of doubles (x0, y0, z0, x1, y1, z1, ...) in world space.
+# Importing writes each curve's whole point array with a single setAttr, and the
+# whole batch is one undo chunk with viewport refresh suspended.
+# Curves can also be stored in a single binary library file, see curveLibrary.py.
+# With incremental=True, exportCurves keeps a manifest of point hashes next to the
+# export folder and only rewrites the curves whose CVs changed since the last run.
+# JSON files are read and written on a small thread pool (see curveIO.py) while
+# the Maya queries and edits stay on the main thread.
+# The transfer functions apply stored shapes to curves with other names or CV
+# counts: name patterns pick the source shape, which can be mirrored across an
+# axis and is resampled to the target's CV count (see curveRetarget.py).
+#
+# Usage, in Maya's script editor python tab:
+#     from curveCV import curveCV
+#     curveCV.exportCurves(cmds.ls(selection=True), folderPath)
+#     curveCV.exportCurves(cmds.ls(selection=True), folderPath, incremental=True, tolerance=1e-5)
+#     curveCV.importCurves(cmds.ls(selection=True), folderPath)
+#     curveCV.exportCurvesToLibrary(cmds.ls(selection=True), libraryPath)
+#     curveCV.importCurvesFromLibrary(cmds.ls(selection=True), libraryPath)
+#     curveCV.transferCurvesFromLibrary(cmds.ls('*_fk*_ctrl'), libraryPath, patterns=[('*', 'circleShape')])
+#     curveCV.mirrorCurves(cmds.ls('R_*_ctrl'), patterns=[('R_*', 'L_*')], axis='x')
+
+import functools
+import hashlib
+import json
+import os
+from array import array
+
+import maya.cmds as cmds
+
+from . import curveIO
+from . import curveLibrary
+from . import curveRetarget
+
+
+def getCurveShape(node):
+    """Return the curve shape of a transform, or the node itself if it is a shape."""
+    shapes = cmds.listRelatives(node, s=True)
+    return shapes[0] if shapes else node
+
+
+def getCurveCVCount(curveName):
+    """Return the number of CVs of a curve shape, as listed by cv[*].
+
+    A periodic curve repeats its first 'degree' CVs at the end, those are not
+    listed or exported, so it has only 'spans' CVs.
+    """
+    spans = cmds.getAttr(f"{curveName}.spans")
+    if isCurvePeriodic(curveName):
+        return spans
+    return spans + cmds.getAttr(f"{curveName}.degree")
+
+
+def isCurvePeriodic(curveName):
+    """Return True for a periodic curve, whose CVs form a closed loop."""
+    return cmds.getAttr(f"{curveName}.form") == 2
+
+
+def getCurvePoints(curveName):
+    """Return the world space CV positions of a curve shape as a flat array of doubles."""
+    return array('d', cmds.xform(f"{curveName}.cv[*]", q=True, ws=True, t=True))
+
+
+def setCurvePoints(curveName, points):
+    """Set the CVs of a curve shape from a flat array of world space positions with one setAttr.
+
+    On a periodic curve the same setAttr also writes the first 'degree' points to
+    the overlapping CVs after them, so the curve stays closed.
+    """
+    inverseMatrix = invertMatrix(cmds.getAttr(f"{curveName}.worldMatrix[0]"))
+    localPoints = transformPoints(points, inverseMatrix)
+    if isCurvePeriodic(curveName):
+        localPoints.extend(localPoints[:cmds.getAttr(f"{curveName}.degree") * 3])
+    cmds.setAttr(f"{curveName}.controlPoints[0:{len(localPoints) // 3 - 1}]", *localPoints)
+
+
+def pointsToList(points):
+    """Convert a flat point array to a list of [x, y, z] lists."""
+    return [list(points[i:i + 3]) for i in range(0, len(points), 3)]
+
+
+def listToPoints(pointList):
+    """Convert a list of [x, y, z] lists to a flat point array."""
+    return array('d', (value for point in pointList for value in point[:3]))
+
+
+def invertMatrix(m):
+    """Invert an affine Maya matrix given as 16 floats in row-major order."""
+    a, b, c = m[0:3]
+    d, e, f = m[4:7]
+    g, h, i = m[8:11]
+    det = a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+    if abs(det) < 1e-12:
+        raise ValueError("Curve has a non-invertible world matrix.")
+    r = [(e * i - f * h) / det, (c * h - b * i) / det, (b * f - c * e) / det,
+         (f * g - d * i) / det, (a * i - c * g) / det, (c * d - a * f) / det,
+         (d * h - e * g) / det, (b * g - a * h) / det, (a * e - b * d) / det]
+    tx, ty, tz = m[12:15]
+    return [r[0], r[1], r[2], 0.0,
+            r[3], r[4], r[5], 0.0,
+            r[6], r[7], r[8], 0.0,
+            -(tx * r[0] + ty * r[3] + tz * r[6]),
+            -(tx * r[1] + ty * r[4] + tz * r[7]),
+            -(tx * r[2] + ty * r[5] + tz * r[8]), 1.0]
+
+
+def transformPoints(points, m):
+    """Multiply a flat point array by a 4x4 matrix (points as row vectors, like Maya)."""
+    result = array('d', points)
+    for n in range(0, len(points), 3):
+        x, y, z = points[n:n + 3]
+        result[n] = x * m[0] + y * m[4] + z * m[8] + m[12]
+        result[n + 1] = x * m[1] + y * m[5] + z * m[9] + m[13]
+        result[n + 2] = x * m[2] + y * m[6] + z * m[10] + m[14]
+    return result
+
+
+def writeCurveFile(filePath, points):
+    """Save a flat point array to a JSON curve file."""
+    curveData = {
+        "pointList": pointsToList(points)
+    }
+    with open(filePath, 'w') as jsonFile:
+        json.dump(curveData, jsonFile, indent=4)
+
+
+def readCurveFile(filePath):
+    """Load a JSON curve file as a flat point array."""
+    with open(filePath, 'r') as jsonFile:
+        curveData = json.load(jsonFile)
+    return listToPoints(curveData.get("pointList", []))
+
+
+def hashPoints(points, tolerance=0.0):
+    """Return a hash of a flat point array and its CV count.
+
+    With a tolerance, values are quantized to multiples of it first, so changes
+    smaller than the tolerance keep the same hash.
+    """
+    if tolerance:
+        data = array('q', (round(value / tolerance) for value in points))
+    else:
+        data = array('d', points)
+    digest = hashlib.sha1(str(len(points) // 3).encode('ascii'))
+    digest.update(data.tobytes())
+    return digest.hexdigest()
+
+
+def getManifestPath(folderPath):
+    """Return the path of the export manifest stored next to an export folder."""
+    return os.path.normpath(folderPath) + "_manifest.json"
+
+
+def readManifest(folderPath, tolerance=0.0):
+    """Load the export manifest of a folder, or an empty one if it is missing or stale."""
+    manifestPath = getManifestPath(folderPath)
+    if os.path.exists(manifestPath):
+        try:
+            with open(manifestPath, 'r') as jsonFile:
+                manifest = json.load(jsonFile)
+            # Hashes made with another tolerance can't be compared
+            if manifest.get("tolerance") == tolerance:
+                return manifest
+        except ValueError:
+            print(f"Ignoring unreadable manifest {manifestPath}.")
+    return {"tolerance": tolerance, "curves": {}}
+
+
+def writeManifest(folderPath, manifest):
+    """Save the export manifest next to an export folder."""
+    with open(getManifestPath(folderPath), 'w') as jsonFile:
+        json.dump(manifest, jsonFile, indent=4, sort_keys=True)
+
+
+def exportCurves(nodes, folderPath, incremental=False, tolerance=0.0, workers=4):
+    """Export CV positions of the given curves to one JSON file per shape.
+
+    With incremental=True, curves whose hash matches the manifest from the last
+    export are skipped. Files are written by 'workers' threads while the next
+    curves are queried. Returns the names of the shapes that were written.
+    """
+    # Create the folder if it doesn't exist
+    if not os.path.exists(folderPath):
+        os.makedirs(folderPath)
+    manifest = readManifest(folderPath, tolerance) if incremental else None
+
+    written = []
+    with curveIO.FileWritePool(workers) as pool:
+        for node in nodes:
+            curveName = getCurveShape(node)
+            points = getCurvePoints(curveName)
+            filePath = os.path.join(folderPath, f"{curveName}.json")
+            if manifest is not None:
+                entry = {"hash": hashPoints(points, tolerance), "cvCount": len(points) // 3}
+                if manifest["curves"].get(curveName) == entry and os.path.exists(filePath):
+                    continue
+                manifest["curves"][curveName] = entry
+            pool.submit(writeCurveFile, filePath, points)
+            written.append(curveName)
+
+    if manifest is not None:
+        writeManifest(folderPath, manifest)
+    return written
+
+
+def exportCurvesToLibrary(nodes, filePath, precision='d'):
+    """Export CV positions of the given curves to a single binary library file."""
+    curves = {}
+    for node in nodes:
+        curveName = getCurveShape(node)
+        curves[curveName] = getCurvePoints(curveName)
+    curveLibrary.writeLibrary(filePath, curves, precision)
+
+
+def _applyCurvePoints(curveNames, loadPoints, workers=0, cvCounts=None):
+    """Set the CVs of curve shapes from loadPoints(curveName) as one undoable step."""
+    loaded = curveIO.prefetch(loadPoints, curveNames, workers)
+
+    cmds.undoInfo(openChunk=True, chunkName="importCurves")
+    cmds.refresh(suspend=True)
+    try:
+        for curveName, points, error in loaded:
+            try:
+                if error is not None:
+                    raise error
+                if points is None:
+                    continue
+                cvCount = cvCounts[curveName] if cvCounts else getCurveCVCount(curveName)
+                if len(points) // 3 != cvCount:
+                    print(f"Mismatch between number of CVs in {curveName} and points in the file.")
+                    continue
+                setCurvePoints(curveName, points)
+            except Exception as e:
+                print(f"An error occurred: {e}")
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+
+
+def applyCurves(nodes, loadPoints, workers=0):
+    """Set the CVs of the given curves from loadPoints(curveName) as one undoable step.
+
+    loadPoints returns a flat point array, or None to skip the curve. With
+    workers, loadPoints runs ahead on that many threads; it must not call Maya.
+    """
+    _applyCurvePoints([getCurveShape(node) for node in nodes], loadPoints, workers)
+
+
+def _folderLoader(folderPath):
+    def loadPoints(curveName):
+        filePath = os.path.join(folderPath, f"{curveName}.json")
+        if not os.path.exists(filePath):
+            print(f"File {filePath} not found.")
+            return None
+        return readCurveFile(filePath)
+    return loadPoints
+
+
+def _libraryLoader(library):
+    def loadPoints(curveName):
+        if curveName not in library:
+            print(f"Shape {curveName} not found in {library.filePath}.")
+            return None
+        return library.getPoints(curveName)
+    return loadPoints
+
+
+def importCurves(nodes, folderPath, workers=4):
+    """Import CV positions from JSON files onto the given curves as one undoable step.
+
+    Files are read by 'workers' threads while earlier curves are being set.
+    """
+    applyCurves(nodes, _folderLoader(folderPath), workers)
+
+
+def importCurvesFromLibrary(nodes, filePath):
+    """Import CV positions from a binary library onto the given curves as one undoable step."""
+    with curveLibrary.CurveLibrary(filePath) as library:
+        applyCurves(nodes, _libraryLoader(library))
+
+
+def transferCurves(nodes, loadPoints, patterns=None, mirror=None, resample=True, workers=0):
+    """Apply source shapes to the given curves as one undoable step, one setAttr per curve.
+
+    Each target's source shape name comes from curveRetarget.mapName(target, patterns)
+    and its points from loadPoints(sourceName), loaded once per source. They are
+    mirrored across the 'x', 'y' or 'z' axis if mirror is set, and resampled to the
+    target's CV count unless resample is off, then mismatched curves are skipped.
+    Shapes going onto periodic curves are resampled as closed loops. Targets no
+    pattern matches are skipped. With workers, loading and resampling run ahead
+    on threads.
+    """
+    sourceNames = {}
+    for node in nodes:
+        curveName = getCurveShape(node)
+        sourceName = curveRetarget.mapName(curveName, patterns)
+        if sourceName is None:
+            print(f"No pattern matches {curveName}, skipping it.")
+            continue
+        sourceNames[curveName] = sourceName
+    curveNames = list(sourceNames)
+    cvCounts = {curveName: getCurveCVCount(curveName) for curveName in curveNames}
+    periodic = {curveName: isCurvePeriodic(curveName) for curveName in curveNames}
+
+    @functools.lru_cache(maxsize=None)
+    def loadSource(sourceName):
+        points = loadPoints(sourceName)
+        if points is not None and mirror:
+            points = curveRetarget.mirrorPoints(points, mirror)
+        return points
+
+    @functools.lru_cache(maxsize=None)
+    def getSampler(sourceName, closed):
+        return curveRetarget.ShapeSampler(loadSource(sourceName), closed)
+
+    def loadTarget(curveName):
+        sourceName = sourceNames[curveName]
+        points = loadSource(sourceName)
+        if points is None or not resample or len(points) // 3 == cvCounts[curveName]:
+            return points
+        return getSampler(sourceName, periodic[curveName]).resample(cvCounts[curveName])
+
+    _applyCurvePoints(curveNames, loadTarget, workers, cvCounts)
+
+
+def transferCurvesFromFolder(nodes, folderPath, patterns=None, mirror=None, resample=True, workers=4):
+    """Transfer shapes from a JSON export folder, see transferCurves."""
+    transferCurves(nodes, _folderLoader(folderPath), patterns, mirror, resample, workers)
+
+
+def transferCurvesFromLibrary(nodes, filePath, patterns=None, mirror=None, resample=True, workers=0):
+    """Transfer shapes from a binary library, see transferCurves."""
+    with curveLibrary.CurveLibrary(filePath) as library:
+        transferCurves(nodes, _libraryLoader(library), patterns, mirror, resample, workers)
+
+
+def mirrorCurves(nodes, patterns=(('R_*', 'L_*'),), axis='x', resample=True):
+    """Give each curve the mirrored shape of the curve its name maps to, e.g. R_ from L_.
+
+    Every source is read before any curve is written, so both sides can be swapped in one call.
+    Curves whose source is missing are skipped, like the ones no pattern matches.
+    """
+    sources = {}
+    for node in nodes:
+        sourceName = curveRetarget.mapName(getCurveShape(node), patterns)
+        if sourceName is None or sourceName in sources:
+            continue
+        if not cmds.objExists(sourceName):
+            print(f"Shape {sourceName} not found.")
+            sources[sourceName] = None
+            continue
+        sources[sourceName] = getCurvePoints(sourceName)
+    transferCurves(nodes, sources.get, patterns, axis, resample)
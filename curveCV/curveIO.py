@@ -0,0 +1,87 @@
+# Thread pool for the file side of curve export and import.
+# Maya commands are not thread safe, so scene queries and edits stay on the main
+# thread. Only file reads, writes and JSON (de)serialization run on the workers,
+# which lets disk latency on network shares overlap with the Maya calls.
+# Both helpers keep a bounded number of jobs in flight, so memory stays flat
+# however many curves are processed.
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+_end = object()
+
+
+class FileWritePool(object):
+    """Run file writes on worker threads, blocking submit() when maxPending jobs are queued.
+
+    With workers=0 every write runs immediately on the calling thread.
+    """
+
+    def __init__(self, workers=4, maxPending=32):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='curveIO') if workers else None
+        self._slots = threading.BoundedSemaphore(maxPending)
+        self._futures = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, *args):
+        # Don't hide the error that is already propagating
+        self.close(raiseErrors=excType is None)
+
+    def submit(self, func, *args):
+        if self._executor is None:
+            func(*args)
+            return None
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._slots.release())
+        self._futures.append(future)
+        return future
+
+    def close(self, raiseErrors=True):
+        """Wait for all writes and raise the first error, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if raiseErrors:
+            for future in self._futures:
+                future.result()
+
+
+def prefetch(func, items, workers=4, window=32):
+    """Yield (item, result, error) for func(item) over items, in order.
+
+    Up to 'window' calls run ahead on worker threads while the caller handles
+    the results on its own thread. With workers=0 the calls run serially.
+    """
+    if not workers:
+        for item in items:
+            try:
+                result, error = func(item), None
+            except Exception as e:
+                result, error = None, e
+            yield item, result, error
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='curveIO') as executor:
+        pending = deque()
+        items = iter(items)
+        for item in items:
+            pending.append((item, executor.submit(func, item)))
+            if len(pending) >= window:
+                break
+        while pending:
+            item, future = pending.popleft()
+            nextItem = next(items, _end)
+            if nextItem is not _end:
+                pending.append((nextItem, executor.submit(func, nextItem)))
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+            yield item, result, error
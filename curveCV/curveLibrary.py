@@ -0,0 +1,150 @@
+# Single-file binary library of curve shapes.
+# The file starts with an index of shape names, CV counts and offsets, followed by
+# one contiguous block of little-endian float32 or float64 values. Loading
+# memory-maps the file and only converts the shapes that are asked for.
+# This module does not need Maya, so libraries can be built and converted offline.
+#
+# Layout:
+#     header   magic b'CVLB', version (uint16), precision ('f' or 'd'),
+#              shape count (uint32), data offset (uint64)
+#     index    per shape: name length (uint16), utf-8 name,
+#              CV count (uint32), first value offset in the data block (uint64)
+#     data     x0, y0, z0, x1, y1, z1, ... for every shape, back to back
+#
+# Usage:
+#     from curveCV import curveLibrary
+#     curveLibrary.jsonToLibrary('C:/path/to/_exportFolder', 'C:/path/to/controls.cvlib')
+#     with curveLibrary.CurveLibrary('C:/path/to/controls.cvlib') as library:
+#         points = library.getPoints('curveShape1')
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b'CVLB'
+VERSION = 1
+_headerStruct = struct.Struct('<4sHcIQ')
+_nameStruct = struct.Struct('<H')
+_entryStruct = struct.Struct('<IQ')
+
+
+def writeLibrary(filePath, curves, precision='d'):
+    """Write a dict of shape name -> flat point array to a binary library file."""
+    if precision not in ('f', 'd'):
+        raise ValueError("Precision must be 'f' (float32) or 'd' (float64).")
+
+    index = []
+    data = array(precision)
+    for name, points in curves.items():
+        index.append((name.encode('utf-8'), len(points) // 3, len(data)))
+        data.extend(array(precision, points))
+    if sys.byteorder != 'little':
+        data.byteswap()
+
+    indexSize = sum(_nameStruct.size + len(name) + _entryStruct.size for name, _, _ in index)
+    # Align the data block so it can be read in place as floats
+    dataOffset = _headerStruct.size + indexSize
+    dataOffset += -dataOffset % 8
+
+    with open(filePath, 'wb') as libraryFile:
+        libraryFile.write(_headerStruct.pack(MAGIC, VERSION, precision.encode('ascii'), len(index), dataOffset))
+        for name, cvCount, offset in index:
+            libraryFile.write(_nameStruct.pack(len(name)))
+            libraryFile.write(name)
+            libraryFile.write(_entryStruct.pack(cvCount, offset))
+        libraryFile.write(b'\0' * (dataOffset - _headerStruct.size - indexSize))
+        data.tofile(libraryFile)
+
+
+class CurveLibrary(object):
+    """Read-only, memory-mapped view of a binary curve library."""
+
+    def __init__(self, filePath):
+        self.filePath = filePath
+        self._file = open(filePath, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{filePath} is not a curve library.")
+        self.index = {}  # shape name -> (CV count, first value offset)
+        try:
+            self._readIndex()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _readIndex(self):
+        magic, version, precision, count, self._dataOffset = _headerStruct.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.filePath} is not a version {VERSION} curve library.")
+        self.precision = precision.decode('ascii')
+        self._itemSize = array(self.precision).itemsize
+        position = _headerStruct.size
+        for _ in range(count):
+            nameLength, = _nameStruct.unpack_from(self._map, position)
+            position += _nameStruct.size
+            name = self._map[position:position + nameLength].decode('utf-8')
+            position += nameLength
+            self.index[name] = _entryStruct.unpack_from(self._map, position)
+            position += _entryStruct.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self):
+        return list(self.index)
+
+    def cvCount(self, name):
+        return self.index[name][0]
+
+    def getPoints(self, name):
+        """Return the points of one shape as a flat array of doubles."""
+        cvCount, offset = self.index[name]
+        start = self._dataOffset + offset * self._itemSize
+        values = array(self.precision)
+        values.frombytes(self._map[start:start + cvCount * 3 * self._itemSize])
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values if self.precision == 'd' else array('d', values)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def jsonToLibrary(folderPath, filePath, precision='d'):
+    """Pack a folder of per-curve JSON exports into one binary library."""
+    curves = {}
+    for fileName in sorted(os.listdir(folderPath)):
+        if not fileName.endswith('.json'):
+            continue
+        with open(os.path.join(folderPath, fileName), 'r') as jsonFile:
+            pointList = json.load(jsonFile).get("pointList", [])
+        curves[fileName[:-len('.json')]] = [value for point in pointList for value in point[:3]]
+    writeLibrary(filePath, curves, precision)
+    return len(curves)
+
+
+def libraryToJson(filePath, folderPath):
+    """Unpack a binary library into one JSON file per shape, in the export layout."""
+    if not os.path.exists(folderPath):
+        os.makedirs(folderPath)
+    with CurveLibrary(filePath) as library:
+        for name in library.names():
+            points = library.getPoints(name)
+            curveData = {
+                "pointList": [list(points[i:i + 3]) for i in range(0, len(points), 3)]
+            }
+            with open(os.path.join(folderPath, f"{name}.json"), 'w') as jsonFile:
+                json.dump(curveData, jsonFile, indent=4)
+        return len(library.index)
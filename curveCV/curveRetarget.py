@@ -0,0 +1,111 @@
+# Point array transforms for applying library shapes to other curves.
+# Points are flat arrays of doubles (x0, y0, z0, x1, y1, z1, ...) like everywhere
+# in curveCV. Mirroring negates one world axis. Resampling spaces a new number of
+# CVs evenly along the arc length of the CV hull, in one pass over the points,
+# so a shape with any CV count can go onto a control with another count. A
+# ShapeSampler measures a shape once and resamples it to any number of counts.
+# Name patterns pick the source shape for each target, '*' matches any part of
+# a name and is carried over to the source name in order:
+#     ('R_*', 'L_*')           R_armShape takes the shape of L_armShape
+#     ('*_fk*', 'circleShape') every FK control takes circleShape
+# A name no pattern matches has no source. Without patterns, every name is its
+# own source.
+# This module does not need Maya.
+#
+# Usage:
+#     from curveCV import curveRetarget
+#     points = curveRetarget.mirrorPoints(points, 'x')
+#     points = curveRetarget.resamplePoints(points, 12)
+#     curveRetarget.mapName('R_armShape', [('R_*', 'L_*')])
+
+import functools
+import itertools
+import math
+import re
+from array import array
+
+_axes = {'x': 0, 'y': 1, 'z': 2}
+
+
+def mirrorPoints(points, axis='x', center=0.0):
+    """Return the points mirrored across the plane where axis equals center."""
+    offset = _axes[axis.lower()]
+    result = array('d', points)
+    result[offset::3] = array('d', (2.0 * center - value for value in points[offset::3]))
+    return result
+
+
+def arcLengths(points):
+    """Return the running length of the CV hull at each point, starting at 0."""
+    xs, ys, zs = points[0::3], points[1::3], points[2::3]
+    steps = (math.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2 + (z1 - z0) ** 2)
+             for x0, x1, y0, y1, z0, z1 in zip(xs, xs[1:], ys, ys[1:], zs, zs[1:]))
+    lengths = array('d', [0.0])
+    lengths.extend(itertools.accumulate(steps))
+    return lengths
+
+
+class ShapeSampler(object):
+    """Resample one shape to many CV counts, its arc lengths are measured once.
+
+    With closed=True the points are the unique CVs of a periodic curve, they
+    are resampled as a loop that runs from the last CV back to the first one.
+    """
+
+    def __init__(self, points, closed=False):
+        self.closed = closed
+        self.count = len(points) // 3
+        self.points = array('d', points)
+        if closed:
+            # The closing segment back to the first CV is part of the loop
+            self.points.extend(self.points[0:3])
+        self.lengths = arcLengths(self.points)
+
+    def resample(self, cvCount):
+        """Return cvCount points spaced evenly along the arc length of the CV hull."""
+        points, lengths, closed = self.points, self.lengths, self.closed
+        if cvCount < (3 if closed else 2):
+            raise ValueError(f"Can't resample to {cvCount} CVs.")
+        if cvCount == self.count:
+            return array('d', points[:cvCount * 3])
+        total = lengths[-1]
+        # A closed loop ends on its first CV, which is not sampled twice
+        steps = cvCount if closed else cvCount - 1
+        result = array('d')
+        segment = 1
+        for i in range(cvCount):
+            target = total * i / steps
+            while segment < len(lengths) - 1 and lengths[segment] < target:
+                segment += 1
+            span = lengths[segment] - lengths[segment - 1]
+            u = (target - lengths[segment - 1]) / span if span > 0.0 else 0.0
+            a, b = (segment - 1) * 3, segment * 3
+            result.extend((points[a] + (points[b] - points[a]) * u, points[a + 1] + (points[b + 1] - points[a + 1]) * u,
+                           points[a + 2] + (points[b + 2] - points[a + 2]) * u))
+        return result
+
+
+def resamplePoints(points, cvCount, closed=False):
+    """Return cvCount points spaced evenly along the arc length of the CV hull of points, see ShapeSampler."""
+    return ShapeSampler(points, closed).resample(cvCount)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern):
+    return re.compile('^' + '(.*)'.join(re.escape(part) for part in pattern.split('*')) + '$')
+
+
+def mapName(name, patterns=None):
+    """Return the source shape name for a target name, None when no pattern matches.
+
+    Without patterns the name itself is returned.
+    """
+    if not patterns:
+        return name
+    for targetPattern, sourcePattern in patterns:
+        match = _compile(targetPattern).match(name)
+        if match:
+            parts = sourcePattern.split('*')
+            groups = list(match.groups()) + [''] * len(parts)
+            return parts[0] + ''.join(group + part for group, part in zip(groups, parts[1:]))
+    return None
@@ -0,0 +1,36 @@
+# Entry points for every tool in the collection, for shelf buttons and scripts.
+# Importing this module only loads the standard library. A tool, and PySide2,
+# OpenMayaUI or anything else it needs, is imported the first time its entry
+# point is called, so loading a shelf or a batch job that imports this costs
+# nothing until a tool is actually opened.
+#
+# Usage, e.g. as a shelf button:
+#     import mayaUtils
+#     mayaUtils.bakeAnimationTool()
+
+import importlib
+
+
+def bakeAnimationTool():
+    importlib.import_module('bakeAnimationTool').run()
+
+
+def createBoundingBox():
+    importlib.import_module('createBoundingBox').UI()
+
+
+def overrideColor():
+    importlib.import_module('overrideColor').xxoverrideColorxx()
+
+
+def reorderAttribute():
+    importlib.import_module('reorderAttribute.reorderAttribute').reorderAttrUi()
+
+
+def quoteGenerator():
+    quoteGen = importlib.import_module('quoteGen.quoteGen')
+    quoteGen.QuoteWindow(quoteGen.QuoteGenerator()).create_ui()
+
+
+def simpleSlider():
+    importlib.import_module('simpleSliderUI_PySide').show()
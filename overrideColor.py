@@ -1,7 +1,18 @@
 # Title: overrideColor.py
 # DATE: 20/11/2018
-# VERSION: 0.2 
+# VERSION: 0.3
 # DESCRIPTION: Use this Tool to assign/override color to the selected curve
+# Colors can be an index or RGB. setOverrideColor() colors any list of nodes in one
+# pass and one undo step, with one setAttr per attribute. skipUnchanged=True reads
+# every value first and leaves nodes that already have the color alone:
+#     setOverrideColor(cmds.ls('*_ctrl'), 6)
+#     setOverrideColor(cmds.ls('*_ctrl'), (1.0, 0.5, 0.0), shapes=True, skipUnchanged=True)
+# recolor() finds nodes by name pattern, hierarchy or set, without touching the
+# selection, and colors them by naming rules. dryRun=True only reports:
+#     recolor([('^L_', 6), ('^R_', 13), ('^C_', 17)], roots=['rig'], dryRun=True)
+
+import re
+import time
 
 import maya.cmds as cmds
 
@@ -27,35 +38,165 @@ def xxoverrideColorxx():
     ]
 
     for i, color in enumerate(colors):
-        cmds.button(l="", bgc=color, c="overrideColor({})".format(i + 1))
+        cmds.button(l="", bgc=color, c=lambda *args, colorNumber=i + 1: overrideColor(colorNumber))
 
     cmds.setParent("..")
     cmds.columnLayout(columnAttach=('both', 10), columnWidth=280)
-    cmds.button(l="Disable x Overrides", c="overrideDisabled()")
+    cmds.button(l="RGB Color...", c=lambda *args: overrideColorRGB())
+    cmds.button(l="Disable x Overrides", c=lambda *args: overrideDisabled())
     cmds.showWindow()
 
 
+# Return the nodes that get the override, the given nodes or their shapes
+def getOverrideTargets(nodes, shapes=False):
+    if not nodes:
+        return []
+    if shapes:
+        return cmds.listRelatives(nodes, shapes=True, fullPath=True) or []
+    return cmds.ls(nodes, long=True)
+
+
+# Attribute values for a color, an index (1-31) or an (r, g, b) tuple from 0 to 1
+def getOverrideValues(color):
+    if isinstance(color, int):
+        return [("overrideEnabled", True), ("overrideRGBColors", False), ("overrideColor", color)]
+    return [("overrideEnabled", True), ("overrideRGBColors", True), ("overrideColorRGB", tuple(color))]
+
+
+def _sameValue(current, value):
+    if isinstance(value, tuple):
+        return all(abs(a - b) < 1e-4 for a, b in zip(current[0], value))
+    return current == value
+
+
+# Set override attributes in one pass and one undo step, targets is a list of (node, values).
+# Values are set without reading them first, except overrideRGBColors, which is only written
+# when a node switches between index and RGB colors. With skipUnchanged every value is read
+# and the ones that are already set are skipped, dryRun only counts them.
+# Returns the number of nodes that changed, or would change.
+def _applyTargets(targets, dryRun=False, skipUnchanged=False):
+    changed = 0
+    if not dryRun:
+        cmds.undoInfo(openChunk=True, chunkName="overrideColor")
+    try:
+        for node, values in targets:
+            nodeChanged = False
+            for attr, value in values:
+                plug = node + "." + attr
+                if (dryRun or skipUnchanged or attr == "overrideRGBColors") and \
+                        _sameValue(cmds.getAttr(plug), value):
+                    continue
+                nodeChanged = True
+                if dryRun:
+                    break
+                if isinstance(value, tuple):
+                    cmds.setAttr(plug, *value)
+                else:
+                    cmds.setAttr(plug, value)
+            changed += nodeChanged
+    finally:
+        if not dryRun:
+            cmds.undoInfo(closeChunk=True)
+    return changed
+
+
+# Set the same override attributes on many nodes. Returns the number of nodes that changed.
+def applyOverrides(nodes, values, shapes=False, skipUnchanged=False):
+    return _applyTargets([(node, values) for node in getOverrideTargets(nodes, shapes)], skipUnchanged=skipUnchanged)
+
+
+# Resolve nodes from name patterns, hierarchy roots and sets, one query for each kind.
+# Roots give themselves and all their descendants of nodeType.
+def findNodes(patterns=None, roots=None, sets=None, nodeType='transform'):
+    nodes = []
+    if patterns:
+        nodes += cmds.ls(patterns, type=nodeType, long=True) or []
+    if roots:
+        nodes += cmds.ls(roots, type=nodeType, long=True) or []
+        nodes += cmds.listRelatives(roots, allDescendents=True, type=nodeType, fullPath=True) or []
+    if sets:
+        nodes += cmds.ls(cmds.sets(sets, query=True) or [], type=nodeType, long=True) or []
+    return list(dict.fromkeys(nodes))
+
+
+# Return the first (regex, color) rule whose regex is found in the short name of node, or None
+def matchColorRule(node, rules):
+    shortName = node.rsplit('|', 1)[-1].rsplit(':', 1)[-1]
+    for rule in rules:
+        if re.search(rule[0], shortName):
+            return rule
+    return None
+
+
+# Color nodes found by pattern, hierarchy or set with naming rules, in one pass and one undo step.
+# rules is a list of (regex, color), the first rule found in a node's short name gives its color
+# and nodes without a match are left alone. dryRun reports without changing the scene, and
+# skipUnchanged leaves nodes that already have their color alone.
+# Returns a report with the node count, matches per rule, changed nodes and seconds.
+def recolor(rules, patterns=None, roots=None, sets=None, shapes=False, dryRun=False, skipUnchanged=False):
+    start = time.perf_counter()
+    nodes = findNodes(patterns, roots, sets)
+    matched = dict.fromkeys([token for token, _ in rules], 0)
+    colors = {}
+    for node in nodes:
+        rule = matchColorRule(node, rules)
+        if rule:
+            matched[rule[0]] += 1
+            colors[node] = rule[1]
+
+    targets = []
+    if shapes and colors:
+        # Shapes take the color of their transform, resolved with one query
+        for shape in cmds.listRelatives(list(colors), shapes=True, fullPath=True) or []:
+            targets.append((shape, getOverrideValues(colors[shape.rsplit('|', 1)[0]])))
+    else:
+        targets = [(node, getOverrideValues(color)) for node, color in colors.items()]
+
+    report = {
+        "nodes": len(nodes),
+        "matched": matched,
+        "changed": _applyTargets(targets, dryRun, skipUnchanged),
+        "dryRun": dryRun,
+        "seconds": time.perf_counter() - start
+    }
+    print("{} {} of {} nodes in {:.3f}s, matches: {}".format(
+        "Would recolor" if dryRun else "Recolored", report["changed"], report["nodes"], report["seconds"],
+        ", ".join("{} {}".format(token, count) for token, count in matched.items())))
+    return report
+
+
+# Enable the override and set an index or RGB color on many nodes
+def setOverrideColor(nodes, color, shapes=False, skipUnchanged=False):
+    return applyOverrides(nodes, getOverrideValues(color), shapes, skipUnchanged)
+
+
+# Turn the override off on many nodes
+def disableOverrides(nodes, shapes=False, skipUnchanged=False):
+    return applyOverrides(nodes, [("overrideEnabled", False)], shapes, skipUnchanged)
+
+
 # Disable overrides
 def overrideDisabled():
-    sel = cmds.ls(sl=True)
-    for obj in sel:
-        cmds.setAttr(obj + ".overrideEnabled", 0)
+    disableOverrides(cmds.ls(sl=True))
 
 
 # Enable overrides
 def overrideEnabled():
-    sel = cmds.ls(sl=True)
-    for obj in sel:
-        cmds.setAttr(obj + ".overrideEnabled", 1)
+    applyOverrides(cmds.ls(sl=True), [("overrideEnabled", True)])
 
 
 # Apply override color
 def overrideColor(colorNumber):
-    sel = cmds.ls(sl=True)
-    overrideEnabled()
-    for obj in sel:
-        cmds.setAttr(obj + ".overrideColor", colorNumber)
+    setOverrideColor(cmds.ls(sl=True), colorNumber)
+
+
+# Pick an RGB color and apply it
+def overrideColorRGB():
+    cmds.colorEditor()
+    if cmds.colorEditor(query=True, result=True):
+        setOverrideColor(cmds.ls(sl=True), tuple(cmds.colorEditor(query=True, rgb=True)))
 
 
 # Run the script
-xxoverrideColorxx()
+if __name__ == "__main__":
+    xxoverrideColorxx()
@@ -6,24 +6,119 @@ I created it when I was learning Python as a fun project.
 
 1. Place the 'quoteGen' folder in your Maya scripts directory(e.g., C:/Users/your_username/Documents/maya/scripts/).
 2. In Maya's script editor, python tab run the following commands:
-    quoteGen import quoteGen
+    from quoteGen import quoteGen
     quoteGen.QuoteWindow(quoteGen.QuoteGenerator()).create_ui()
+
+Quotes are not loaded up front. An index of line offsets is built on first use and
+saved next to the quotes file as 'quotes.txt.idx', it is rebuilt when the quotes file
+changes. Each quote is then read on its own from a memory map, so a big quote file
+costs neither startup time nor memory.
 """
 
+import mmap
+import os
 import random
+import struct
+import sys
+from array import array
+from itertools import accumulate
+
 import maya.cmds as cmds
-import os
 
-file_path = os.path.join(os.path.dirname(__file__), 'quotes.txt')
+INDEX_MAGIC = b'QIX2'  # 'QIDX' files had no entry count
+_index_header = struct.Struct('<4sQQQ')  # magic, quotes file mtime in ns, quotes file size, offset count
+
+
+def get_quotes_path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quotes.txt')
+
+
+def build_index(file_path):
+    """Return the byte offset of every line start plus the file size, as an array."""
+    offsets = array('Q', [0])
+    with open(file_path, 'rb') as file:
+        # Not accumulate(initial=0), which needs Python 3.8 and Maya 2022 has 3.7
+        offsets.extend(accumulate(len(line) for line in file))
+    return offsets
+
+
+def load_index(file_path):
+    """Return the line offsets of file_path, from the '.idx' file next to it while it is up to date.
+
+    The index is rebuilt and saved when the quotes file changed size or modification time,
+    or when the '.idx' file is not whole. It is written to a temporary file and swapped in,
+    so another session never reads it half written.
+    """
+    stat = os.stat(file_path)
+    index_path = file_path + '.idx'
+    try:
+        with open(index_path, 'rb') as index_file:
+            magic, mtime, size, count = _index_header.unpack(index_file.read(_index_header.size))
+            if magic == INDEX_MAGIC and mtime == stat.st_mtime_ns and size == stat.st_size:
+                offsets = array('Q')
+                offsets.frombytes(index_file.read())
+                if sys.byteorder != 'little':
+                    offsets.byteswap()
+                if len(offsets) == count:
+                    return offsets
+    except (OSError, struct.error, ValueError):
+        pass
+
+    offsets = build_index(file_path)
+    data = array('Q', offsets)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as index_file:
+            index_file.write(_index_header.pack(INDEX_MAGIC, stat.st_mtime_ns, stat.st_size, len(data)))
+            data.tofile(index_file)
+        os.replace(temp_path, index_path)
+    except OSError:
+        # A read-only folder only costs rebuilding the index next time
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return offsets
+
 
 class QuoteGenerator:
-    def __init__(self):
-        # Load quotes from the file
-        with open(file_path, 'r', encoding='utf-8') as file:
-            self.quotes = [line.strip() for line in file.readlines()]
+    def __init__(self, file_path=None):
+        # Nothing is read until the first quote is asked for
+        self.file_path = file_path or get_quotes_path()
+        self._offsets = None
+        self._map = None
+        self._stat = None
+
+    def _open(self):
+        stat = os.stat(self.file_path)
+        if self._offsets is not None and self._stat == (stat.st_mtime_ns, stat.st_size):
+            return
+        self.close()
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        self._offsets = load_index(self.file_path)
+        if stat.st_size:
+            with open(self.file_path, 'rb') as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        self._open()
+        return len(self._offsets) - 1
+
+    def get_quote(self, number):
+        """Return quote 'number', reading only its line."""
+        self._open()
+        return self._map[self._offsets[number]:self._offsets[number + 1]].decode('utf-8').strip()
 
     def get_random_quote(self):
-        return random.choice(self.quotes)
+        count = len(self)
+        return self.get_quote(random.randrange(count)) if count else ''
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._offsets = None
+
 
 class QuoteWindow:
     def __init__(self, quote_generator):
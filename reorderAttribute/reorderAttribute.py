@@ -1,20 +1,23 @@
 # Creates a window in Maya for reordering user-defined attributes.
-# Allows users to move these attributes up or down.
+# Allows users to move these attributes up, down, to the top or bottom, or sort them.
+# Attribute orders can be saved as templates and applied to many objects at once.
 # Works with attributes visible in the channel box.
 
-import pymel.core as pm
+import maya.cmds as cmds
+
+from reorderAttribute import reorderEngine
 
 
 def reorderAttrUi():
     # Check if the window exists and delete it if so
-    if pm.window('_ReorderAttrWindow', query=True, exists=True):
-        pm.deleteUI('_ReorderAttrWindow', window=True)
+    if cmds.window('_ReorderAttrWindow', query=True, exists=True):
+        cmds.deleteUI('_ReorderAttrWindow', window=True)
 
     # Create the main window for reordering attributes
-    reorderAttrWin = pm.window(
+    reorderAttrWin = cmds.window(
         '_ReorderAttrWindow',
         title="Reorder Attribute",
-        widthHeight=(200, 125),
+        widthHeight=(200, 320),
         menuBar=False, sizeable=False,
         minimizeButton=False,
         maximizeButton=False,
@@ -23,86 +26,123 @@ def reorderAttrUi():
     )
 
     # Layout for the buttons
-    pm.columnLayout('reorderAttrLayout', columnAttach=("both", 50))
-    pm.separator(style='none', h=7)
+    cmds.columnLayout('reorderAttrLayout', columnAttach=("both", 50))
+    cmds.separator(style='none', h=7)
 
     # Button to move attributes up
-    pm.button(label='UP UP UP', w=100, h=50, command=moveAttrUp)
-    pm.separator(style='in', h=5, w=100)
+    cmds.button(label='UP UP UP', w=100, h=50, command=moveAttrUp)
+    cmds.separator(style='in', h=5, w=100)
 
     # Button to move attributes down
-    pm.button(label='down down', w=100, h=50, command=moveAttrDown)
+    cmds.button(label='down down', w=100, h=50, command=moveAttrDown)
+    cmds.separator(style='in', h=5, w=100)
+
+    # Buttons to move attributes to the top or bottom and to sort them
+    cmds.button(label='Top', w=100, h=25, command=moveAttrTop)
+    cmds.button(label='Bottom', w=100, h=25, command=moveAttrBottom)
+    cmds.button(label='Sort A-Z', w=100, h=25, command=sortAttrs)
+    cmds.separator(style='in', h=5, w=100)
+
+    # Buttons to save the order of the first object and apply it to all selected objects
+    cmds.button(label='Save Order...', w=100, h=25, command=saveOrder)
+    cmds.button(label='Apply Order...', w=100, h=25, command=applyOrder)
 
     # Show the window
-    pm.showWindow(reorderAttrWin)
+    cmds.showWindow(reorderAttrWin)
 
 
 def moveAttrUp(*args):
-    # Move the selected attribute up
+    # Move the selected attributes up
     moveAttr(1)
 
 
 def moveAttrDown(*args):
-    # Move the selected attribute down
+    # Move the selected attributes down
     moveAttr(0)
 
 
+def moveAttrTop(*args):
+    # Move the selected attributes to the top
+    moveAttr(2)
+
+
+def moveAttrBottom(*args):
+    # Move the selected attributes to the bottom
+    moveAttr(3)
+
+
+def sortAttrs(*args):
+    # Sort all user-defined attributes alphabetically
+    moveAttr(4)
+
+
+def getTargetOrder(mode, order, attrList):
+    # Build the new attribute order for a mode, see reorderEngine.py
+    if mode == 0:
+        return reorderEngine.moveDown(order, attrList)
+    if mode == 1:
+        return reorderEngine.moveUp(order, attrList)
+    if mode == 2:
+        return reorderEngine.moveToTop(order, attrList)
+    if mode == 3:
+        return reorderEngine.moveToBottom(order, attrList)
+    return reorderEngine.sortAlphabetically(order)
+
+
 def moveAttr(mode, *args):
-    pm.scriptEditorInfo(suppressInfo=False)  # Enable script editor info
-    objList = pm.channelBox('mainChannelBox', query=True, mainObjectList=True)  # Get selected objects
-
-    if objList:
-        attrList = pm.channelBox('mainChannelBox', query=True, selectedMainAttributes=True)  # Get selected attributes
-
-        if attrList:
-            for obj in objList:
-                userDefAttrList = pm.listAttr(obj, userDefined=True)  # List user-defined attributes
-
-                if userDefAttrList and attrList[0] in userDefAttrList:
-                    pm.scriptEditorInfo(suppressInfo=True)
-                    lockAttrList = pm.listAttr(obj, userDefined=True, locked=True)  # Check for locked attributes
-
-                    # Unlock attributes if they are locked
-                    if lockAttrList:
-                        for lockAttr in lockAttrList:
-                            pm.setAttr(obj + "." + lockAttr, lock=False)
-
-                    # Handle moving attributes down
-                    if mode == 0:
-                        sortedList = attrList[::-1] if len(attrList) > 1 else attrList
-                        for i in sortedList:
-                            attrLs = pm.listAttr(obj, userDefined=True)
-                            attrPos = attrLs.index(i)
-                            pm.deleteAttr(obj, at=attrLs[attrPos])  # Delete the selected attribute
-                            pm.undo()
-                            for x in range(attrPos + 2, len(attrLs), 1):
-                                pm.deleteAttr(obj, at=attrLs[x])  # Delete subsequent attributes
-                                pm.undo()
-                    # Handle moving attributes up
-                    elif mode == 1:
-                        for i in attrList:
-                            attrLs = pm.listAttr(obj, userDefined=True)
-                            attrPos = attrLs.index(i)
-                            if attrPos > 0:
-                                pm.deleteAttr(obj, at=attrLs[attrPos - 1])  # Delete the previous attribute
-                                pm.undo()
-                                for x in range(attrPos + 1, len(attrLs), 1):
-                                    pm.deleteAttr(obj, at=attrLs[x])  # Delete subsequent attributes
-                                    pm.undo()
-
-                    # Relock attributes if they were originally locked
-                    if lockAttrList:
-                        for lockAttr in lockAttrList:
-                            pm.setAttr(obj + "." + lockAttr, lock=True)
-                else:
-                    pm.warning('Selected attribute cannot be moved.')
-        else:
-            pm.warning('Please select one or more attributes.')
-    else:
-        pm.warning('Please select one or more transform nodes.')
-
-    pm.scriptEditorInfo(suppressInfo=True)
+    objList = cmds.channelBox('mainChannelBox', query=True, mainObjectList=True)  # Get selected objects
+    if not objList:
+        cmds.warning('Please select one or more transform nodes.')
+        return
+
+    attrList = cmds.channelBox('mainChannelBox', query=True, selectedMainAttributes=True) or []  # Get selected attributes
+    if not attrList and mode != 4:
+        cmds.warning('Please select one or more attributes.')
+        return
+
+    orders = {}
+    for obj in objList:
+        order = reorderEngine.getAttrOrder(obj)  # List user-defined attributes
+        if mode != 4 and attrList[0] not in order:
+            cmds.warning('Selected attribute cannot be moved.')
+            continue
+        orders[obj] = getTargetOrder(mode, order, attrList)
+    runReorder(orders)
+
+
+def runReorder(orders):
+    # One delete and undo per attribute that actually changes place
+    suppressInfo = cmds.scriptEditorInfo(query=True, suppressInfo=True)
+    cmds.scriptEditorInfo(suppressInfo=True)  # Hide the delete and undo messages
+    try:
+        reorderEngine.applyOrders(orders)
+    finally:
+        cmds.scriptEditorInfo(suppressInfo=suppressInfo)
+
+
+def saveOrder(*args):
+    # Save the attribute order of the first selected object as a template
+    objList = cmds.channelBox('mainChannelBox', query=True, mainObjectList=True)
+    if not objList:
+        cmds.warning('Please select a transform node.')
+        return
+    filePath = cmds.fileDialog2(fileFilter="Attribute Order (*.json)", dialogStyle=2, fileMode=0)
+    if filePath:
+        reorderEngine.saveTemplate(filePath[0], reorderEngine.getAttrOrder(objList[0]))
+
+
+def applyOrder(*args):
+    # Apply a saved attribute order template to every selected object
+    objList = cmds.channelBox('mainChannelBox', query=True, mainObjectList=True)
+    if not objList:
+        cmds.warning('Please select one or more transform nodes.')
+        return
+    filePath = cmds.fileDialog2(fileFilter="Attribute Order (*.json)", dialogStyle=2, fileMode=1)
+    if filePath:
+        template = reorderEngine.loadTemplate(filePath[0])
+        runReorder({obj: template for obj in objList})
 
 
 # Execute the UI function
-reorderAttrUi()
+if __name__ == "__main__":
+    reorderAttrUi()
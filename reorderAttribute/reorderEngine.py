@@ -0,0 +1,149 @@
+# Attribute reorder engine behind reorderAttribute.py.
+# Maya lists user-defined attributes in creation order, and deleting an attribute
+# then undoing the delete re-creates it at the end of that list. To reach a target
+# order, the longest head of the target that is already in order stays where it is
+# and every other attribute is sent to the end once, in target order. The plan is
+# computed in one pass and costs one delete and undo per moved attribute.
+#
+# Usage:
+#     from reorderAttribute import reorderEngine
+#     order = reorderEngine.getAttrOrder('ctrl')
+#     reorderEngine.applyOrder('ctrl', reorderEngine.moveToTop(order, ['ikFk']))
+#     reorderEngine.applyOrder('ctrl', sorted(order))
+#
+# Batch use, one saved order template applied to many controls:
+#     reorderEngine.saveTemplate('C:/path/to/armCtrl.json', reorderEngine.getAttrOrder('L_arm_ctrl'))
+#     previous = reorderEngine.applyTemplate(cmds.ls('*_arm_ctrl'), reorderEngine.loadTemplate('C:/path/to/armCtrl.json'))
+#     reorderEngine.applyOrders(previous)  # puts the old orders back
+
+import json
+
+import maya.cmds as cmds
+
+
+def normalizeOrder(current, target):
+    """Return target limited to the current attributes, followed by the ones it leaves out."""
+    existing = set(current)
+    ordered = [attr for attr in dict.fromkeys(target) if attr in existing]
+    listed = set(ordered)
+    return ordered + [attr for attr in current if attr not in listed]
+
+
+def planMoves(current, target):
+    """Return the attributes to send to the end, in order, to turn current into target."""
+    target = normalizeOrder(current, target)
+    kept = 0
+    for attr in current:
+        if kept < len(target) and attr == target[kept]:
+            kept += 1
+    return target[kept:]
+
+
+def moveUp(order, selected):
+    """Move every selected attribute one step up, selected neighbours move together."""
+    order = list(order)
+    selected = set(selected)
+    for i in range(1, len(order)):
+        if order[i] in selected and order[i - 1] not in selected:
+            order[i - 1], order[i] = order[i], order[i - 1]
+    return order
+
+
+def moveDown(order, selected):
+    """Move every selected attribute one step down, selected neighbours move together."""
+    return moveUp(order[::-1], selected)[::-1]
+
+
+def moveToTop(order, selected):
+    selected = set(selected)
+    return [attr for attr in order if attr in selected] + [attr for attr in order if attr not in selected]
+
+
+def moveToBottom(order, selected):
+    selected = set(selected)
+    return [attr for attr in order if attr not in selected] + [attr for attr in order if attr in selected]
+
+
+def sortAlphabetically(order, reverse=False):
+    return sorted(order, key=str.lower, reverse=reverse)
+
+
+def getAttrOrder(node):
+    """Return the user-defined attributes of node in their current order."""
+    return cmds.listAttr(node, userDefined=True) or []
+
+
+def saveTemplate(filePath, order):
+    """Save an attribute order as a JSON list of names."""
+    with open(filePath, 'w') as jsonFile:
+        json.dump(list(order), jsonFile, indent=4)
+
+
+def loadTemplate(filePath):
+    with open(filePath, 'r') as jsonFile:
+        return json.load(jsonFile)
+
+
+def _checkUndo():
+    if not cmds.undoInfo(query=True, state=True):
+        raise RuntimeError("Reordering attributes needs undo to be enabled.")
+
+
+def _setLocks(plugs, lock):
+    """Lock or unlock plugs without recording it, the reorder itself can't be undone either."""
+    if not plugs:
+        return
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        for plug in plugs:
+            cmds.setAttr(plug, lock=lock)
+    finally:
+        cmds.undoInfo(stateWithoutFlush=True)
+
+
+def _moveToEnd(node, moves):
+    for attr in moves:
+        cmds.deleteAttr(node, attribute=attr)
+        cmds.undo()
+
+
+def applyOrder(node, target, current=None):
+    """Reorder the user-defined attributes of node to match target.
+
+    Attributes missing from target keep their relative order after the listed ones.
+    Locked attributes are unlocked while they move and locked again after.
+    Returns the number of attributes that were moved.
+    """
+    if current is None:
+        current = getAttrOrder(node)
+    moves = planMoves(current, target)
+    if not moves:
+        return 0
+    _checkUndo()
+
+    locked = [f"{node}.{attr}" for attr in cmds.listAttr(node, userDefined=True, locked=True) or [] if attr in moves]
+    _setLocks(locked, False)
+    try:
+        _moveToEnd(node, moves)
+    finally:
+        _setLocks(locked, True)
+    return len(moves)
+
+
+def applyOrders(orders):
+    """Reorder many nodes, orders is a {node: target order} dict, one applyOrder() per node.
+
+    Returns {node: previous order} for the nodes that changed, which applyOrders()
+    takes back to restore them.
+    """
+    previous = {}
+    for node, target in orders.items():
+        current = getAttrOrder(node)
+        if applyOrder(node, target, current):
+            previous[node] = current
+    return previous
+
+
+def applyTemplate(nodes, template):
+    """Apply one attribute order to every node, see applyOrders()."""
+    return applyOrders({node: template for node in nodes})
@@ -21,8 +21,8 @@ def mayaMainWindow():
 
 class SliderUI(QtWidgets.QDialog):
 
-    def __init__(self, parent=mayaMainWindow()):
-        super(SliderUI, self).__init__(parent)
+    def __init__(self, parent=None):
+        super(SliderUI, self).__init__(parent or mayaMainWindow())
         self.setWindowTitle("Slider UI")
 
         # Define slider values
@@ -100,7 +100,11 @@ class SliderUI(QtWidgets.QDialog):
         value = self.sliderA.value()
         print(f"Selected Value: {value}")
 
-if __name__ == "__main__":
+def show():
+    """
+    Opens the slider window, replacing one that is already open.
+    """
+    global sliderUI
     try:
         sliderUI.close()
         sliderUI.deleteLater()
@@ -109,3 +113,7 @@ if __name__ == "__main__":
 
     sliderUI = SliderUI()
     sliderUI.show()
+
+
+if __name__ == "__main__":
+    show()